@@ -188,18 +188,18 @@ class StoryboardAgent:
         # Background
         prompt_parts.extend([
             "BACKGROUND:",
-            f"- Setting: {scene.background_setting.value}",
-            f"- {self._get_background_atmosphere(scene.background_setting.value)}",
+            f"- Setting: {scene.background_setting}",
+            f"- {self._get_background_atmosphere(scene.background_setting)}",
             "",
         ])
 
         # Product visibility
-        if scene.product_visibility.value != "none":
+        if scene.product_visibility != "none":
             prompt_parts.extend([
                 "PRODUCT:",
-                f"- Visibility: {scene.product_visibility.value} prominence",
+                f"- Visibility: {scene.product_visibility} prominence",
                 f"- Product naturally positioned in frame",
-                f"- {self._get_product_placement_note(scene.product_visibility.value)}",
+                f"- {self._get_product_placement_note(scene.product_visibility)}",
                 "",
             ])
 
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     GCS_PROJECT_ID: str = "ugcgen-project"
     GCS_CREDENTIALS_PATH: str | None = None
 
+    # Video generation: scenes rendered at once per job
+    VIDEO_CONCURRENCY: int = 4
+
     # Consistency scoring
     CONSISTENCY_MODEL: str = "gemini-2.5-flash"
     CONSISTENCY_THRESHOLD: float = 0.75
@@ -23,6 +26,9 @@ class Settings(BaseSettings):
     # Local storage fallback
     LOCAL_STORAGE_ROOT: str = "frontend/public/uploads"
 
+    # Finished Product Studio jobs are moved out of memory into this sqlite file
+    PRODUCT_STUDIO_ARCHIVE_PATH: str = "data/product_studio_jobs.sqlite3"
+
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
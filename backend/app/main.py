@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.routers import health, generation, jobs, avatars, copilot, storyboard, video, mass_generator, editor, perfume, product_studio
+from app.utils.http_client import close_http_client
 from app.utils.redis_client import get_redis, close_redis
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.middleware.rate_limiter import RateLimitMiddleware
@@ -38,9 +39,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Redis connection established")
     except Exception:
         logger.warning("Redis not available -- running in degraded mode")
+    from app.pipelines.product_studio_pipeline import load_archived_summaries
+    await load_archived_summaries()
     yield
     # Shutdown
+    from app.pipelines.product_studio_pipeline import shutdown_jobs
+    await shutdown_jobs()
     await close_redis()
+    await close_http_client()
     logger.info("Backend shutdown complete")
 
 
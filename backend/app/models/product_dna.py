@@ -26,7 +26,7 @@ class ProductDNA(BaseModel):
     # Visual characteristics
     colors: ProductColors = Field(description="Color palette of the product")
     shape: str = Field(description="Physical form: bottle, box, tube, jar, etc.")
-    materials: list[str] = Field(default_factory=list, description="Materials: glass, plastic, metal, etc.")
+    materials: tuple[str, ...] = Field(default=(), description="Materials: glass, plastic, metal, etc.")
     texture: str | None = Field(default=None, description="Surface texture: matte, glossy, frosted, etc.")
 
     # Branding elements (for consistency, NOT for generation)
@@ -38,8 +38,8 @@ class ProductDNA(BaseModel):
     proportions: str | None = Field(default=None, description="tall/short, wide/narrow, etc.")
 
     # Key visual features for generation
-    distinctive_features: list[str] = Field(
-        default_factory=list,
+    distinctive_features: tuple[str, ...] = Field(
+        default=(),
         description="Unique visual elements that must be preserved"
     )
 
@@ -60,6 +60,16 @@ class ProductDNA(BaseModel):
         description="Things that should NOT change: color shifts, text alterations, etc."
     )
 
+    @property
+    def materials_csv(self) -> str:
+        """Materials joined for prompt injection."""
+        return ", ".join(self.materials)
+
+    @property
+    def features_csv(self) -> str:
+        """Distinctive features joined for prompt injection."""
+        return ", ".join(self.distinctive_features)
+
 
 class ProductAnalysisRequest(BaseModel):
     """Request to analyze product images."""
@@ -5,14 +5,54 @@ as the immutable source of truth for all subsequent generations (script,
 storyboard, audio, video).
 """
 
-from enum import Enum
-from pydantic import BaseModel, Field
+import sys
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Literal, Self
 
-from app.models.product_dna import ProductDNA
-from app.models.schemas import AvatarDNA
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, model_validator
 
+from app.models.product_dna import ProductColors, ProductDNA
+from app.models.schemas import AvatarDNA
 
-class Platform(str, Enum):
+# Section separator used in the master prompt
+_SEP = sys.intern("=" * 60)
+
+# Section headers shared by every rendered master prompt
+_HDR_PRODUCT = sys.intern("\n## PRODUCT DNA\n")
+_HDR_STYLE = sys.intern("\n## STYLE GUIDE\n")
+_HDR_LANGUAGE = sys.intern("\n## LANGUAGE DIRECTIVE\n")
+_HDR_CAMERA = sys.intern("\n## CAMERA LANGUAGE\n")
+_HDR_LIGHTING = sys.intern("\n## LIGHTING BIBLE\n")
+_HDR_REALISM = sys.intern("\n## REALISM REQUIREMENTS - STRICTLY ENFORCE\n")
+_PROHIBITED = sys.intern("PROHIBITED: ")
+
+# Display names for non-English language directives in the master prompt
+_LANG_NAMES = MappingProxyType({
+    "hi": "Hindi (Devanagari script)", "ta": "Tamil (Tamil script)",
+    "te": "Telugu (Telugu script)", "bn": "Bengali (Bengali script)",
+    "mr": "Marathi (Devanagari script)", "gu": "Gujarati (Gujarati script)",
+    "kn": "Kannada (Kannada script)", "pa": "Punjabi (Gurmukhi script)",
+    "ml": "Malayalam (Malayalam script)",
+})
+
+
+class _LookupEnum(StrEnum):
+    """StrEnum with a direct value -> member lookup for parsing request strings."""
+
+    @classmethod
+    def from_value(cls, value: str) -> Self:
+        """Return the member for ``value``, raising ValueError like ``cls(value)``."""
+        try:
+            return cls._value2member_map_[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+class Platform(_LookupEnum):
     """Target platform for the video."""
 
     INSTAGRAM_REELS = "instagram_reels"
@@ -25,7 +65,7 @@ class Platform(str, Enum):
     SNAPCHAT = "snapchat"
 
 
-class VideoStyle(str, Enum):
+class VideoStyle(_LookupEnum):
     """Style/format of the UGC video."""
 
     # Classic UGC
@@ -61,7 +101,7 @@ class VideoStyle(str, Enum):
     US_VS_THEM = "us_vs_them"
 
 
-class Tone(str, Enum):
+class Tone(_LookupEnum):
     """Emotional tone of the content."""
 
     EXCITED = "excited"
@@ -78,7 +118,7 @@ class Tone(str, Enum):
     HYPE = "hype"
 
 
-class CameraBody(str, Enum):
+class CameraBody(_LookupEnum):
     """Camera body for UGC authenticity."""
 
     IPHONE_15_PRO = "iPhone 15 Pro"  # Most common UGC
@@ -88,7 +128,7 @@ class CameraBody(str, Enum):
     CANON_M50 = "Canon M50"
 
 
-class ShotType(str, Enum):
+class ShotType(_LookupEnum):
     """Camera shot types."""
 
     EXTREME_CLOSE_UP = "extreme_close_up"  # Product detail, eyes
@@ -99,7 +139,7 @@ class ShotType(str, Enum):
     WIDE = "wide"  # Establishing shot
 
 
-class CameraAngle(str, Enum):
+class CameraAngle(_LookupEnum):
     """Camera angles."""
 
     EYE_LEVEL = "eye_level"  # Standard, relatable
@@ -110,7 +150,7 @@ class CameraAngle(str, Enum):
     DUTCH = "dutch"  # Slight tilt for dynamism
 
 
-class CameraMovement(str, Enum):
+class CameraMovement(_LookupEnum):
     """Camera movement types."""
 
     STATIC = "static"  # No movement
@@ -121,7 +161,7 @@ class CameraMovement(str, Enum):
     FOLLOW = "follow"  # Tracks subject movement
 
 
-class LightingSetup(str, Enum):
+class LightingSetup(_LookupEnum):
     """Lighting setups for UGC authenticity."""
 
     NATURAL_WINDOW = "natural_window"  # Soft daylight from window
@@ -133,7 +173,7 @@ class LightingSetup(str, Enum):
     MIXED = "mixed"  # Daylight + artificial
 
 
-class LightingDirection(str, Enum):
+class LightingDirection(_LookupEnum):
     """Light direction relative to subject."""
 
     FRONT = "front"  # Flat, even (ring light)
@@ -146,19 +186,21 @@ class LightingDirection(str, Enum):
 class CameraLanguage(BaseModel):
     """Default camera settings for the production."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     body: CameraBody = CameraBody.IPHONE_15_PRO
     default_shot: ShotType = ShotType.MEDIUM_CLOSE_UP
     default_angle: CameraAngle = CameraAngle.EYE_LEVEL
     default_movement: CameraMovement = CameraMovement.SUBTLE_HANDHELD
     lens_mm: int = Field(default=24, description="Equivalent focal length in mm")
-    depth_of_field: str = Field(default="shallow", description="shallow, medium, deep")
+    depth_of_field: Literal["shallow", "medium", "deep"] = Field(default="shallow", description="shallow, medium, deep")
 
     # UGC authenticity settings
-    handheld_intensity: str = Field(
+    handheld_intensity: Literal["none", "subtle", "moderate"] = Field(
         default="subtle",
         description="none, subtle, moderate - amount of natural camera shake"
     )
-    focus_behavior: str = Field(
+    focus_behavior: Literal["perfect", "natural", "rack"] = Field(
         default="natural",
         description="perfect, natural (occasional hunting), rack (intentional shifts)"
     )
@@ -167,31 +209,35 @@ class CameraLanguage(BaseModel):
 class LightingBible(BaseModel):
     """Default lighting settings for the production."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     setup: LightingSetup = LightingSetup.NATURAL_WINDOW
     direction: LightingDirection = LightingDirection.FRONT_45
     color_temp_kelvin: int = Field(default=5600, description="Color temperature in Kelvin")
-    key_intensity: str = Field(default="soft", description="soft, medium, hard")
-    fill_ratio: str = Field(default="1:2", description="Key to fill ratio")
+    key_intensity: Literal["soft", "medium", "hard"] = Field(default="soft", description="soft, medium, hard")
+    fill_ratio: StrictStr = Field(default="1:2", description="Key to fill ratio")
     rim_light: bool = Field(default=False, description="Whether to add rim/hair light")
-    mood: str = Field(default="bright_friendly", description="Overall lighting mood")
+    mood: StrictStr = Field(default="bright_friendly", description="Overall lighting mood")
 
 
 class StyleConfig(BaseModel):
     """Style configuration for the video."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     platform: Platform = Platform.INSTAGRAM_REELS
     duration_seconds: int = Field(default=30, ge=5, le=180)
     style: VideoStyle = VideoStyle.TESTIMONIAL
     tone: Tone = Tone.EXCITED
-    pacing: str = Field(
+    pacing: Literal["slow", "moderate", "dynamic", "fast"] = Field(
         default="dynamic",
         description="slow, moderate, dynamic, fast"
     )
-    music_style: str | None = Field(
+    music_style: StrictStr | None = Field(
         default=None,
         description="Background music style if any"
     )
-    language: str = Field(
+    language: StrictStr = Field(
         default="en",
         description="Language code for script and TTS (en, hi, ta, te, bn, mr, gu, kn, pa, ml)"
     )
@@ -200,97 +246,143 @@ class StyleConfig(BaseModel):
 class CreativeBrief(BaseModel):
     """Expanded creative brief from Co-Pilot."""
 
-    user_input: str = Field(description="Original user prompt")
-    hook_strategy: str = Field(description="How to grab attention in first 3 seconds")
-    pain_point: str = Field(description="Problem/frustration to address")
-    key_selling_points: list[str] = Field(description="Main benefits to highlight")
-    emotional_journey: str = Field(description="Viewer's emotional arc")
-    cta_approach: str = Field(description="Call to action strategy")
-    unique_angle: str | None = Field(default=None, description="What makes this video different")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    user_input: StrictStr = Field(description="Original user prompt")
+    hook_strategy: StrictStr = Field(description="How to grab attention in first 3 seconds")
+    pain_point: StrictStr = Field(description="Problem/frustration to address")
+    key_selling_points: tuple[str, ...] = Field(description="Main benefits to highlight")
+    emotional_journey: StrictStr = Field(description="Viewer's emotional arc")
+    cta_approach: StrictStr = Field(description="Call to action strategy")
+    unique_angle: StrictStr | None = Field(default=None, description="What makes this video different")
 
 
-class RealismRules(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RealismRules:
     """Rules for maintaining photorealistic, non-AI appearance.
 
     These rules are CRITICAL and must be included in every generation prompt.
+    The content never varies, so every bible shares ``REALISM_RULES_DEFAULT``.
     """
 
     # CHARACTER IDENTITY CONSISTENCY (HIGHEST PRIORITY)
-    character_consistency: str = Field(
-        default="THE SAME PERSON must appear in EVERY frame, scene, and shot. "
-                "This is not a suggestion - it is an absolute requirement. "
-                "Match the character reference images EXACTLY: same face, same features, same person."
+    character_consistency: str = (
+        "THE SAME PERSON must appear in EVERY frame, scene, and shot. "
+        "This is not a suggestion - it is an absolute requirement. "
+        "Match the character reference images EXACTLY: same face, same features, same person."
     )
-    character_consistency_prohibited: str = Field(
-        default="NEVER change the person's face between scenes. NEVER substitute a different person. "
-                "NEVER alter their ethnicity, age, gender, or fundamental facial features. "
-                "NEVER generate a 'similar looking' person - it must be THE EXACT SAME INDIVIDUAL."
+    character_consistency_prohibited: str = (
+        "NEVER change the person's face between scenes. NEVER substitute a different person. "
+        "NEVER alter their ethnicity, age, gender, or fundamental facial features. "
+        "NEVER generate a 'similar looking' person - it must be THE EXACT SAME INDIVIDUAL."
     )
 
     # Skin requirements
-    skin_texture: str = Field(
-        default="Natural skin with visible pores, subtle imperfections, and realistic subsurface scattering. "
-                "Minor blemishes, natural color variations, and authentic shadows under eyes and around nose. "
-                "MUST match the exact skin tone from character reference images."
+    skin_texture: str = (
+        "Natural skin with visible pores, subtle imperfections, and realistic subsurface scattering. "
+        "Minor blemishes, natural color variations, and authentic shadows under eyes and around nose. "
+        "MUST match the exact skin tone from character reference images."
     )
-    skin_prohibited: str = Field(
-        default="NO waxy, plastic, or airbrushed appearance. NO uncanny valley smoothness. "
-                "NO perfectly even skin tone. NO doll-like perfection. "
-                "NO changing skin tone from reference images."
+    skin_prohibited: str = (
+        "NO waxy, plastic, or airbrushed appearance. NO uncanny valley smoothness. "
+        "NO perfectly even skin tone. NO doll-like perfection. "
+        "NO changing skin tone from reference images."
     )
 
     # Face requirements
-    face_structure: str = Field(
-        default="Natural facial asymmetry (real humans are not perfectly symmetrical). "
-                "Realistic eye moisture and reflections. Natural lip texture. "
-                "Authentic micro-expressions and natural blinks. "
-                "MUST maintain IDENTICAL facial features across all generations."
+    face_structure: str = (
+        "Natural facial asymmetry (real humans are not perfectly symmetrical). "
+        "Realistic eye moisture and reflections. Natural lip texture. "
+        "Authentic micro-expressions and natural blinks. "
+        "MUST maintain IDENTICAL facial features across all generations."
     )
-    face_prohibited: str = Field(
-        default="NO perfectly symmetrical features. NO doll-like proportions. "
-                "NO unnaturally large eyes. NO plastic-looking features. "
-                "NO changing face shape, eye shape, nose, or lips from reference."
+    face_prohibited: str = (
+        "NO perfectly symmetrical features. NO doll-like proportions. "
+        "NO unnaturally large eyes. NO plastic-looking features. "
+        "NO changing face shape, eye shape, nose, or lips from reference."
     )
 
     # Hand requirements (CRITICAL for AI)
-    hands: str = Field(
-        default="EXACTLY 5 fingers per hand. Natural finger proportions and positions. "
-                "Realistic nail beds and knuckles. Natural hand poses."
+    hands: str = (
+        "EXACTLY 5 fingers per hand. Natural finger proportions and positions. "
+        "Realistic nail beds and knuckles. Natural hand poses."
     )
-    hands_prohibited: str = Field(
-        default="NO extra fingers. NO merged fingers. NO impossible hand poses. "
-                "NO missing fingers. NO abnormal finger lengths."
+    hands_prohibited: str = (
+        "NO extra fingers. NO merged fingers. NO impossible hand poses. "
+        "NO missing fingers. NO abnormal finger lengths."
     )
 
     # Environment requirements
-    environment: str = Field(
-        default="Lived-in, authentic spaces with natural clutter and personal items. "
-                "Realistic material textures. Appropriate depth of field. "
-                "Natural lighting interaction with environment."
+    environment: str = (
+        "Lived-in, authentic spaces with natural clutter and personal items. "
+        "Realistic material textures. Appropriate depth of field. "
+        "Natural lighting interaction with environment."
     )
-    environment_prohibited: str = Field(
-        default="NO sterile, empty backgrounds. NO obviously generated patterns. "
-                "NO impossible architecture. NO floating objects."
+    environment_prohibited: str = (
+        "NO sterile, empty backgrounds. NO obviously generated patterns. "
+        "NO impossible architecture. NO floating objects."
     )
 
     # Product requirements
-    product_fidelity: str = Field(
-        default="EXACT match to provided reference images. Correct text/branding reproduction. "
-                "Accurate material representation. Proper scale relative to hands/body."
+    product_fidelity: str = (
+        "EXACT match to provided reference images. Correct text/branding reproduction. "
+        "Accurate material representation. Proper scale relative to hands/body."
     )
-    product_prohibited: str = Field(
-        default="NO invented product details. NO text alterations or additions. "
-                "NO color shifts from reference. NO size distortions."
+    product_prohibited: str = (
+        "NO invented product details. NO text alterations or additions. "
+        "NO color shifts from reference. NO size distortions."
     )
 
     # Text overlay prohibition
-    text_overlay: str = Field(
-        default="DO NOT generate any on-screen text, captions, subtitles, or text overlays. "
-                "DO NOT add watermarks, timestamps, or UI elements. "
-                "Text on products only (from reference images)."
+    text_overlay: str = (
+        "DO NOT generate any on-screen text, captions, subtitles, or text overlays. "
+        "DO NOT add watermarks, timestamps, or UI elements. "
+        "Text on products only (from reference images)."
     )
 
 
+REALISM_RULES_DEFAULT = RealismRules()
+
+
+def _render_realism(rules: RealismRules) -> str:
+    """Render the REALISM REQUIREMENTS section of the master prompt."""
+    return (
+        f"{_HDR_REALISM}"
+        "\n### ⚠️ CHARACTER CONSISTENCY (HIGHEST PRIORITY)\n"
+        f"{rules.character_consistency}\n"
+        f"{_PROHIBITED}{rules.character_consistency_prohibited}\n"
+        "\n### SKIN\n"
+        f"{rules.skin_texture}\n"
+        f"{_PROHIBITED}{rules.skin_prohibited}\n"
+        "\n### FACE\n"
+        f"{rules.face_structure}\n"
+        f"{_PROHIBITED}{rules.face_prohibited}\n"
+        "\n### HANDS (CRITICAL)\n"
+        f"{rules.hands}\n"
+        f"{_PROHIBITED}{rules.hands_prohibited}\n"
+        "\n### ENVIRONMENT\n"
+        f"{rules.environment}\n"
+        f"{_PROHIBITED}{rules.environment_prohibited}\n"
+        "\n### PRODUCT FIDELITY\n"
+        f"{rules.product_fidelity}\n"
+        f"{_PROHIBITED}{rules.product_prohibited}\n"
+        "\n### TEXT/CAPTIONS\n"
+        f"{rules.text_overlay}\n"
+    )
+
+
+# Rendered once: almost every bible uses the shared default rules
+_DEFAULT_REALISM_BLOCK = _render_realism(REALISM_RULES_DEFAULT)
+
+
+def _construct(model: type[BaseModel], data: dict) -> BaseModel:
+    """``model_construct`` for trusted data, restoring enum members it skips."""
+    for name, field in model.model_fields.items():
+        if name in data and isinstance(field.annotation, type) and issubclass(field.annotation, StrEnum):
+            data[name] = field.annotation(data[name])
+    return model.model_construct(**data)
+
+
 class ProductionBible(BaseModel):
     """The complete Production Bible - source of truth for all generation.
 
@@ -298,6 +390,9 @@ class ProductionBible(BaseModel):
     consistently across all subsequent generations.
     """
 
+    # Schema is built on first use, not when the enums are imported
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
     # Core DNA
     product_dna: ProductDNA = Field(description="Visual DNA of the product")
     avatar_dna: AvatarDNA | None = Field(default=None, description="Character DNA if using avatar")
@@ -318,151 +413,240 @@ class ProductionBible(BaseModel):
 
     # Critical rules
     realism_rules: RealismRules = Field(
-        default_factory=RealismRules,
+        default=REALISM_RULES_DEFAULT,
         description="Realism requirements"
     )
 
-    # Assembled master prompt (generated from all above)
-    master_prompt: str = Field(
-        default="",
-        description="The complete assembled prompt used for all generations"
-    )
-
-    def assemble_master_prompt(self) -> str:
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_master_prompt(cls, data: Any) -> Any:
+        """Ignore a ``master_prompt`` echoed back by clients; it is derived."""
+        if isinstance(data, dict) and "master_prompt" in data:
+            data = {k: v for k, v in data.items() if k != "master_prompt"}
+        return data
+
+    @cached_property
+    def master_prompt(self) -> str:
+        """The complete assembled prompt used for all generations."""
+        return self._render()
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the bible, dropping the cached prompt when fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("master_prompt", None)
+        return copied
+
+    def to_cache_bytes(self) -> bytes:
+        """Serialize the bible for caches and queues (see ``from_cache_bytes``)."""
+        return orjson.dumps(self.model_dump(mode="json"))
+
+    @classmethod
+    def from_cache_bytes(cls, data: bytes) -> "ProductionBible":
+        """Rebuild a bible written by ``to_cache_bytes`` without re-validating.
+
+        Only for bytes we produced ourselves; client payloads must go through
+        normal validation.
+        """
+        raw = orjson.loads(data)
+        product = raw["product_dna"]
+        product["colors"] = ProductColors.model_construct(**product["colors"])
+        product["materials"] = tuple(product.get("materials", ()))
+        product["distinctive_features"] = tuple(product.get("distinctive_features", ()))
+        brief = raw["creative_brief"]
+        brief["key_selling_points"] = tuple(brief["key_selling_points"])
+        avatar = raw.get("avatar_dna")
+        realism = RealismRules(**raw["realism_rules"])
+        return cls.model_construct(
+            product_dna=ProductDNA.model_construct(**product),
+            avatar_dna=AvatarDNA.model_construct(**avatar) if avatar else None,
+            style_config=_construct(StyleConfig, raw["style_config"]),
+            creative_brief=CreativeBrief.model_construct(**brief),
+            camera_language=_construct(CameraLanguage, raw["camera_language"]),
+            lighting_bible=_construct(LightingBible, raw["lighting_bible"]),
+            realism_rules=REALISM_RULES_DEFAULT if realism == REALISM_RULES_DEFAULT else realism,
+        )
+
+    def _render(self) -> str:
         """Assemble the complete master prompt from all components."""
-        sections = []
+        return _render_prompt(self._prompt_key())
+
+    def _prompt_key(self) -> tuple:
+        """Collect every value the master prompt reads into a hashable key."""
+        product = self.product_dna
+        avatar = self.avatar_dna
+        style = self.style_config
+        camera = self.camera_language
+        lighting = self.lighting_bible
+        return (
+            (
+                product.product_type, product.product_name, product.colors.primary,
+                product.colors.secondary, product.shape, product.materials_csv,
+                product.texture, product.size_category, product.visual_description,
+                product.features_csv,
+            ),
+            (
+                avatar.gender, avatar.ethnicity, avatar.age_range, avatar.face, avatar.eyes,
+                avatar.skin, avatar.hair, avatar.body, avatar.wardrobe, avatar.prohibited_drift,
+            ) if avatar is not None else None,
+            (style.platform, style.duration_seconds, style.style, style.tone, style.pacing, style.language),
+            (
+                camera.body, camera.default_shot, camera.default_angle,
+                camera.default_movement, camera.lens_mm, camera.handheld_intensity,
+            ),
+            (lighting.setup, lighting.direction, lighting.color_temp_kelvin, lighting.key_intensity, lighting.mood),
+            self.realism_rules,
+        )
+
+
+@lru_cache(maxsize=64)
+def _prompt_template(shape: tuple) -> str:
+    """Build the ``str.format`` template for one master-prompt shape.
+
+    Optional lines are resolved here once per shape (see ``_render_prompt``),
+    so rendering a bible is a single ``format_map`` with no per-field branches.
+    """
+    has_name, has_secondary, has_texture, has_features, avatar, has_language = shape
 
+    lines = [
         # Header
-        sections.append("=" * 60)
-        sections.append("PRODUCTION BIBLE - IMMUTABLE REFERENCE")
-        sections.append("=" * 60)
-
+        f"{_SEP}\n",
+        "PRODUCTION BIBLE - IMMUTABLE REFERENCE\n",
+        f"{_SEP}\n",
         # Product DNA
-        sections.append("\n## PRODUCT DNA")
-        sections.append(f"Type: {self.product_dna.product_type}")
-        if self.product_dna.product_name:
-            sections.append(f"Name: {self.product_dna.product_name}")
-        sections.append(f"Colors: Primary={self.product_dna.colors.primary}")
-        if self.product_dna.colors.secondary:
-            sections.append(f"        Secondary={self.product_dna.colors.secondary}")
-        sections.append(f"Shape: {self.product_dna.shape}")
-        sections.append(f"Materials: {', '.join(self.product_dna.materials)}")
-        if self.product_dna.texture:
-            sections.append(f"Texture: {self.product_dna.texture}")
-        sections.append(f"Size: {self.product_dna.size_category}")
-        sections.append(f"\nVisual Description: {self.product_dna.visual_description}")
-        if self.product_dna.distinctive_features:
-            sections.append(f"Distinctive Features: {', '.join(self.product_dna.distinctive_features)}")
-
-        # Avatar DNA (if present) - CHARACTER IDENTITY LOCK
-        if self.avatar_dna:
-            sections.append("\n" + "=" * 60)
-            sections.append("## ⚠️ CHARACTER IDENTITY - LOCKED (DO NOT CHANGE)")
-            sections.append("=" * 60)
-            sections.append("This is a SPECIFIC PERSON. The SAME individual must appear")
-            sections.append("in EVERY scene, EVERY frame, EVERY generation.")
-            sections.append("")
-            sections.append("IMMUTABLE IDENTITY ATTRIBUTES:")
-            gender = getattr(self.avatar_dna, 'gender', '') or ''
-            ethnicity = getattr(self.avatar_dna, 'ethnicity', '') or 'as shown in reference'
-            age_range = getattr(self.avatar_dna, 'age_range', '') or 'as shown in reference'
-            if gender:
-                sections.append(f"- Gender: {gender} (LOCKED)")
-            if ethnicity:
-                sections.append(f"- Ethnicity: {ethnicity} (LOCKED)")
-            if age_range:
-                sections.append(f"- Age Range: {age_range} (LOCKED)")
-            sections.append("")
-            sections.append("FACE IDENTITY (MUST BE IDENTICAL IN ALL GENERATIONS):")
-            sections.append(f"- Face Structure: {self.avatar_dna.face}")
-            sections.append(f"- Eyes: {self.avatar_dna.eyes}")
-            sections.append(f"- Skin: {self.avatar_dna.skin}")
-            sections.append(f"- Hair: {self.avatar_dna.hair}")
-            sections.append("")
-            sections.append("BODY & WARDROBE:")
-            sections.append(f"- Body Type: {self.avatar_dna.body}")
-            sections.append(f"- Wardrobe: {self.avatar_dna.wardrobe}")
-            sections.append("")
-            sections.append("CONSISTENCY REQUIREMENT:")
-            sections.append("- Would someone looking at all scenes recognize this as THE SAME PERSON?")
-            sections.append("- If NO, regenerate until character identity is consistent")
-            if self.avatar_dna.prohibited_drift:
-                sections.append("")
-                sections.append(f"❌ ABSOLUTELY PROHIBITED: {self.avatar_dna.prohibited_drift}")
-                sections.append("❌ NEVER change face shape, skin tone, or ethnic features")
-                sections.append("❌ NEVER substitute a different person between scenes")
-
-        # Style
-        sections.append("\n## STYLE GUIDE")
-        sections.append(f"Platform: {self.style_config.platform.value}")
-        sections.append(f"Duration: {self.style_config.duration_seconds} seconds")
-        sections.append(f"Style: {self.style_config.style.value}")
-        sections.append(f"Tone: {self.style_config.tone.value}")
-        sections.append(f"Pacing: {self.style_config.pacing}")
-
-        # Language directive
-        if self.style_config.language and self.style_config.language != "en":
-            lang_names = {
-                "hi": "Hindi (Devanagari script)", "ta": "Tamil (Tamil script)",
-                "te": "Telugu (Telugu script)", "bn": "Bengali (Bengali script)",
-                "mr": "Marathi (Devanagari script)", "gu": "Gujarati (Gujarati script)",
-                "kn": "Kannada (Kannada script)", "pa": "Punjabi (Gurmukhi script)",
-                "ml": "Malayalam (Malayalam script)",
-            }
-            lang_name = lang_names.get(self.style_config.language, self.style_config.language)
-            sections.append("\n## LANGUAGE DIRECTIVE")
-            sections.append(f"ALL dialogue MUST be written in {lang_name}.")
-            sections.append(f"Use natural, conversational {lang_name} — NOT translated English.")
-            sections.append("Keep product names and brand names in English/original form.")
-
+        _HDR_PRODUCT,
+        "Type: {product_type}\n",
+        *(["Name: {product_name}\n"] if has_name else []),
+        "Colors: Primary={primary_color}\n",
+        *(["        Secondary={secondary_color}\n"] if has_secondary else []),
+        "Shape: {shape}\n",
+        "Materials: {materials}\n",
+        *(["Texture: {texture}\n"] if has_texture else []),
+        "Size: {size_category}\n",
+        "\nVisual Description: {visual_description}\n",
+        *(["Distinctive Features: {features}\n"] if has_features else []),
+    ]
+
+    # Avatar DNA (if present) - CHARACTER IDENTITY LOCK
+    if avatar is not None:
+        has_gender, has_drift = avatar
+        lines += [line for cond, line in (
+            (True, f"\n{_SEP}\n"),
+            (True, "## ⚠️ CHARACTER IDENTITY - LOCKED (DO NOT CHANGE)\n"),
+            (True, f"{_SEP}\n"),
+            (True, "This is a SPECIFIC PERSON. The SAME individual must appear\n"),
+            (True, "in EVERY scene, EVERY frame, EVERY generation.\n"),
+            (True, "\n"),
+            (True, "IMMUTABLE IDENTITY ATTRIBUTES:\n"),
+            (has_gender, "- Gender: {gender} (LOCKED)\n"),
+            (True, "- Ethnicity: {ethnicity} (LOCKED)\n"),
+            (True, "- Age Range: {age_range} (LOCKED)\n"),
+            (True, "\n"),
+            (True, "FACE IDENTITY (MUST BE IDENTICAL IN ALL GENERATIONS):\n"),
+            (True, "- Face Structure: {face}\n"),
+            (True, "- Eyes: {eyes}\n"),
+            (True, "- Skin: {skin}\n"),
+            (True, "- Hair: {hair}\n"),
+            (True, "\n"),
+            (True, "BODY & WARDROBE:\n"),
+            (True, "- Body Type: {avatar_body}\n"),
+            (True, "- Wardrobe: {wardrobe}\n"),
+            (True, "\n"),
+            (True, "CONSISTENCY REQUIREMENT:\n"),
+            (True, "- Would someone looking at all scenes recognize this as THE SAME PERSON?\n"),
+            (True, "- If NO, regenerate until character identity is consistent\n"),
+            (has_drift, "\n"),
+            (has_drift, "❌ ABSOLUTELY PROHIBITED: {prohibited_drift}\n"),
+            (has_drift, "❌ NEVER change face shape, skin tone, or ethnic features\n"),
+            (has_drift, "❌ NEVER substitute a different person between scenes\n"),
+        ) if cond]
+
+    # Style
+    lines += [
+        _HDR_STYLE,
+        "Platform: {platform}\n",
+        "Duration: {duration_seconds} seconds\n",
+        "Style: {video_style}\n",
+        "Tone: {tone}\n",
+        "Pacing: {pacing}\n",
+    ]
+
+    # Language directive
+    if has_language:
+        lines += [
+            _HDR_LANGUAGE,
+            "ALL dialogue MUST be written in {lang_name}.\n",
+            "Use natural, conversational {lang_name} — NOT translated English.\n",
+            "Keep product names and brand names in English/original form.\n",
+        ]
+
+    lines += [
         # Camera
-        sections.append("\n## CAMERA LANGUAGE")
-        sections.append(f"Body: {self.camera_language.body.value}")
-        sections.append(f"Default Shot: {self.camera_language.default_shot.value}")
-        sections.append(f"Default Angle: {self.camera_language.default_angle.value}")
-        sections.append(f"Movement: {self.camera_language.default_movement.value}")
-        sections.append(f"Lens: {self.camera_language.lens_mm}mm equivalent")
-        sections.append(f"Handheld: {self.camera_language.handheld_intensity}")
-
+        _HDR_CAMERA,
+        "Body: {body}\n",
+        "Default Shot: {default_shot}\n",
+        "Default Angle: {default_angle}\n",
+        "Movement: {default_movement}\n",
+        "Lens: {lens_mm}mm equivalent\n",
+        "Handheld: {handheld}\n",
         # Lighting
-        sections.append("\n## LIGHTING BIBLE")
-        sections.append(f"Setup: {self.lighting_bible.setup.value}")
-        sections.append(f"Direction: {self.lighting_bible.direction.value}")
-        sections.append(f"Color Temp: {self.lighting_bible.color_temp_kelvin}K")
-        sections.append(f"Key Intensity: {self.lighting_bible.key_intensity}")
-        sections.append(f"Mood: {self.lighting_bible.mood}")
-
+        _HDR_LIGHTING,
+        "Setup: {setup}\n",
+        "Direction: {direction}\n",
+        "Color Temp: {color_temp_kelvin}K\n",
+        "Key Intensity: {key_intensity}\n",
+        "Mood: {mood}\n",
         # Realism Rules (CRITICAL)
-        sections.append("\n## REALISM REQUIREMENTS - STRICTLY ENFORCE")
-
-        sections.append("\n### ⚠️ CHARACTER CONSISTENCY (HIGHEST PRIORITY)")
-        sections.append(self.realism_rules.character_consistency)
-        sections.append(f"PROHIBITED: {self.realism_rules.character_consistency_prohibited}")
+        "{realism}",
+        f"\n{_SEP}",
+    ]
+    return "".join(lines)
 
-        sections.append("\n### SKIN")
-        sections.append(self.realism_rules.skin_texture)
-        sections.append(f"PROHIBITED: {self.realism_rules.skin_prohibited}")
 
-        sections.append("\n### FACE")
-        sections.append(self.realism_rules.face_structure)
-        sections.append(f"PROHIBITED: {self.realism_rules.face_prohibited}")
+@lru_cache(maxsize=256)
+def _render_prompt(key: tuple) -> str:
+    """Render the master prompt for a ``ProductionBible._prompt_key()``.
 
-        sections.append("\n### HANDS (CRITICAL)")
-        sections.append(self.realism_rules.hands)
-        sections.append(f"PROHIBITED: {self.realism_rules.hands_prohibited}")
-
-        sections.append("\n### ENVIRONMENT")
-        sections.append(self.realism_rules.environment)
-        sections.append(f"PROHIBITED: {self.realism_rules.environment_prohibited}")
-
-        sections.append("\n### PRODUCT FIDELITY")
-        sections.append(self.realism_rules.product_fidelity)
-        sections.append(f"PROHIBITED: {self.realism_rules.product_prohibited}")
-
-        sections.append("\n### TEXT/CAPTIONS")
-        sections.append(self.realism_rules.text_overlay)
-
-        sections.append("\n" + "=" * 60)
-
-        self.master_prompt = "\n".join(sections)
-        return self.master_prompt
+    Scenes and shots re-request prompts from a handful of bibles, so renders
+    are memoized on the (immutable) inputs.
+    """
+    product, avatar, style, camera, lighting, realism = key
+    (
+        product_type, product_name, primary_color, secondary_color, shape,
+        materials, texture, size_category, visual_description, features,
+    ) = product
+    platform, duration_seconds, video_style, tone, pacing, language = style
+    body, default_shot, default_angle, default_movement, lens_mm, handheld = camera
+    setup, direction, color_temp_kelvin, key_intensity, mood = lighting
+    has_language = bool(language) and language != "en"
+
+    values = {
+        "product_type": product_type, "product_name": product_name,
+        "primary_color": primary_color, "secondary_color": secondary_color,
+        "shape": shape, "materials": materials, "texture": texture,
+        "size_category": size_category, "visual_description": visual_description,
+        "features": features,
+        "platform": platform, "duration_seconds": duration_seconds,
+        "video_style": video_style, "tone": tone, "pacing": pacing,
+        "lang_name": _LANG_NAMES.get(language, language) if has_language else "",
+        "body": body, "default_shot": default_shot, "default_angle": default_angle,
+        "default_movement": default_movement, "lens_mm": lens_mm, "handheld": handheld,
+        "setup": setup, "direction": direction, "color_temp_kelvin": color_temp_kelvin,
+        "key_intensity": key_intensity, "mood": mood,
+        "realism": _DEFAULT_REALISM_BLOCK if realism is REALISM_RULES_DEFAULT else _render_realism(realism),
+    }
+    if avatar is not None:
+        gender, ethnicity, age_range, face, eyes, skin, hair, avatar_body, wardrobe, prohibited_drift = avatar
+        values.update(
+            gender=gender, ethnicity=ethnicity or "as shown in reference",
+            age_range=age_range or "as shown in reference", face=face, eyes=eyes,
+            skin=skin, hair=hair, avatar_body=avatar_body, wardrobe=wardrobe,
+            prohibited_drift=prohibited_drift,
+        )
+
+    shape_key = (
+        bool(product_name), bool(secondary_color), bool(texture), bool(features),
+        (bool(avatar[0]), bool(avatar[-1])) if avatar is not None else None,
+        has_language,
+    )
+    return _prompt_template(shape_key).format_map(values)
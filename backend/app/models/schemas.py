@@ -1,11 +1,12 @@
-from pydantic import BaseModel, Field
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+from enum import StrEnum
 
 
 # ─── Enums ─────────────────────────────────────────────────────────
 
 
-class SceneType(str, Enum):
+class SceneType(StrEnum):
     """Types of video scenes."""
 
     intro = "intro"
@@ -19,7 +20,7 @@ class SceneType(str, Enum):
     cta = "cta"
 
 
-class ProductVisibility(str, Enum):
+class ProductVisibility(StrEnum):
     """Product prominence in scene."""
 
     primary = "primary"
@@ -28,7 +29,7 @@ class ProductVisibility(str, Enum):
     none = "none"
 
 
-class BackgroundSetting(str, Enum):
+class BackgroundSetting(StrEnum):
     """Background environment presets."""
 
     modern_bedroom = "modern_bedroom"
@@ -39,7 +40,7 @@ class BackgroundSetting(str, Enum):
     custom = "custom"
 
 
-class Platform(str, Enum):
+class Platform(StrEnum):
     """Target platform for video."""
 
     instagram_reels = "instagram_reels"
@@ -48,7 +49,7 @@ class Platform(str, Enum):
     general = "general"
 
 
-class ReferenceAngle(str, Enum):
+class ReferenceAngle(StrEnum):
     """Reference image angle classifications."""
 
     front = "front"
@@ -62,7 +63,8 @@ class ReferenceAngle(str, Enum):
 # ─── Camera & Lighting Models ──────────────────────────────────────
 
 
-class CameraSetup(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CameraSetup:
     """Professional camera configuration."""
 
     body: str = "ARRI Alexa Mini"  # Camera body
@@ -73,7 +75,8 @@ class CameraSetup(BaseModel):
     focus: str = "subject"  # subject, product, background, rack_focus
 
 
-class LightingSetup(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LightingSetup:
     """Professional lighting configuration."""
 
     type: str = "three_point"  # natural, three_point, rembrandt, butterfly, split, rim
@@ -90,6 +93,8 @@ class LightingSetup(BaseModel):
 class ScriptScene(BaseModel):
     """A single scene within a video script."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     scene_number: int
     scene_type: SceneType = SceneType.demonstration
     location: str
@@ -119,6 +124,8 @@ class Script(BaseModel):
 class GenerationRequest(BaseModel):
     """Request to generate a UGC video."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     job_id: str | None = None  # Optional frontend job ID
     prompt: str
     avatar_id: str | None = None
@@ -234,6 +241,8 @@ class VideoGeneration(BaseModel):
 class AvatarCreate(BaseModel):
     """Request to create a new custom avatar."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     tag: str
     dna: AvatarDNA
@@ -243,6 +252,8 @@ class AvatarCreate(BaseModel):
 class AvatarResponse(BaseModel):
     """Avatar detail response."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str
     tag: str
@@ -307,7 +318,7 @@ class RegenerateStageRequest(BaseModel):
 # ─── Perfume Studio Models ────────────────────────────────────────
 
 
-class PerfumeStyle(str, Enum):
+class PerfumeStyle(StrEnum):
     """Perfume product photography styles."""
 
     white_background = "white_background"
@@ -319,7 +330,8 @@ class PerfumeStyle(str, Enum):
     flat_lay = "flat_lay"
 
 
-class PerfumeNotes(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PerfumeNotes:
     """Fragrance note pyramid."""
 
     top: list[str] = Field(default_factory=list)
@@ -445,12 +457,41 @@ class GenderAvatarSlot(BaseModel):
     dna: PerfumeAvatarDNA | None = None
 
 
-class GenderAvatarMapping(BaseModel):
-    """Gender-specific avatar mapping — each gender has its own images + DNA."""
+class GenderAvatarMapping:
+    """Gender-specific avatar mapping — each gender has its own images + DNA.
+
+    A plain slotted class: it is built once per batch from validated slots
+    and then read once per product, so it needs no model machinery.
+    """
 
-    male: GenderAvatarSlot = Field(default_factory=GenderAvatarSlot)
-    female: GenderAvatarSlot = Field(default_factory=GenderAvatarSlot)
-    unisex: GenderAvatarSlot = Field(default_factory=GenderAvatarSlot)
+    __slots__ = ("male", "female", "unisex")
+
+    def __init__(
+        self,
+        male: GenderAvatarSlot | None = None,
+        female: GenderAvatarSlot | None = None,
+        unisex: GenderAvatarSlot | None = None,
+    ) -> None:
+        self.male = male or GenderAvatarSlot()
+        self.female = female or GenderAvatarSlot()
+        self.unisex = unisex or GenderAvatarSlot()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GenderAvatarMapping":
+        """Build a mapping from request data, validating each present slot."""
+        return cls(**{
+            gender: GenderAvatarSlot(**data[gender])
+            for gender in cls.__slots__
+            if data.get(gender)
+        })
+
+    def __getitem__(self, gender: str) -> GenderAvatarSlot:
+        """Return the slot for ``gender``; anything but male/female is unisex."""
+        if gender == "male":
+            return self.male
+        if gender == "female":
+            return self.female
+        return self.unisex
 
 
 class PerfumePipelineConfig(BaseModel):
@@ -461,6 +502,7 @@ class PerfumePipelineConfig(BaseModel):
     mandatory_styles: list[str] = Field(
         default_factory=lambda: ["white_background"]
     )
+    max_concurrency: int = Field(default=5, ge=1, le=20)
 
 
 class ExtractGenderAvatarDNARequest(BaseModel):
@@ -482,6 +524,8 @@ class AnalyzeInspirationRequest(BaseModel):
 class RegenerateSingleImageRequest(BaseModel):
     """Request to regenerate one specific image by product and image index."""
 
+    model_config = ConfigDict(defer_build=True)
+
     perfume_info: PerfumeInfo
     reference_images: list[str]
     product_dna: PerfumeProductDNA | None = None
@@ -496,6 +540,8 @@ class RegenerateSingleImageRequest(BaseModel):
 class PerfumeBatchStartRequest(BaseModel):
     """Request to start a batch generation job with full pipeline config."""
 
+    model_config = ConfigDict(defer_build=True)
+
     products: list[dict]
     reference_images: list[str]
     product_dna: dict | None = None
@@ -9,10 +9,16 @@ Follows the same step-based pattern as video_pipeline.py:
 
 import asyncio
 import logging
+import secrets
 import time
-import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import orjson
+
 from app.models.schemas import (
     GenderAvatarMapping,
     GenderAvatarSlot,
@@ -27,41 +33,121 @@ from app.services.perfume_image_service import PerfumeImageService
 
 logger = logging.getLogger(__name__)
 
-# Pipeline steps with progress percentages
-STEPS: list[tuple[str, int, str]] = [
-    ("upload_refs", 5, "Reference images uploaded"),
-    ("product_dna", 10, "Extracting product DNA..."),
-    ("csv_parse", 15, "CSV parsed and names cleaned"),
-    ("avatar_dna", 25, "Extracting avatar DNA..."),
-    ("inspiration", 35, "Analyzing inspiration images..."),
-    ("configure", 40, "Configuration ready"),
-    ("generate", 80, "Generating images..."),
-    ("complete", 100, "Pipeline complete!"),
-]
-
-# In-memory job storage
-_pipeline_jobs: dict[str, dict[str, Any]] = {}
-
-
-def get_job(job_id: str) -> dict[str, Any] | None:
+# Pipeline steps (in order) -> (progress percentage, message)
+STEPS: MappingProxyType[str, tuple[int, str]] = MappingProxyType({
+    "upload_refs": (5, "Reference images uploaded"),
+    "product_dna": (10, "Extracting product DNA..."),
+    "csv_parse": (15, "CSV parsed and names cleaned"),
+    "avatar_dna": (25, "Extracting avatar DNA..."),
+    "inspiration": (35, "Analyzing inspiration images..."),
+    "configure": (40, "Configuration ready"),
+    "generate": (80, "Generating images..."),
+    "complete": (100, "Pipeline complete!"),
+})
+
+@dataclass(slots=True)
+class JobState:
+    """Mutable state of one batch generation job."""
+
+    job_id: str
+    products: list[dict]
+    product_indices: list[int]
+    reference_images: list[str]
+    config: PerfumePipelineConfig
+    product_dna: PerfumeProductDNA | None = None
+    gender_avatars: GenderAvatarMapping | None = None
+    inspiration_dna: InspirationDNA | None = None
+    status: str = "running"
+    current_step: str = "generate"
+    progress: int = 40
+    message: str = "Starting image generation..."
+    current_product: int = 0
+    current_product_name: str = ""
+    completed_count: int = 0
+    results: list[dict[str, Any]] = field(default_factory=list)
+    paused: bool = False
+    cancel: bool = False
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    # Set while the job may run; pause clears it so workers block on wait()
+    resume_event: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def total_products(self) -> int:
+        return len(self.product_indices)
+
+
+# In-memory job storage, oldest first; finished jobs are evicted by _evict()
+_pipeline_jobs: OrderedDict[str, JobState] = OrderedDict()
+_MAX_JOBS = 512
+_JOB_TTL_SEC = 3600
+_ACTIVE_STATUSES = frozenset({"running", "paused"})
+
+# Summary view of each job for list_jobs, kept in sync at every state change
+_pipeline_job_summaries: dict[str, dict[str, Any]] = {}
+
+
+def get_job(job_id: str) -> JobState | None:
     """Get a pipeline job by ID."""
     return _pipeline_jobs.get(job_id)
 
 
+def encode_job_status(job: JobState) -> bytes:
+    """Encode the pollable status of a job (with incremental results) as JSON."""
+    return orjson.dumps({
+        "job_id": job.job_id,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "total_products": job.total_products,
+        "current_product": job.current_product,
+        "current_product_name": job.current_product_name,
+        "completed_count": job.completed_count,
+        "results": job.results,
+        "paused": job.paused,
+    })
+
+
 def list_jobs() -> list[dict[str, Any]]:
     """List all jobs with summary info."""
-    return [
-        {
-            "job_id": j["job_id"],
-            "status": j["status"],
-            "current_step": j.get("current_step", ""),
-            "progress": j.get("progress", 0),
-            "total_products": j.get("total_products", 0),
-            "completed_count": j.get("completed_count", 0),
-            "started_at": j.get("started_at", 0),
-        }
-        for j in _pipeline_jobs.values()
+    return list(_pipeline_job_summaries.values())
+
+
+def _evict() -> None:
+    """Drop finished jobs past their TTL, then the oldest ones beyond _MAX_JOBS.
+
+    Running and paused jobs are never evicted.
+    """
+    now = time.time()
+    finished = [
+        (job_id, job) for job_id, job in _pipeline_jobs.items()
+        if job.status not in _ACTIVE_STATUSES
     ]
+    overflow = len(_pipeline_jobs) - _MAX_JOBS
+    for job_id, job in finished:
+        if overflow > 0 or now - (job.finished_at or job.started_at) > _JOB_TTL_SEC:
+            del _pipeline_jobs[job_id]
+            _pipeline_job_summaries.pop(job_id, None)
+            overflow -= 1
+
+
+def _sync_summary(job: JobState) -> None:
+    """Copy a job's summary fields into the list_jobs view."""
+    _pipeline_job_summaries[job.job_id] = {
+        "job_id": job.job_id,
+        "status": job.status,
+        "current_step": job.current_step,
+        "progress": job.progress,
+        "total_products": job.total_products,
+        "completed_count": job.completed_count,
+        "started_at": job.started_at,
+    }
+
+
+@lru_cache(maxsize=32)
+def _get_service(api_key: str | None) -> PerfumeImageService:
+    """Share one service (and its Gemini client connection pool) per API key."""
+    return PerfumeImageService(api_key=api_key)
 
 
 class PerfumePipeline:
@@ -69,7 +155,7 @@ class PerfumePipeline:
 
     def __init__(self, api_key: str | None = None) -> None:
         self._api_key = api_key
-        self._service = PerfumeImageService(api_key=api_key)
+        self._service = _get_service(api_key)
 
     async def start_batch(
         self,
@@ -86,37 +172,28 @@ class PerfumePipeline:
         Returns job_id for tracking.
         """
         cfg = config or PerfumePipelineConfig()
-        job_id = str(uuid.uuid4())[:8]
+        job_id = secrets.token_hex(4)
 
         if product_indices is None:
             product_indices = list(range(len(products)))
         else:
             product_indices = [i for i in product_indices if 0 <= i < len(products)]
 
-        job: dict[str, Any] = {
-            "job_id": job_id,
-            "status": "running",
-            "current_step": "generate",
-            "progress": 40,
-            "message": "Starting image generation...",
-            "products": products,
-            "product_indices": product_indices,
-            "total_products": len(product_indices),
-            "current_product": 0,
-            "current_product_name": "",
-            "completed_count": 0,
-            "results": [],
-            "reference_images": reference_images,
-            "product_dna": product_dna,
-            "gender_avatars": gender_avatars,
-            "inspiration_dna": inspiration_dna,
-            "config": cfg,
-            "paused": False,
-            "cancel": False,
-            "started_at": time.time(),
-        }
+        job = JobState(
+            job_id=job_id,
+            products=products,
+            product_indices=product_indices,
+            reference_images=reference_images,
+            config=cfg,
+            product_dna=product_dna,
+            gender_avatars=gender_avatars,
+            inspiration_dna=inspiration_dna,
+        )
+        job.resume_event.set()
 
         _pipeline_jobs[job_id] = job
+        _sync_summary(job)
+        _evict()
 
         # Fire background task
         asyncio.create_task(self._run_generation(job_id))
@@ -128,121 +205,177 @@ class PerfumePipeline:
         return job_id
 
     async def _run_generation(self, job_id: str) -> None:
-        """Background coroutine: generate images for each product with pause/cancel."""
+        """Background coroutine: generate images for all products concurrently with pause/cancel."""
         job = _pipeline_jobs[job_id]
-        products = job["products"]
-        product_indices = job["product_indices"]
-        reference_images = job["reference_images"]
-        product_dna = job["product_dna"]
-        gender_avatars = job["gender_avatars"]
-        inspiration_dna = job["inspiration_dna"]
-        cfg: PerfumePipelineConfig = job["config"]
+        products = job.products
+        product_indices = job.product_indices
+        reference_images = job.reference_images
+        product_dna = job.product_dna
+        gender_avatars = job.gender_avatars
+        inspiration_dna = job.inspiration_dna
+        cfg = job.config
 
         total = len(product_indices)
-
-        for loop_idx, product_idx in enumerate(product_indices):
-            # Cancel check
-            if job.get("cancel"):
-                job["status"] = "cancelled"
-                job["message"] = f"Cancelled after {loop_idx} products"
-                logger.info("Job %s cancelled at product %d/%d", job_id, loop_idx, total)
-                return
-
-            # Pause check
-            while job.get("paused"):
-                job["status"] = "paused"
-                job["message"] = f"Paused at product {loop_idx + 1}/{total}"
-                await asyncio.sleep(0.5)
-                if job.get("cancel"):
-                    job["status"] = "cancelled"
+        sem = asyncio.Semaphore(cfg.max_concurrency)
+        # Checked once per job: skips the per-product log call when INFO is off
+        log_info = logger.isEnabledFor(logging.INFO)
+        # Progress within the generate step (40-95%), indexed by completed count
+        start = STEPS["configure"][0]
+        progress_table = tuple(start + (i * 55) // max(total, 1) for i in range(total + 1))
+
+        # Read each product's fields once, as parallel tuples indexed by loop_idx
+        selected = [products[i] for i in product_indices]
+        names = tuple(
+            p.get("cleaned_name") or p.get("perfume_name", f"Product {idx + 1}")
+            for p, idx in zip(selected, product_indices)
+        )
+        brands = tuple(p.get("brand_name", "") for p in selected)
+        inspired = tuple(p.get("inspired_by", "") for p in selected)
+        genders = tuple(p.get("gender", "unisex") for p in selected)
+        cleaned = tuple(p.get("cleaned_name", "") for p in selected)
+        notes = tuple(p.get("notes") or None for p in selected)
+
+        # Build every product's progress message before any awaits
+        messages = tuple(f"Generating {names[i]} ({i + 1}/{total})" for i in range(total))
+
+        async def _run_one(loop_idx: int, product_idx: int) -> None:
+            async with sem:
+                # Cancel check
+                if job.cancel:
                     return
 
-            job["status"] = "running"
-            product = products[product_idx]
-            perfume_name = product.get("cleaned_name") or product.get("perfume_name", f"Product {product_idx + 1}")
-            job["current_product"] = loop_idx + 1
-            job["current_product_name"] = perfume_name
-
-            # Calculate progress within the generate step (40-95%)
-            progress = 40 + int((loop_idx / total) * 55)
-            job["progress"] = progress
-            job["message"] = f"Generating {perfume_name} ({loop_idx + 1}/{total})"
-
-            logger.info("Job %s [%d/%d] Generating: %s", job_id, loop_idx + 1, total, perfume_name)
-
-            # Build PerfumeInfo
-            notes_data = product.get("notes", {})
-            perfume_info = PerfumeInfo(
-                perfume_name=perfume_name,
-                brand_name=product.get("brand_name", ""),
-                inspired_by=product.get("inspired_by", ""),
-                gender=product.get("gender", "unisex"),
-                cleaned_name=product.get("cleaned_name", ""),
-                notes=PerfumeNotes(**notes_data) if notes_data else None,
-            )
-
-            try:
-                images = await self._service.generate_styled_images(
-                    perfume_info=perfume_info,
-                    reference_images=reference_images,
-                    product_dna=product_dna,
-                    gender_avatars=gender_avatars,
-                    inspiration_dna=inspiration_dna,
-                    images_per_product=cfg.images_per_product,
-                    aspect_ratio=cfg.aspect_ratio,
-                )
-                job["results"].append({
-                    "perfume_name": perfume_name,
-                    "brand_name": product.get("brand_name", ""),
-                    "product_index": product_idx,
-                    "status": "success",
-                    "images": images,
-                    "count": len(images),
-                })
-            except Exception as e:
-                logger.exception("Job %s failed for %s", job_id, perfume_name)
-                job["results"].append({
-                    "perfume_name": perfume_name,
-                    "brand_name": product.get("brand_name", ""),
-                    "product_index": product_idx,
-                    "status": "error",
-                    "error": str(e),
-                    "images": [],
-                    "count": 0,
-                })
-
-            job["completed_count"] = loop_idx + 1
-
-        job["status"] = "completed"
-        job["progress"] = 100
-        job["current_step"] = "complete"
-        job["message"] = f"Complete: {len(job['results'])} products processed"
-        logger.info("Job %s completed: %d products", job_id, len(job["results"]))
+                # Pause check
+                resume_event = job.resume_event
+                if not resume_event.is_set():
+                    job.status = "paused"
+                    _sync_summary(job)
+                    job.message = f"Paused at product {job.completed_count + 1}/{total}"
+                    await resume_event.wait()
+                    if job.cancel:
+                        return
+
+                job.status = "running"
+                _sync_summary(job)
+                perfume_name = names[loop_idx]
+                brand_name = brands[loop_idx]
+                job.current_product = loop_idx + 1
+                job.current_product_name = perfume_name
+                job.message = messages[loop_idx]
+
+                if log_info:
+                    logger.info("Job %s [%d/%d] Generating: %s", job_id, loop_idx + 1, total, perfume_name)
+
+                try:
+                    # Products come straight from the client's request body, so a
+                    # malformed one fails validation here as that product's error
+                    notes_data = notes[loop_idx]
+                    perfume_info = PerfumeInfo(
+                        perfume_name=perfume_name,
+                        brand_name=brand_name,
+                        inspired_by=inspired[loop_idx],
+                        gender=genders[loop_idx],
+                        cleaned_name=cleaned[loop_idx],
+                        notes=PerfumeNotes(**notes_data) if notes_data else None,
+                    )
+                    images = await self._service.generate_styled_images(
+                        perfume_info=perfume_info,
+                        reference_images=reference_images,
+                        product_dna=product_dna,
+                        gender_avatars=gender_avatars,
+                        inspiration_dna=inspiration_dna,
+                        images_per_product=cfg.images_per_product,
+                        aspect_ratio=cfg.aspect_ratio,
+                    )
+                    result = {
+                        "perfume_name": perfume_name,
+                        "brand_name": brand_name,
+                        "product_index": product_idx,
+                        "status": "success",
+                        "images": images,
+                        "count": len(images),
+                    }
+                except Exception as e:
+                    logger.exception("Job %s failed for %s", job_id, perfume_name)
+                    result = {
+                        "perfume_name": perfume_name,
+                        "brand_name": brand_name,
+                        "product_index": product_idx,
+                        "status": "error",
+                        "error": str(e),
+                        "images": [],
+                        "count": 0,
+                    }
+
+                # No await between these updates, so concurrent products can't interleave them
+                job.results.append(result)
+                job.completed_count += 1
+                job.progress = progress_table[job.completed_count]
+                _sync_summary(job)
+
+        # Products are independent network-bound calls, so fan them out. Each
+        # product records its own errors; anything escaping _run_one is a bug
+        # that fails the job rather than passing as a short "completed" batch
+        outcomes = await asyncio.gather(
+            *(_run_one(loop_idx, product_idx) for loop_idx, product_idx in enumerate(product_indices)),
+            return_exceptions=True,
+        )
+        crashed = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        for exc in crashed:
+            logger.error("Job %s product task crashed", job_id, exc_info=exc)
+        if crashed and not job.cancel:
+            job.status = "failed"
+            job.message = f"Failed: {len(crashed)} product tasks crashed ({crashed[0]})"
+            job.finished_at = time.time()
+            _pipeline_jobs.move_to_end(job_id)
+            _sync_summary(job)
+            return
+
+        if job.cancel:
+            job.status = "cancelled"
+            job.message = f"Cancelled after {job.completed_count} products"
+            job.finished_at = time.time()
+            _pipeline_jobs.move_to_end(job_id)
+            _sync_summary(job)
+            logger.info("Job %s cancelled at product %d/%d", job_id, job.completed_count, total)
+            return
+
+        job.status = "completed"
+        job.progress = STEPS["complete"][0]
+        job.current_step = "complete"
+        job.message = f"Complete: {len(job.results)} products processed"
+        job.finished_at = time.time()
+        _pipeline_jobs.move_to_end(job_id)
+        _sync_summary(job)
+        logger.info("Job %s completed: %d products", job_id, len(job.results))
 
     @staticmethod
     def pause(job_id: str) -> bool:
         """Pause a running job."""
         job = _pipeline_jobs.get(job_id)
-        if not job or job["status"] in ("completed", "cancelled"):
+        if not job or job.status in ("completed", "cancelled", "failed"):
             return False
-        job["paused"] = True
+        job.paused = True
+        job.resume_event.clear()
         return True
 
     @staticmethod
     def resume(job_id: str) -> bool:
         """Resume a paused job."""
         job = _pipeline_jobs.get(job_id)
-        if not job or job["status"] in ("completed", "cancelled"):
+        if not job or job.status in ("completed", "cancelled", "failed"):
             return False
-        job["paused"] = False
+        job.paused = False
+        job.resume_event.set()
         return True
 
     @staticmethod
     def cancel(job_id: str) -> bool:
         """Cancel a running or paused job."""
         job = _pipeline_jobs.get(job_id)
-        if not job or job["status"] == "completed":
+        if not job or job.status in ("completed", "failed"):
             return False
-        job["cancel"] = True
-        job["paused"] = False
+        job.cancel = True
+        job.paused = False
+        # Wake paused workers so they see the cancel flag
+        job.resume_event.set()
         return True
@@ -4,40 +4,405 @@ Two independent batch operations:
 1. White-background generation (1 image per product)
 2. Inspiration-based styled generation (N angles per product)
 
-Each supports pause/resume/cancel with 2-second frontend polling.
+Each supports pause/resume/cancel. Clients either poll the job status or
+stream it as server-sent events (stream_job_events).
 """
 
 import asyncio
+import itertools
 import logging
+import secrets
 import time
-import uuid
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
+import orjson
+
+from app.config import settings
 from app.services.product_studio_service import ProductStudioService, STYLED_ANGLES
+from app.utils.job_archive import JobArchive
 
 logger = logging.getLogger(__name__)
 
-# In-memory job storage (separate from perfume pipeline)
-_jobs: dict[str, dict[str, Any]] = {}
+# Max products generated at once per job; each is an independent API call
+DEFAULT_CONCURRENCY = 4
 
+# Jobs running at once; later ones wait in "queued" so concurrent batches
+# can't multiply the per-job fan-out against the API rate limit
+MAX_CONCURRENT_JOBS = 2
+_job_sem = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
 
-def get_job(job_id: str) -> dict[str, Any] | None:
-    return _jobs.get(job_id)
+# Job ids are a per-process counter behind a random prefix: unique within the
+# process, and across restarts (archived ids outlive the process)
+_JOB_ID_PREFIX = secrets.token_hex(3)
+_job_counter = itertools.count(1)
 
+# Strong references to running job tasks (the loop only keeps weak ones)
+_job_tasks: set[asyncio.Task] = set()
 
-def list_jobs() -> list[dict[str, Any]]:
-    return [
-        {
-            "job_id": j["job_id"],
-            "job_type": j["job_type"],
-            "status": j["status"],
-            "progress": j.get("progress", 0),
-            "total_products": j.get("total_products", 0),
-            "completed_count": j.get("completed_count", 0),
-            "started_at": j.get("started_at", 0),
+# Clients poll every 1-2s, so progress text needn't change more often than this
+_UPDATE_INTERVAL_NS = 250_000_000
+
+def _set_event() -> asyncio.Event:
+    event = asyncio.Event()
+    event.set()
+    return event
+
+
+@dataclass(slots=True)
+class ResultRow:
+    """Outcome for one product; serialized with as_dict at the API boundary."""
+
+    product_index: int
+    perfume_name: str
+    status: str
+    image_url: str | None = None
+    error: str | None = None
+    images: list[dict] | None = None
+    count: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "product_index": self.product_index,
+            "perfume_name": self.perfume_name,
+            "status": self.status,
+        }
+        if self.image_url is not None:
+            row["image_url"] = self.image_url
+        if self.error is not None:
+            row["error"] = self.error
+        if self.images is not None:
+            row["images"] = self.images
+        if self.count is not None:
+            row["count"] = self.count
+        return row
+
+
+@dataclass(slots=True)
+class Job:
+    """Mutable state of one product studio batch job."""
+
+    job_id: str
+    job_type: str
+    message: str
+    products: list[dict]
+    aspect_ratio: str
+    product_indices: list[int]
+    concurrency: int
+    # White-bg inputs
+    bottle_images: dict[int, str] = field(default_factory=dict)
+    brand_name: str = ""
+    logo_url: str | None = None
+    # Inspiration inputs
+    white_bg_images: dict[int, str] = field(default_factory=dict)
+    inspiration_images: list[str] = field(default_factory=list)
+    angles_per_product: int = 0
+    # Progress
+    status: str = "running"
+    progress: int = 0
+    completed_count: int = 0
+    current_product_name: str = ""
+    results: list[ResultRow | None] = field(default_factory=list)
+    # Encoded JSON array of the finished results; reset when a slot is written
+    results_json: bytes | None = None
+    paused: bool = False
+    cancel_event: asyncio.Event = field(default_factory=asyncio.Event)
+    resume_event: asyncio.Event = field(default_factory=_set_event)
+    # Wall clock for display; monotonic ns for durations, immune to clock jumps
+    started_at: float = field(default_factory=time.time)
+    started_ns: int = field(default_factory=time.monotonic_ns)
+    finished_ns: int | None = None
+    # Throttle stamps for _due_for_update, one per kind of update
+    last_message_ns: int = 0
+    last_progress_ns: int = 0
+    # One queue per open event stream, fed by _publish
+    subscribers: set[asyncio.Queue] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        # One slot per selected product, filled by position as each finishes
+        self.results = [None] * len(self.product_indices)
+
+    @property
+    def total_products(self) -> int:
+        return len(self.product_indices)
+
+    @property
+    def elapsed_sec(self) -> float:
+        end = self.finished_ns if self.finished_ns is not None else time.monotonic_ns()
+        return (end - self.started_ns) / 1e9
+
+    def to_record(self) -> dict[str, Any]:
+        """Snapshot the pollable state of a finished job for the archive."""
+        return {
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "aspect_ratio": self.aspect_ratio,
+            "product_indices": self.product_indices,
+            "completed_count": self.completed_count,
+            "current_product_name": self.current_product_name,
+            "results": [row.as_dict() if row is not None else None for row in self.results],
+            "started_at": self.started_at,
+            "elapsed_sec": self.elapsed_sec,
         }
-        for j in _jobs.values()
-    ]
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "Job":
+        """Rebuild a read-only Job from an archived record (inputs are not kept)."""
+        job = cls(
+            job_id=record["job_id"],
+            job_type=record["job_type"],
+            message=record["message"],
+            products=[],
+            aspect_ratio=record["aspect_ratio"],
+            product_indices=record["product_indices"],
+            concurrency=1,
+            status=record["status"],
+            progress=record["progress"],
+            completed_count=record["completed_count"],
+            current_product_name=record["current_product_name"],
+            started_at=record["started_at"],
+        )
+        job.results = [ResultRow(**row) if row is not None else None for row in record["results"]]
+        job.finished_ns = job.started_ns + int(record["elapsed_sec"] * 1e9)
+        return job
+
+
+# In-memory job storage (separate from perfume pipeline); finished jobs are
+# moved to _archive, keeping a decoded copy of the most recent ones so polls
+# of a just-finished job don't hit sqlite
+_jobs: dict[str, Job] = {}
+_archive = JobArchive(settings.PRODUCT_STUDIO_ARCHIVE_PATH)
+_recent_jobs: OrderedDict[str, Job] = OrderedDict()
+_MAX_RECENT_JOBS = 256
+
+# Summary view of each job for list_jobs, kept in sync at every state change.
+# Finished jobs keep their summary (independently of _recent_jobs) up to
+# _MAX_FINISHED_SUMMARIES, seeded from the archive at startup
+_MAX_FINISHED_SUMMARIES = 256
+_job_summaries: dict[str, dict[str, Any]] = {}
+
+# Encoded JSON of each summary, dropped by _sync_summary when it goes stale
+_summary_json: dict[str, bytes] = {}
+
+
+class _JobCancelled(Exception):
+    """Raised when a job is cancelled while a generation call is in flight."""
+
+
+_T = TypeVar("_T")
+
+
+async def _unless_cancelled(job: Job, call: Awaitable[_T]) -> _T:
+    """Await ``call``, abandoning it as soon as the job's cancel_event fires."""
+    task = asyncio.ensure_future(call)
+    cancelled = asyncio.ensure_future(job.cancel_event.wait())
+    try:
+        await asyncio.wait({task, cancelled}, return_when=asyncio.FIRST_COMPLETED)
+        if task.done():
+            return task.result()
+        raise _JobCancelled
+    finally:
+        # Also runs if we are cancelled ourselves (e.g. shutdown_jobs), so
+        # neither inner task outlives this call
+        for inner in (task, cancelled):
+            if not inner.done():
+                inner.cancel()
+        await asyncio.gather(task, cancelled, return_exceptions=True)
+
+
+def _new_job_id() -> str:
+    return f"{_JOB_ID_PREFIX}{next(_job_counter):x}"
+
+
+def _spawn(job_run: Awaitable[None]) -> None:
+    task = asyncio.ensure_future(job_run)
+    _job_tasks.add(task)
+    task.add_done_callback(_job_tasks.discard)
+
+
+async def shutdown_jobs() -> None:
+    """Cancel every queued or running job task and wait for them to exit."""
+    tasks = list(_job_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.to_thread(_archive.close)
+
+
+async def load_archived_summaries() -> None:
+    """Restore list_jobs entries for the most recently archived jobs."""
+    try:
+        records = await asyncio.to_thread(_archive.recent, _MAX_FINISHED_SUMMARIES)
+    except Exception:
+        logger.exception("Failed to load archived job summaries")
+        return
+    for record in reversed(records):
+        if record["job_id"] not in _job_summaries:
+            _job_summaries[record["job_id"]] = _new_summary(Job.from_record(record))
+
+
+def _due_for_update(job: Job, stamp: str) -> bool:
+    """Rate-limit one kind of job update to one per _UPDATE_INTERVAL_NS.
+
+    ``stamp`` names the Job field holding that update's last time, so message
+    and progress updates are throttled independently.
+    """
+    now = time.monotonic_ns()
+    if now - getattr(job, stamp) < _UPDATE_INTERVAL_NS:
+        return False
+    setattr(job, stamp, now)
+    return True
+
+
+def _int_keys(images: dict) -> dict[int, str]:
+    """Key a product-index -> image map by int (JSON bodies arrive with str keys)."""
+    return {int(k): v for k, v in images.items() if str(k).isdigit()}
+
+
+def _display_name(product: dict, index: int) -> str:
+    return product.get("cleaned_name") or product.get("perfume_name", f"Product {index + 1}")
+
+
+async def get_job(job_id: str) -> Job | None:
+    job = _jobs.get(job_id) or _recent_jobs.get(job_id)
+    if job is not None:
+        return job
+    try:
+        record = await asyncio.to_thread(_archive.get, job_id)
+    except Exception:
+        logger.exception("Failed to read archived job %s", job_id)
+        return None
+    if not record:
+        return None
+    job = Job.from_record(record)
+    _remember_finished(job)
+    return job
+
+
+def _remember_finished(job: Job) -> None:
+    """Cache a decoded finished job; list_jobs summaries are left alone."""
+    _recent_jobs[job.job_id] = job
+    _recent_jobs.move_to_end(job.job_id)
+    while len(_recent_jobs) > _MAX_RECENT_JOBS:
+        _recent_jobs.popitem(last=False)
+
+
+def _trim_finished_summaries() -> None:
+    """Drop the oldest finished-job summaries beyond _MAX_FINISHED_SUMMARIES."""
+    finished = [job_id for job_id in _job_summaries if job_id not in _jobs]
+    for job_id in finished[:-_MAX_FINISHED_SUMMARIES]:
+        _job_summaries.pop(job_id, None)
+        _summary_json.pop(job_id, None)
+
+
+async def _archive_job(job: Job) -> None:
+    """Move a finished job out of memory; it stays in memory if the write fails."""
+    record = job.to_record()
+    try:
+        await asyncio.to_thread(_archive.put, job.job_id, record)
+    except Exception:
+        logger.exception("Failed to archive job %s", job.job_id)
+        return
+    _jobs.pop(job.job_id, None)
+    _remember_finished(Job.from_record(record))
+    _trim_finished_summaries()
+
+
+def encode_job_status(job: Job) -> bytes:
+    """Encode the pollable status of a job (with finished results) as JSON."""
+    if job.results_json is None:
+        job.results_json = orjson.dumps([row.as_dict() for row in job.results if row is not None])
+    head = orjson.dumps({
+        "job_id": job.job_id,
+        "job_type": job.job_type,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "total_products": job.total_products,
+        "current_product_name": job.current_product_name,
+        "completed_count": job.completed_count,
+        "paused": job.paused,
+        "elapsed_sec": round(job.elapsed_sec, 1),
+    })
+    # Splice the cached results array in as the last key
+    return head[:-1] + b',"results":' + job.results_json + b"}"
+
+
+async def stream_job_events(job: Job) -> AsyncIterator[tuple[str, bytes]]:
+    """Yield ("status", full status), then progress/result deltas until "done".
+
+    Finished (including archived) jobs yield only their status.
+    """
+    queue: asyncio.Queue[tuple[str, bytes]] = asyncio.Queue()
+    job.subscribers.add(queue)
+    try:
+        yield "status", encode_job_status(job)
+        if job.finished_ns is not None:
+            return
+        while True:
+            event, data = await queue.get()
+            yield event, data
+            if event == "done":
+                return
+    finally:
+        job.subscribers.discard(queue)
+
+
+def _publish(job: Job, event: str, data: bytes) -> None:
+    for queue in job.subscribers:
+        queue.put_nowait((event, data))
+
+
+def list_jobs() -> list[dict[str, Any]]:
+    return list(_job_summaries.values())
+
+
+def encode_job_list() -> bytes:
+    """Encode list_jobs() as a JSON array, re-encoding only changed summaries."""
+    parts = []
+    for job_id, summary in _job_summaries.items():
+        encoded = _summary_json.get(job_id)
+        if encoded is None:
+            encoded = _summary_json[job_id] = orjson.dumps(summary)
+        parts.append(encoded)
+    return b"[" + b",".join(parts) + b"]"
+
+
+def _new_summary(job: Job) -> dict[str, Any]:
+    return {
+        "job_id": job.job_id,
+        "job_type": job.job_type,
+        "status": job.status,
+        "progress": job.progress,
+        "total_products": job.total_products,
+        "completed_count": job.completed_count,
+        "started_at": job.started_at,
+    }
+
+
+def _sync_summary(job: Job) -> None:
+    """Refresh the mutable fields of a job's list_jobs summary in place."""
+    _summary_json.pop(job.job_id, None)
+    summary = _job_summaries.get(job.job_id)
+    if summary is None:
+        _job_summaries[job.job_id] = _new_summary(job)
+        return
+    summary["status"] = job.status
+    summary["progress"] = job.progress
+    summary["completed_count"] = job.completed_count
+    if job.subscribers:
+        _publish(job, "progress", orjson.dumps({
+            "status": job.status,
+            "progress": job.progress,
+            "completed_count": job.completed_count,
+            "current_product_name": job.current_product_name,
+            "message": job.message,
+        }))
 
 
 class ProductStudioPipeline:
@@ -56,99 +421,63 @@ class ProductStudioPipeline:
         logo_url: str | None = None,
         aspect_ratio: str = "1:1",
         product_indices: list[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> str:
         """Start white-background generation for selected products."""
-        job_id = str(uuid.uuid4())[:8]
+        job_id = _new_job_id()
 
         if product_indices is None:
             product_indices = list(range(len(products)))
         else:
             product_indices = [i for i in product_indices if 0 <= i < len(products)]
 
-        job: dict[str, Any] = {
-            "job_id": job_id,
-            "job_type": "white_bg",
-            "status": "running",
-            "progress": 0,
-            "message": "Starting white-background generation...",
-            "products": products,
-            "bottle_images": bottle_images,
-            "brand_name": brand_name,
-            "logo_url": logo_url,
-            "aspect_ratio": aspect_ratio,
-            "product_indices": product_indices,
-            "total_products": len(product_indices),
-            "completed_count": 0,
-            "current_product_name": "",
-            "results": [],
-            "paused": False,
-            "cancel": False,
-            "started_at": time.time(),
-        }
+        job = Job(
+            job_id=job_id,
+            job_type="white_bg",
+            message="Starting white-background generation...",
+            products=products,
+            aspect_ratio=aspect_ratio,
+            product_indices=product_indices,
+            concurrency=max(1, concurrency),
+            bottle_images=_int_keys(bottle_images),
+            brand_name=brand_name,
+            logo_url=logo_url,
+        )
         _jobs[job_id] = job
-        asyncio.create_task(self._run_white_bg(job_id))
+        _sync_summary(job)
+        _spawn(self._run_white_bg(job_id))
         logger.info("White-bg job %s: %d products", job_id, len(product_indices))
         return job_id
 
     async def _run_white_bg(self, job_id: str) -> None:
         job = _jobs[job_id]
-        products = job["products"]
-        indices = job["product_indices"]
-        bottle_images = job["bottle_images"]
-        total = len(indices)
-
-        for loop_idx, prod_idx in enumerate(indices):
-            if job.get("cancel"):
-                job["status"] = "cancelled"
-                job["message"] = f"Cancelled after {loop_idx} products"
-                return
-
-            while job.get("paused"):
-                job["status"] = "paused"
-                await asyncio.sleep(0.5)
-                if job.get("cancel"):
-                    job["status"] = "cancelled"
-                    return
-
-            job["status"] = "running"
-            product = products[prod_idx]
-            name = product.get("cleaned_name") or product.get("perfume_name", f"Product {prod_idx + 1}")
-            job["current_product_name"] = name
-            job["progress"] = int((loop_idx / total) * 100)
-            job["message"] = f"Generating white-bg for {name} ({loop_idx + 1}/{total})"
-
-            bottle_path = bottle_images.get(prod_idx) or bottle_images.get(str(prod_idx))
-
+        # (name, brand, bottle image) per selected product, resolved once
+        resolved = [
+            (
+                _display_name(job.products[i], i),
+                job.products[i].get("brand_name") or job.brand_name,
+                job.bottle_images.get(i),
+            )
+            for i in job.product_indices
+        ]
+
+        async def _generate(prod_idx: int, name: str, brand: str, bottle_path: str | None) -> ResultRow:
             try:
-                image_url = await self._service.generate_white_bg(
+                image_url = await _unless_cancelled(job, self._service.generate_white_bg(
                     product_name=name,
-                    brand_name=product.get("brand_name") or job["brand_name"],
+                    brand_name=brand,
                     bottle_image_path=bottle_path,
-                    logo_url=job.get("logo_url"),
-                    aspect_ratio=job["aspect_ratio"],
-                )
-                job["results"].append({
-                    "product_index": prod_idx,
-                    "perfume_name": name,
-                    "status": "success",
-                    "image_url": image_url,
-                })
+                    logo_url=job.logo_url,
+                    aspect_ratio=job.aspect_ratio,
+                ))
+            except _JobCancelled:
+                raise
             except Exception as e:
                 logger.exception("White-bg failed for %s", name)
-                job["results"].append({
-                    "product_index": prod_idx,
-                    "perfume_name": name,
-                    "status": "error",
-                    "error": str(e),
-                    "image_url": "",
-                })
-
-            job["completed_count"] = loop_idx + 1
+                return ResultRow(prod_idx, name, "error", image_url="", error=str(e))
+            return ResultRow(prod_idx, name, "success", image_url=image_url)
 
-        job["status"] = "completed"
-        job["progress"] = 100
-        job["message"] = f"Complete: {total} products processed"
-        logger.info("White-bg job %s completed", job_id)
+        await self._run_batch(job, resolved, "white-bg", _generate)
 
     # ─── Inspiration/Styled Batch ─────────────────────────────────
 
@@ -160,131 +489,189 @@ class ProductStudioPipeline:
         angles_per_product: int = 5,
         aspect_ratio: str = "1:1",
         product_indices: list[int] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> str:
         """Start inspiration-based styled generation for selected products."""
-        job_id = str(uuid.uuid4())[:8]
+        job_id = _new_job_id()
 
         if product_indices is None:
             product_indices = list(range(len(products)))
         else:
             product_indices = [i for i in product_indices if 0 <= i < len(products)]
 
-        job: dict[str, Any] = {
-            "job_id": job_id,
-            "job_type": "inspiration",
-            "status": "running",
-            "progress": 0,
-            "message": "Starting styled generation...",
-            "products": products,
-            "white_bg_images": white_bg_images,
-            "inspiration_images": inspiration_images,
-            "angles_per_product": min(angles_per_product, len(STYLED_ANGLES)),
-            "aspect_ratio": aspect_ratio,
-            "product_indices": product_indices,
-            "total_products": len(product_indices),
-            "completed_count": 0,
-            "current_product_name": "",
-            "results": [],
-            "paused": False,
-            "cancel": False,
-            "started_at": time.time(),
-        }
+        job = Job(
+            job_id=job_id,
+            job_type="inspiration",
+            message="Starting styled generation...",
+            products=products,
+            aspect_ratio=aspect_ratio,
+            product_indices=product_indices,
+            concurrency=max(1, concurrency),
+            white_bg_images=_int_keys(white_bg_images),
+            inspiration_images=inspiration_images,
+            angles_per_product=min(angles_per_product, len(STYLED_ANGLES)),
+        )
         _jobs[job_id] = job
-        asyncio.create_task(self._run_inspiration(job_id))
-        logger.info("Inspiration job %s: %d products, %d angles", job_id, len(product_indices), job["angles_per_product"])
+        _sync_summary(job)
+        _spawn(self._run_inspiration(job_id))
+        logger.info("Inspiration job %s: %d products, %d angles", job_id, len(product_indices), job.angles_per_product)
         return job_id
 
     async def _run_inspiration(self, job_id: str) -> None:
         job = _jobs[job_id]
-        products = job["products"]
-        indices = job["product_indices"]
-        white_bg_images = job["white_bg_images"]
-        inspiration_images = job["inspiration_images"]
-        angles = STYLED_ANGLES[:job["angles_per_product"]]
-        total = len(indices)
-
-        for loop_idx, prod_idx in enumerate(indices):
-            if job.get("cancel"):
-                job["status"] = "cancelled"
-                job["message"] = f"Cancelled after {loop_idx} products"
-                return
+        angles = STYLED_ANGLES[:job.angles_per_product]
+        # (name, brand, white-bg image) per selected product, resolved once
+        resolved = [
+            (
+                _display_name(job.products[i], i),
+                job.products[i].get("brand_name", ""),
+                job.white_bg_images.get(i),
+            )
+            for i in job.product_indices
+        ]
+
+        async def _generate(prod_idx: int, name: str, brand: str, white_bg_path: str | None) -> ResultRow:
+            outcomes = await _unless_cancelled(job, self._service.generate_styled_batch(
+                product_name=name,
+                brand_name=brand,
+                white_bg_image_path=white_bg_path,
+                inspiration_images=job.inspiration_images,
+                angles=angles,
+                aspect_ratio=job.aspect_ratio,
+            ))
 
-            while job.get("paused"):
-                job["status"] = "paused"
-                await asyncio.sleep(0.5)
-                if job.get("cancel"):
-                    job["status"] = "cancelled"
-                    return
+            product_images: list[dict] = []
+            success_count = 0
+            for angle, outcome in zip(angles, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.warning("Styled %s failed for %s: %s", angle["key"], name, outcome)
+                    outcome = {
+                        "style": angle["key"],
+                        "label": angle["label"],
+                        "status": "error",
+                        "error": str(outcome),
+                        "image_url": "",
+                    }
+                elif outcome["status"] == "success":
+                    success_count += 1
+                product_images.append(outcome)
 
-            job["status"] = "running"
-            product = products[prod_idx]
-            name = product.get("cleaned_name") or product.get("perfume_name", f"Product {prod_idx + 1}")
-            job["current_product_name"] = name
-            job["progress"] = int((loop_idx / total) * 100)
-            job["message"] = f"Generating styled images for {name} ({loop_idx + 1}/{total})"
+            return ResultRow(
+                prod_idx, name, "success" if success_count > 0 else "error",
+                images=product_images, count=success_count,
+            )
 
-            white_bg_path = white_bg_images.get(prod_idx) or white_bg_images.get(str(prod_idx))
+        await self._run_batch(job, resolved, "styled images", _generate)
+
+    # ─── Shared Runner ────────────────────────────────────────────
+
+    async def _run_batch(
+        self,
+        job: Job,
+        resolved: list[tuple[str, str, str | None]],
+        action: str,
+        generate: Callable[[int, str, str, str | None], Awaitable[ResultRow]],
+    ) -> None:
+        """Run ``generate`` for every selected product with pause/cancel/progress handling.
+
+        ``resolved`` holds (name, brand, image path) per product in job order;
+        ``generate`` raises _JobCancelled to abandon its product.
+        """
+        if _job_sem.locked():
+            job.status = "queued"
+            job.message = "Waiting for other jobs to finish..."
+            _sync_summary(job)
+        async with _job_sem:
+            await self._run_batch_slot(job, resolved, action, generate)
+
+    async def _run_batch_slot(
+        self,
+        job: Job,
+        resolved: list[tuple[str, str, str | None]],
+        action: str,
+        generate: Callable[[int, str, str, str | None], Awaitable[ResultRow]],
+    ) -> None:
+        total = job.total_products
+        sem = asyncio.Semaphore(job.concurrency)
+
+        async def _process_one(loop_idx: int, prod_idx: int) -> None:
+            async with sem:
+                if not job.resume_event.is_set():
+                    job.status = "paused"
+                    _sync_summary(job)
+                    await job.resume_event.wait()
+                if job.cancel_event.is_set():
+                    return
+
+                if job.status != "running":
+                    job.status = "running"
+                    _sync_summary(job)
+                name, brand, image_path = resolved[loop_idx]
+                if _due_for_update(job, "last_message_ns"):
+                    job.current_product_name = name
+                    job.message = f"Generating {action} for {name} ({job.completed_count + 1}/{total})"
 
-            product_images: list[dict] = []
-            for angle in angles:
-                if job.get("cancel"):
-                    break
                 try:
-                    result = await self._service.generate_styled_angle(
-                        product_name=name,
-                        brand_name=product.get("brand_name", ""),
-                        white_bg_image_path=white_bg_path,
-                        inspiration_images=inspiration_images,
-                        angle=angle,
-                        aspect_ratio=job["aspect_ratio"],
-                    )
-                    product_images.append(result)
+                    row = await generate(prod_idx, name, brand, image_path)
+                except _JobCancelled:
+                    return
                 except Exception as e:
-                    logger.warning("Styled %s failed for %s: %s", angle["key"], name, e)
-                    product_images.append({
-                        "style": angle["key"],
-                        "label": angle["label"],
-                        "image_url": f"Error: {e}",
-                    })
-
-            success_count = sum(1 for img in product_images if img.get("image_url") and not img["image_url"].startswith("Error"))
-            job["results"].append({
-                "product_index": prod_idx,
-                "perfume_name": name,
-                "status": "success" if success_count > 0 else "error",
-                "images": product_images,
-                "count": success_count,
-            })
-            job["completed_count"] = loop_idx + 1
-
-        job["status"] = "completed"
-        job["progress"] = 100
-        job["message"] = f"Complete: {total} products processed"
-        logger.info("Inspiration job %s completed", job_id)
+                    logger.exception("Generating %s failed for %s", action, name)
+                    row = ResultRow(prod_idx, name, "error", image_url="", error=str(e))
+                job.results[loop_idx] = row
+                job.results_json = None
+                if job.subscribers:
+                    _publish(job, "result", orjson.dumps(row.as_dict()))
+
+                job.completed_count += 1
+                if job.completed_count == total or _due_for_update(job, "last_progress_ns"):
+                    job.progress = int((job.completed_count / total) * 100)
+                    _sync_summary(job)
+
+        # Finalize even if the batch is torn down, so the job never stays "running"
+        try:
+            await asyncio.gather(*(_process_one(i, p) for i, p in enumerate(job.product_indices)))
+        finally:
+            job.finished_ns = time.monotonic_ns()
+            if job.cancel_event.is_set():
+                job.status = "cancelled"
+                job.message = f"Cancelled after {job.completed_count} products"
+            else:
+                job.status = "completed"
+                job.progress = 100
+                job.message = f"Complete: {total} products processed"
+                logger.info("%s job %s completed in %.1fs", job.job_type, job.job_id, job.elapsed_sec)
+            _sync_summary(job)
+            if job.subscribers:
+                _publish(job, "done", encode_job_status(job))
+            await _archive_job(job)
 
     # ─── Job Controls ─────────────────────────────────────────────
 
     @staticmethod
     def pause(job_id: str) -> bool:
         job = _jobs.get(job_id)
-        if not job or job["status"] in ("completed", "cancelled"):
+        if not job or job.status in ("completed", "cancelled"):
             return False
-        job["paused"] = True
+        job.paused = True
+        job.resume_event.clear()
         return True
 
     @staticmethod
     def resume(job_id: str) -> bool:
         job = _jobs.get(job_id)
-        if not job or job["status"] in ("completed", "cancelled"):
+        if not job or job.status in ("completed", "cancelled"):
             return False
-        job["paused"] = False
+        job.paused = False
+        job.resume_event.set()
         return True
 
     @staticmethod
     def cancel(job_id: str) -> bool:
         job = _jobs.get(job_id)
-        if not job or job["status"] == "completed":
+        if not job or job.status == "completed":
             return False
-        job["cancel"] = True
-        job["paused"] = False
+        job.cancel_event.set()
+        job.paused = False
+        job.resume_event.set()
         return True
@@ -1,11 +1,17 @@
 import asyncio
+import hashlib
 import logging
-import math
+import random
+import re
+import time
 import traceback
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
-import httpx
+import orjson
 
+from app.config import settings
 from app.models.schemas import AvatarDNA, GenerationRequest, Script, BackgroundSetting, Platform
 from app.services.script_service import ScriptService
 from app.services.image_service import ImageService
@@ -17,16 +23,31 @@ from app.services.storage_service import StorageService
 from app.services.reference_validation_service import ReferenceValidationService
 from app.agents.copilot_agent import CoPilotAgent
 from app.agents.scene_prompt_agent import ScenePromptAgent
-from app.utils.redis_client import publish_progress, subscribe_progress, get_redis
+from app.utils.http_client import get_http_client
+from app.utils.redis_client import avatar_key, publish_progress, subscribe_progress, get_redis
 
 CONSISTENCY_THRESHOLD = 0.75
 MAX_REGEN_ATTEMPTS = 3
+MAX_STALLED_REGENS = 2
+CONSISTENCY_CONCURRENCY = 4
+TTS_CONCURRENCY = 4
 MAX_STEP_RETRIES = 2
+MAX_RETRY_BACKOFF_SEC = 30
 TRANSIENT_STATUS_CODES = {429, 503, 502, 500}
 FRONTEND_URL = "http://localhost:3000"
+PERSIST_DEBOUNCE_SEC = 0.1
+PUBLISH_INTERVAL_SEC = 0.1
+AVATAR_DNA_CACHE_TTL_SEC = 300
+# Where locally stored "/uploads/..." URLs are served from
+PUBLIC_DIR = Path(__file__).resolve().parents[3] / "frontend" / "public"
+CONSISTENCY_CACHE_TTL_SEC = 24 * 3600
+SCORE_CACHE_SIZE = 256
 
 logger = logging.getLogger(__name__)
 
+_retry_random = random.SystemRandom()
+_TRANSIENT_RE = re.compile(r"429|503|502|rate limit|timeout|timed out", re.IGNORECASE)
+
 # Pipeline steps with their progress percentages
 STEPS: list[tuple[str, int, str]] = [
     ("script_generation", 10, "Generating script..."),
@@ -41,6 +62,47 @@ STEPS: list[tuple[str, int, str]] = [
     ("complete", 100, "Video generation complete!"),
 ]
 
+# Step position for resume_from logic
+STEP_INDEX: dict[str, int] = {name: i for i, (name, _, _) in enumerate(STEPS)}
+
+SYSTEM_AVATARS: dict[str, AvatarDNA] = {
+    "system-sarah": AvatarDNA(
+        face="oval face, soft jawline, high cheekbones",
+        skin="light beige, clear complexion",
+        eyes="large brown eyes, natural lashes",
+        hair="shoulder-length wavy brown hair",
+        body="average build, 5'6\"",
+        voice="warm, friendly, mid-range female voice",
+        wardrobe="casual streetwear, earth tones",
+        prohibited_drift="no tattoos, no piercings beyond ears",
+    ),
+    "system-marcus": AvatarDNA(
+        face="square jaw, defined cheekbones",
+        skin="medium brown, even tone",
+        eyes="dark brown eyes, strong brow line",
+        hair="short fade, black hair",
+        body="athletic build, 6'0\"",
+        voice="deep, confident, clear enunciation",
+        wardrobe="clean minimalist, solid colors, tech-casual",
+        prohibited_drift="no facial hair changes, consistent haircut",
+    ),
+}
+
+# User avatar DNA loaded from Redis: avatar_id -> (loaded_at, dna)
+_avatar_dna_cache: dict[str, tuple[float, AvatarDNA]] = {}
+
+
+def _read_upload(img_url: str) -> bytes | None:
+    """Read a locally stored "/uploads/..." file, or return None if it's missing.
+
+    Unbuffered, so the whole file comes back from a single sized read.
+    """
+    try:
+        with open(PUBLIC_DIR / img_url.lstrip("/"), "rb", buffering=0) as f:
+            return f.readall()
+    except FileNotFoundError:
+        return None
+
 
 class VideoPipeline:
     """Orchestrates the full UGC video generation pipeline.
@@ -68,6 +130,15 @@ class VideoPipeline:
         self._consistency_service: ConsistencyService | None = None
         self._storage_service: StorageService | None = None
         self._ref_validation_service: ReferenceValidationService | None = None
+        # Latest unsent artifacts per (job_id, step) and their flusher tasks
+        self._pending_artifacts: dict[tuple[str, str], dict[str, Any]] = {}
+        self._persist_tasks: set[asyncio.Task] = set()
+        # Throttled progress: last send time, latest held-back update and its flusher per job
+        self._last_publish: dict[str, float] = {}
+        self._pending_publish: dict[str, dict[str, Any]] = {}
+        self._publish_flushers: dict[str, asyncio.Task] = {}
+        # Most recent consistency results keyed by image + reference digest
+        self._score_cache: OrderedDict[str, dict] = OrderedDict()
 
     def _init_services(self, api_key: str | None) -> None:
         self._copilot_agent = CoPilotAgent(api_key=api_key)
@@ -83,13 +154,23 @@ class VideoPipeline:
     @staticmethod
     def _is_transient_error(exc: Exception) -> bool:
         """Check if an exception is likely transient (retryable)."""
-        exc_str = str(exc).lower()
-        if any(code_str in exc_str for code_str in ["429", "503", "502", "rate limit", "timeout", "timed out"]):
+        if _TRANSIENT_RE.search(str(exc)):
             return True
         if isinstance(exc, (asyncio.TimeoutError, ConnectionError, OSError)):
             return True
         return False
 
+    @staticmethod
+    def _retry_after(exc: Exception) -> float | None:
+        """Return the Retry-After delay in seconds carried by an HTTP error, if any."""
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if not headers:
+            return None
+        try:
+            return min(max(float(headers.get("retry-after")), 0.0), MAX_RETRY_BACKOFF_SEC)
+        except (TypeError, ValueError):
+            return None
+
     async def _run_with_retry(
         self,
         step_name: str,
@@ -104,9 +185,13 @@ class VideoPipeline:
             except Exception as exc:
                 last_exc = exc
                 if attempt <= max_retries and self._is_transient_error(exc):
-                    wait = 2 ** attempt  # Exponential backoff: 2s, 4s
+                    # Honor the server's Retry-After hint, else full-jitter exponential
+                    # backoff so concurrent jobs don't retry in lockstep
+                    wait = self._retry_after(exc)
+                    if wait is None:
+                        wait = _retry_random.uniform(0, min(2 ** attempt, MAX_RETRY_BACKOFF_SEC))
                     logger.warning(
-                        "Step '%s' failed (attempt %d/%d), retrying in %ds: %s",
+                        "Step '%s' failed (attempt %d/%d), retrying in %.1fs: %s",
                         step_name, attempt, max_retries + 1, wait, exc,
                     )
                     await asyncio.sleep(wait)
@@ -119,53 +204,128 @@ class VideoPipeline:
     ) -> None:
         """Persist step artifacts to the frontend database via webhook."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                await client.post(
-                    f"{FRONTEND_URL}/api/jobs/{job_id}/update-artifacts",
-                    json={"step": step, "artifacts": artifacts},
-                )
+            await get_http_client().post(
+                f"{FRONTEND_URL}/api/jobs/{job_id}/update-artifacts",
+                content=orjson.dumps({"step": step, "artifacts": artifacts}),
+                headers={"content-type": "application/json"},
+                timeout=10.0,
+            )
         except Exception as e:
             logger.warning("Failed to persist artifacts for %s step %s: %s", job_id, step, e)
 
+    def _queue_persist(self, job_id: str, step: str, artifacts: dict[str, Any]) -> None:
+        """Persist artifacts in the background, coalescing bursts per (job_id, step).
+
+        Only the latest artifacts for a key are sent, one POST per debounce window.
+        """
+        key = (job_id, step)
+        flusher_pending = key in self._pending_artifacts
+        self._pending_artifacts[key] = artifacts
+        if flusher_pending:
+            return
+        task = asyncio.create_task(self._flush_artifacts(key))
+        self._persist_tasks.add(task)
+        task.add_done_callback(self._persist_tasks.discard)
+
+    async def _flush_artifacts(self, key: tuple[str, str]) -> None:
+        await asyncio.sleep(PERSIST_DEBOUNCE_SEC)
+        artifacts = self._pending_artifacts.pop(key)
+        await self._persist_artifacts(*key, artifacts)
+
+    async def drain_persists(self) -> None:
+        """Wait for queued artifact persists to be sent."""
+        while self._persist_tasks:
+            await asyncio.gather(*self._persist_tasks, return_exceptions=True)
+
+    def _cached_score(self, key: str) -> dict | None:
+        result = self._score_cache.get(key)
+        if result is not None:
+            self._score_cache.move_to_end(key)
+        return result
+
+    def _cache_score(self, key: str, result: dict) -> None:
+        """Keep a consistency result, evicting the least recently used past SCORE_CACHE_SIZE."""
+        self._score_cache[key] = result
+        self._score_cache.move_to_end(key)
+        while len(self._score_cache) > SCORE_CACHE_SIZE:
+            self._score_cache.popitem(last=False)
+
+    async def _score_consistency(
+        self,
+        images: list[bytes],
+        reference_images: list[bytes],
+        character_dna: dict | None,
+        refs_digest: Any,
+    ) -> list[dict]:
+        """Score character consistency for several images, reusing results for identical bytes.
+
+        ``refs_digest`` is a hasher already fed the references and DNA, so the
+        key covers every scoring input. Hits are served from the in-memory LRU,
+        then Redis (so resumed jobs skip re-scoring); the misses go to the
+        service in one batched call. Mock results aren't cached.
+        """
+        keys = []
+        for image_data in images:
+            h = refs_digest.copy()
+            h.update(image_data)
+            keys.append(h.hexdigest())
+
+        results: list[dict | None] = [self._cached_score(key) for key in keys]
+        missing = [i for i, cached in enumerate(results) if cached is None]
+        if missing:
+            try:
+                r = await get_redis()
+                for i, raw in zip(missing, await r.mget([f"consistency:{keys[i]}" for i in missing])):
+                    if raw:
+                        results[i] = orjson.loads(raw)
+                        self._cache_score(keys[i], results[i])
+            except Exception as e:
+                logger.debug("Consistency cache lookup failed: %s", e)
+            missing = [i for i in missing if results[i] is None]
+
+        if missing:
+            scored = await self._consistency_service.score_character_consistency_batch(
+                images=[images[i] for i in missing],
+                reference_images=reference_images,
+                character_dna=character_dna,
+            )
+            fresh: dict[str, bytes] = {}
+            for i, score_result in zip(missing, scored):
+                results[i] = score_result
+                if not score_result.get("details", {}).get("_mock"):
+                    self._cache_score(keys[i], score_result)
+                    fresh[f"consistency:{keys[i]}"] = orjson.dumps(score_result)
+            if fresh:
+                try:
+                    r = await get_redis()
+                    async with r.pipeline(transaction=False) as pipe:
+                        for redis_key, value in fresh.items():
+                            pipe.set(redis_key, value, ex=CONSISTENCY_CACHE_TTL_SEC)
+                        await pipe.execute()
+                except Exception as e:
+                    logger.debug("Consistency cache store failed: %s", e)
+        return results  # type: ignore[return-value]
+
     async def _fetch_avatar_dna(self, avatar_id: str) -> AvatarDNA | None:
         """Fetch avatar DNA from Redis or return system avatar DNA."""
-        # System avatars
-        SYSTEM_AVATARS = {
-            "system-sarah": AvatarDNA(
-                face="oval face, soft jawline, high cheekbones",
-                skin="light beige, clear complexion",
-                eyes="large brown eyes, natural lashes",
-                hair="shoulder-length wavy brown hair",
-                body="average build, 5'6\"",
-                voice="warm, friendly, mid-range female voice",
-                wardrobe="casual streetwear, earth tones",
-                prohibited_drift="no tattoos, no piercings beyond ears",
-            ),
-            "system-marcus": AvatarDNA(
-                face="square jaw, defined cheekbones",
-                skin="medium brown, even tone",
-                eyes="dark brown eyes, strong brow line",
-                hair="short fade, black hair",
-                body="athletic build, 6'0\"",
-                voice="deep, confident, clear enunciation",
-                wardrobe="clean minimalist, solid colors, tech-casual",
-                prohibited_drift="no facial hair changes, consistent haircut",
-            ),
-        }
-
         # Check system avatars first
         if avatar_id in SYSTEM_AVATARS:
             return SYSTEM_AVATARS[avatar_id]
 
+        cached = _avatar_dna_cache.get(avatar_id)
+        if cached and time.monotonic() - cached[0] < AVATAR_DNA_CACHE_TTL_SEC:
+            return cached[1]
+
         # Fetch from Redis
         try:
             r = await get_redis()
-            raw = await r.get(f"avatar:{avatar_id}")
+            raw = await r.get(avatar_key(avatar_id))
             if raw:
-                import json
-                data = json.loads(raw)
-                if "dna" in data:
-                    return AvatarDNA(**data["dna"])
+                data = orjson.loads(raw)
+                if data.get("dna"):
+                    dna = AvatarDNA(**data["dna"])
+                    _avatar_dna_cache[avatar_id] = (time.monotonic(), dna)
+                    return dna
         except Exception as e:
             logger.error(f"Failed to fetch avatar {avatar_id}: {e}")
 
@@ -180,7 +340,14 @@ class VideoPipeline:
         status: str = "processing",
         data: dict[str, Any] | None = None,
     ) -> None:
-        await publish_progress(job_id, {
+        # A direct publish supersedes any throttled update still held back;
+        # wait out an in-flight one so it can't land after this
+        self._pending_publish.pop(job_id, None)
+        flusher = self._publish_flushers.pop(job_id, None)
+        if flusher is not None:
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+        await self._send_progress(job_id, {
             "job_id": job_id,
             "status": status,
             "current_step": step,
@@ -189,6 +356,50 @@ class VideoPipeline:
             "data": data,
         })
 
+    async def _publish_throttled(self, job_id: str, step: str, progress: int, message: str) -> None:
+        """Publish a per-scene progress update at most every PUBLISH_INTERVAL_SEC.
+
+        Updates arriving faster are coalesced; the latest one in a window is sent.
+        """
+        payload = {
+            "job_id": job_id,
+            "status": "processing",
+            "current_step": step,
+            "progress": progress,
+            "message": message,
+            "data": None,
+        }
+        wait = self._last_publish.get(job_id, 0.0) + PUBLISH_INTERVAL_SEC - time.monotonic()
+        if wait <= 0 and job_id not in self._publish_flushers:
+            await self._send_progress(job_id, payload)
+            return
+        self._pending_publish[job_id] = payload
+        if job_id not in self._publish_flushers:
+            self._publish_flushers[job_id] = asyncio.create_task(self._flush_publish(job_id, wait))
+
+    async def _flush_publish(self, job_id: str, wait: float) -> None:
+        await asyncio.sleep(wait)
+        payload = self._pending_publish.pop(job_id, None)
+        try:
+            if payload is not None:
+                await self._send_progress(job_id, payload)
+        finally:
+            if self._publish_flushers.get(job_id) is asyncio.current_task():
+                del self._publish_flushers[job_id]
+
+    async def _finish_publishing(self, job_id: str) -> None:
+        """Let a held-back progress update go out, then drop the job's throttle state."""
+        flusher = self._publish_flushers.get(job_id)
+        if flusher is not None:
+            await asyncio.gather(flusher, return_exceptions=True)
+        self._publish_flushers.pop(job_id, None)
+        self._pending_publish.pop(job_id, None)
+        self._last_publish.pop(job_id, None)
+
+    async def _send_progress(self, job_id: str, payload: dict[str, Any]) -> None:
+        self._last_publish[job_id] = time.monotonic()
+        await publish_progress(job_id, payload)
+
     async def run(
         self,
         job_id: str,
@@ -236,10 +447,15 @@ class VideoPipeline:
         # Pre-load avatar reference image bytes for consistency scoring
         avatar_ref_bytes: list[bytes] = []
         if avatar_ref_images and self._image_service:
-            for ref_url in avatar_ref_images[:4]:
-                img_data = await self._image_service._load_image(ref_url)
-                if img_data and img_data.get("bytes"):
-                    avatar_ref_bytes.append(img_data["bytes"])
+            # Load the refs concurrently; a failed load just drops that ref
+            loaded = await asyncio.gather(
+                *(self._image_service._load_image(ref_url) for ref_url in avatar_ref_images[:4]),
+                return_exceptions=True,
+            )
+            avatar_ref_bytes = [
+                img_data["bytes"] for img_data in loaded
+                if isinstance(img_data, dict) and img_data.get("bytes")
+            ]
             logger.info(
                 f"Job {job_id}: Pre-loaded {len(avatar_ref_bytes)} avatar ref image bytes "
                 f"for consistency scoring"
@@ -251,21 +467,13 @@ class VideoPipeline:
             refs_by_angle = avatar_dna.reference_images_by_angle
             logger.info(f"Job {job_id}: Avatar has {len(refs_by_angle)} angle-classified references")
 
-        # Step order for resume_from logic
-        step_order = [
-            "script_generation", "scene_prompts", "storyboard",
-            "storyboard_review", "video_generation", "video_extension",
-            "audio_generation", "post_production", "quality_check", "complete",
-        ]
+        resume_index = STEP_INDEX.get(resume_from) if resume_from else None
 
         def _should_skip(step_name: str) -> bool:
             """Check if a step should be skipped when resuming."""
-            if not resume_from:
-                return False
-            try:
-                return step_order.index(step_name) < step_order.index(resume_from)
-            except ValueError:
+            if resume_index is None:
                 return False
+            return STEP_INDEX[step_name] < resume_index
 
         # Load prior artifacts when resuming
         if prior_artifacts:
@@ -280,7 +488,7 @@ class VideoPipeline:
             # --- 1. Script Generation with Vision Analysis ---
             if _should_skip("script_generation"):
                 logger.info("Job %s: Skipping script_generation (resuming from %s)", job_id, resume_from)
-                script = Script(**result["script"]) if isinstance(result.get("script"), dict) else None
+                script = Script.model_validate(result["script"]) if isinstance(result.get("script"), dict) else None
             else:
                 await self._publish(job_id, "script_generation", 10, "Analyzing product images and generating script...")
 
@@ -317,7 +525,7 @@ class VideoPipeline:
                 result["script"] = script.model_dump()
                 logger.info("Job %s: script generated with %d scenes (product: %s, images: %d)",
                            job_id, len(script.scenes), request.product_name or "none", len(request.product_images))
-                await self._persist_artifacts(job_id, "script_generation", {"script": result["script"]})
+                self._queue_persist(job_id, "script_generation", {"script": result["script"]})
 
             assert script is not None, "Script is required to continue"
 
@@ -354,48 +562,71 @@ class VideoPipeline:
             if self._consistency_service and isinstance(storyboard, list) and avatar_ref_images:
                 await self._publish(job_id, "storyboard", 36, "Scoring character consistency...")
 
-                for sb_item in storyboard:
-                    if not isinstance(sb_item, dict):
-                        continue
+                # Dumped once and shared by every scoring call below
+                avatar_dna_dict = avatar_dna.model_dump() if avatar_dna else None
+                refs_digest = hashlib.blake2b(digest_size=20)
+                for ref in avatar_ref_bytes:
+                    refs_digest.update(hashlib.blake2b(ref, digest_size=20).digest())
+                refs_digest.update(orjson.dumps(avatar_dna_dict))
+
+                async def _load_scene_image(sb_item: dict) -> bytes | None:
                     img_url = sb_item.get("image_url", "")
-                    scene_num = sb_item.get("scene_number", "?")
                     if not img_url or not img_url.startswith("/uploads/"):
-                        consistency_scores.append({"scene": scene_num, "score": 0.85})
-                        continue
+                        return None
+                    try:
+                        return await asyncio.to_thread(_read_upload, img_url)
+                    except OSError as e:
+                        logger.warning(
+                            "Consistency scoring failed for scene %s: %s",
+                            sb_item.get("scene_number", "?"), e,
+                        )
+                        return None
+
+                scored_items = [sb_item for sb_item in storyboard if isinstance(sb_item, dict)]
+                scene_images = await asyncio.gather(*(_load_scene_image(sb_item) for sb_item in scored_items))
 
+                # First pass: score every scene image in one batched vision call
+                scene_scores = [0.85] * len(scored_items)
+                present = [i for i, img_bytes in enumerate(scene_images) if img_bytes is not None]
+                if present:
                     try:
-                        from pathlib import Path
-                        backend_dir = Path(__file__).resolve().parents[2]
-                        img_path = backend_dir.parent / "frontend" / "public" / img_url.lstrip("/")
-                        if not img_path.exists():
-                            consistency_scores.append({"scene": scene_num, "score": 0.85})
-                            continue
-
-                        img_bytes = img_path.read_bytes()
-                        score_result = await self._consistency_service.score_character_consistency(
-                            image_data=img_bytes,
-                            reference_images=avatar_ref_bytes,
-                            character_dna=avatar_dna.model_dump() if avatar_dna else None,
+                        batch_results = await self._score_consistency(
+                            [scene_images[i] for i in present],
+                            avatar_ref_bytes,
+                            avatar_dna_dict,
+                            refs_digest,
                         )
-                        score = score_result.get("score", 0.85)
-                        consistency_scores.append({"scene": scene_num, "score": score})
+                        for i, score_result in zip(present, batch_results):
+                            scene_scores[i] = score_result.get("score", 0.85)
+                    except Exception as e:
+                        logger.warning("Consistency scoring failed for storyboard: %s", e)
+                        present = []
+
+                sem = asyncio.Semaphore(CONSISTENCY_CONCURRENCY)
 
-                        # Auto-retry if score below threshold
-                        if score < CONSISTENCY_THRESHOLD:
+                async def _regen_scene(sb_item: dict, score: float) -> float:
+                    """Regenerate one low-scoring storyboard image while below threshold."""
+                    scene_num = sb_item.get("scene_number", "?")
+                    async with sem:
+                        try:
+                            # Attempts stay sequential since each keeps the best image so far;
+                            # stop on a failed regen or once retries stop improving the score
+                            stalled = 0
+                            scene_script = Script(
+                                title=script.title,
+                                scenes=[s for s in script.scenes if str(s.scene_number) == str(scene_num)],
+                                total_duration=script.total_duration,
+                                style_notes=script.style_notes,
+                            )
                             for attempt in range(2, MAX_REGEN_ATTEMPTS + 1):
-                                await self._publish(
+                                await self._publish_throttled(
                                     job_id, "storyboard", 36,
                                     f"Scene {scene_num} consistency {score:.0%} < {CONSISTENCY_THRESHOLD:.0%}. "
                                     f"Regenerating (attempt {attempt}/{MAX_REGEN_ATTEMPTS})...",
                                 )
                                 # Regenerate single scene with per-scene angle-matched refs
                                 regen_result = await self._image_service.generate_storyboard(
-                                    script=Script(
-                                        title=script.title,
-                                        scenes=[s for s in script.scenes if str(s.scene_number) == str(scene_num)],
-                                        total_duration=script.total_duration,
-                                        style_notes=script.style_notes,
-                                    ),
+                                    script=scene_script,
                                     avatar_dna=avatar_dna,
                                     avatar_reference_images=avatar_ref_images,
                                     reference_images_by_angle=refs_by_angle,
@@ -404,26 +635,43 @@ class VideoPipeline:
                                     product_dna=getattr(request, 'product_dna', None),
                                     aspect_ratio=request.aspect_ratio,
                                 )
-                                if regen_result and isinstance(regen_result, list) and regen_result[0].get("image_url"):
-                                    new_url = regen_result[0]["image_url"]
-                                    new_path = backend_dir.parent / "frontend" / "public" / new_url.lstrip("/")
-                                    if new_path.exists():
-                                        new_score_result = await self._consistency_service.score_character_consistency(
-                                            image_data=new_path.read_bytes(),
-                                            reference_images=avatar_ref_bytes,
-                                            character_dna=avatar_dna.model_dump() if avatar_dna else None,
-                                        )
-                                        new_score = new_score_result.get("score", 0.0)
-                                        if new_score > score:
-                                            sb_item["image_url"] = new_url
-                                            score = new_score
-                                            consistency_scores[-1] = {"scene": scene_num, "score": score}
-                                            logger.info("Scene %s improved to %.2f on attempt %d", scene_num, score, attempt)
-                                            if score >= CONSISTENCY_THRESHOLD:
-                                                break
-                    except Exception as e:
-                        logger.warning("Consistency scoring failed for scene %s: %s", scene_num, e)
-                        consistency_scores.append({"scene": scene_num, "score": 0.85})
+                                if not (regen_result and isinstance(regen_result, list) and regen_result[0].get("image_url")):
+                                    break
+                                new_url = regen_result[0]["image_url"]
+                                new_bytes = await asyncio.to_thread(_read_upload, new_url)
+                                if new_bytes is None:
+                                    break
+                                [new_score_result] = await self._score_consistency(
+                                    [new_bytes],
+                                    avatar_ref_bytes,
+                                    avatar_dna_dict,
+                                    refs_digest,
+                                )
+                                new_score = new_score_result.get("score", 0.0)
+                                if new_score > score:
+                                    sb_item["image_url"] = new_url
+                                    score = new_score
+                                    stalled = 0
+                                    logger.info("Scene %s improved to %.2f on attempt %d", scene_num, score, attempt)
+                                else:
+                                    stalled += 1
+                                if score >= CONSISTENCY_THRESHOLD or stalled >= MAX_STALLED_REGENS:
+                                    break
+                        except Exception as e:
+                            logger.warning("Consistency scoring failed for scene %s: %s", scene_num, e)
+                            return 0.85
+                        return score
+
+                # Low scorers regenerate concurrently; attempts within a scene stay sequential
+                regen_indices = [i for i in present if scene_scores[i] < CONSISTENCY_THRESHOLD]
+                for i, score in zip(regen_indices, await asyncio.gather(
+                    *(_regen_scene(scored_items[i], scene_scores[i]) for i in regen_indices)
+                )):
+                    scene_scores[i] = score
+                consistency_scores = [
+                    {"scene": sb_item.get("scene_number", "?"), "score": score}
+                    for sb_item, score in zip(scored_items, scene_scores)
+                ]
 
             result["storyboard"] = storyboard
             result["consistency_scores"] = consistency_scores
@@ -431,7 +679,7 @@ class VideoPipeline:
                 job_id, "storyboard", 38, "Storyboard generated.",
                 data={"storyboard": storyboard, "consistency_scores": consistency_scores},
             )
-            await self._persist_artifacts(job_id, "storyboard", {
+            self._queue_persist(job_id, "storyboard", {
                 "storyboard": storyboard,
                 "consistencyScores": consistency_scores,
             })
@@ -465,31 +713,43 @@ class VideoPipeline:
                     return result
 
             # --- 5. Video Generation ---
-            await self._publish(job_id, "video_generation", 50, "Generating video clips...")
-            video_clips: list[dict[str, str]] = []
             total_scenes = len(scene_prompts)
-            for i, prompt in enumerate(scene_prompts):
-                progress = 50 + int((i / total_scenes) * 20)
-                await self._publish(
-                    job_id, "video_generation", progress,
-                    f"Generating video for scene {i + 1}/{total_scenes}...",
-                )
+            await self._publish(job_id, "video_generation", 50, f"Generating {total_scenes} video clips...")
+            video_sem = asyncio.Semaphore(settings.VIDEO_CONCURRENCY)
 
-                async def _gen_video(p=prompt, idx=i):
+            async def _gen_scene_video(idx: int, prompt: str) -> tuple[int, dict[str, str]]:
+                async def _gen_video():
                     return await self._video_service.generate_video(
-                        scene_prompt=p,
+                        scene_prompt=prompt,
                         duration=int(script.scenes[idx].duration_seconds) if idx < len(script.scenes) else 5,
                     )
 
-                clip = await self._run_with_retry(f"video_scene_{i+1}", _gen_video)
-                video_clips.append(clip)
+                async with video_sem:
+                    return idx, await self._run_with_retry(f"video_scene_{idx + 1}", _gen_video)
+
+            # Clips render concurrently; slots keep scene order, progress follows completion
+            video_clips: list[dict[str, str]] = [{}] * total_scenes
+            video_tasks = [asyncio.ensure_future(_gen_scene_video(i, p)) for i, p in enumerate(scene_prompts)]
+            try:
+                for done, next_clip in enumerate(asyncio.as_completed(video_tasks), start=1):
+                    idx, clip = await next_clip
+                    video_clips[idx] = clip
+                    await self._publish_throttled(
+                        job_id, "video_generation", 50 + int((done / total_scenes) * 20),
+                        f"Generated video for scene {idx + 1} ({done}/{total_scenes} done)",
+                    )
+            except BaseException:
+                for task in video_tasks:
+                    task.cancel()
+                raise
             result["video_clips"] = video_clips
-            await self._persist_artifacts(job_id, "video_generation", {
+            self._queue_persist(job_id, "video_generation", {
                 "videoScenes": video_clips,
             })
 
             # --- 6. Video Extension ---
             await self._publish(job_id, "video_extension", 75, "Checking if video extension is needed...")
+            extension_plan: list[tuple[int, dict[str, str], str, float]] = []
             for i, clip in enumerate(video_clips):
                 if clip.get("status") != "completed" or not clip.get("video_url"):
                     continue
@@ -504,60 +764,80 @@ class VideoPipeline:
                     logger.warning("Scene %d missing original_uri, skipping extension", i + 1)
                     continue
 
-                # Calculate extensions needed (each adds ~7s)
-                num_ext = min(math.ceil((scene_dur - 8) / 7), 20)
-                logger.info("Scene %d needs %ds, extending %d time(s)", i + 1, scene_dur, num_ext)
-
-                current_uri = original_uri
-                scene_prompt = scene_prompts[i] if i < len(scene_prompts) else "Continue the scene naturally"
+                logger.info("Scene %d needs %ds, extending", i + 1, scene_dur)
+                extension_plan.append((i, clip, original_uri, scene_dur))
 
-                for ext_num in range(1, num_ext + 1):
-                    await self._publish(
-                        job_id, "video_extension",
-                        75 + int((ext_num / num_ext) * 10),
-                        f"Extending scene {i + 1}, extension {ext_num}/{num_ext}...",
-                    )
+            scenes_extended = 0
 
-                    extended = await self._video_service.extend_video(
-                        video_uri=current_uri,
-                        prompt=scene_prompt,
+            async def _extend_scene(i: int, clip: dict[str, str], original_uri: str, scene_dur: float) -> None:
+                nonlocal scenes_extended
+                async with video_sem:
+                    extended = await self._video_service.extend_video_to_duration(
+                        video_uri=original_uri,
+                        prompt=scene_prompts[i] if i < len(scene_prompts) else "Continue the scene naturally",
+                        target_seconds=scene_dur,
                         scene_number=i + 1,
-                        extension_number=ext_num,
                     )
+                if extended.get("status") == "completed":
+                    clip["video_url"] = extended.get("video_url", clip["video_url"])
+                    clip["extended"] = True
+                    clip["total_extensions"] = extended["total_extensions"]
+                scenes_extended += 1
+                await self._publish_throttled(
+                    job_id, "video_extension",
+                    75 + int((scenes_extended / len(extension_plan)) * 10),
+                    f"Extended scene {i + 1} ({scenes_extended}/{len(extension_plan)} done)",
+                )
 
-                    if extended.get("status") == "completed":
-                        current_uri = extended.get("original_uri", current_uri)
-                        clip["video_url"] = extended.get("video_url", clip["video_url"])
-                        clip["extended"] = True
-                        clip["total_extensions"] = ext_num
-                        logger.info("Scene %d extended to ~%ds", i + 1, 8 + ext_num * 7)
-                    else:
-                        logger.warning("Extension %d failed for scene %d, stopping", ext_num, i + 1)
-                        break
+            # Scenes extend concurrently; the service chains each scene's extensions
+            await asyncio.gather(*(_extend_scene(*plan) for plan in extension_plan))
 
             result["video_clips_extended"] = video_clips
 
             # --- 7. Audio Generation ---
             await self._publish(job_id, "audio_generation", 85, "Generating voiceover audio...")
-            audio_clips: list[dict[str, str]] = []
 
             # Build voice config from request
             voice_config = {
                 "name": getattr(request, 'voice', 'Kore'),
                 "speed": "1.0",
             }
+            tts_sem = asyncio.Semaphore(TTS_CONCURRENCY)
+
+            async def _gen_scene_audio(scene) -> dict[str, str]:
+                async def _gen_audio():
+                    return await self._audio_service.generate_tts(text=scene.dialogue, voice_config=voice_config)
+
+                async with tts_sem:
+                    return await self._run_with_retry(f"audio_{scene.scene_number}", _gen_audio)
 
-            for scene in script.scenes:
-                if scene.dialogue.strip():
-                    async def _gen_audio(text=scene.dialogue, vc=voice_config):
-                        return await self._audio_service.generate_tts(text=text, voice_config=vc)
-                    audio = await self._run_with_retry(f"audio_{scene.scene_number}", _gen_audio)
-                    audio_clips.append(audio)
+            # Independent per-scene TTS calls run concurrently; gather keeps scene order
+            audio_clips: list[dict[str, str]] = list(await asyncio.gather(
+                *(_gen_scene_audio(scene) for scene in script.scenes if scene.dialogue.strip())
+            ))
             result["audio_clips"] = audio_clips
-            await self._persist_artifacts(job_id, "audio", {
+            self._queue_persist(job_id, "audio", {
                 "audioUrl": audio_clips[0].get("audio_url") if audio_clips else None,
             })
 
+            # Storyboard images for the cross-scene quality check are final by now;
+            # read them in the background while post-production runs
+            async def _read_storyboard_images() -> list[bytes]:
+                storyboard_urls = [
+                    sb_item.get("image_url", "")
+                    for sb_item in (storyboard if isinstance(storyboard, list) else [])
+                    if isinstance(sb_item, dict)
+                ]
+                # Files are read concurrently in worker threads
+                loaded = await asyncio.gather(*(
+                    asyncio.to_thread(_read_upload, img_url)
+                    for img_url in storyboard_urls
+                    if img_url and img_url.startswith("/uploads/")
+                ))
+                return [img_bytes for img_bytes in loaded if img_bytes is not None]
+
+            storyboard_images_task = asyncio.ensure_future(_read_storyboard_images())
+
             # --- 8. Post Production (FFmpeg stitching) ---
             await self._publish(job_id, "post_production", 92, "Stitching final video...")
 
@@ -639,7 +919,7 @@ class VideoPipeline:
 
             result["final_video_url"] = final_video_url
             result["video_clips_urls"] = [clip.get("video_url") for clip in video_clips if clip.get("video_url")]
-            await self._persist_artifacts(job_id, "assembly", {
+            self._queue_persist(job_id, "assembly", {
                 "finalVideoUrl": final_video_url,
             })
 
@@ -647,16 +927,7 @@ class VideoPipeline:
             await self._publish(job_id, "quality_check", 97, "Running consistency checks...")
             quality_score = 0.95  # Default
             try:
-                # Collect storyboard images for cross-scene consistency
-                storyboard_images = []
-                for sb_item in (storyboard if isinstance(storyboard, list) else []):
-                    img_url = sb_item.get("image_url", "") if isinstance(sb_item, dict) else ""
-                    if img_url and img_url.startswith("/uploads/"):
-                        from pathlib import Path
-                        backend_dir = Path(__file__).resolve().parents[2]
-                        img_path = backend_dir.parent / "frontend" / "public" / img_url.lstrip("/")
-                        if img_path.exists():
-                            storyboard_images.append(img_path.read_bytes())
+                storyboard_images = await storyboard_images_task
 
                 if len(storyboard_images) >= 2 and self._consistency_service:
                     cross_scene = await self._consistency_service.check_cross_scene_consistency(
@@ -689,6 +960,10 @@ class VideoPipeline:
             result["status"] = "failed"
             result["error"] = str(exc)
             return result
+        finally:
+            # Flush queued persists before the caller's event loop shuts down
+            await self.drain_persists()
+            await self._finish_publishing(job_id)
 
     async def run_single_step(
         self,
@@ -708,64 +983,78 @@ class VideoPipeline:
         self._init_services(api_key)
         result: dict[str, Any] = {"job_id": job_id, "step": step}
 
-        script_data = context.get("script")
-        script = Script(**script_data) if script_data else None
-
-        if step == "storyboard" and script:
-            avatar_dna = AvatarDNA(**context["avatar_dna"]) if context.get("avatar_dna") else None
-            scene_numbers = context.get("scene_numbers", [])
-
-            # Extract angle-aware references from avatar DNA
-            step_refs_by_angle = None
-            if avatar_dna and avatar_dna.reference_images_by_angle:
-                step_refs_by_angle = avatar_dna.reference_images_by_angle
-
-            if scene_numbers:
-                # Regenerate specific scenes only
-                scenes_to_regen = [s for s in script.scenes if s.scene_number in scene_numbers]
-                partial_script = Script(
-                    title=script.title,
-                    scenes=scenes_to_regen,
-                    total_duration=sum(s.duration_seconds for s in scenes_to_regen),
-                    style_notes=script.style_notes,
+        try:
+            script_data = context.get("script")
+            script = Script.model_validate(script_data) if script_data else None
+
+            if step == "storyboard" and script:
+                avatar_dna = AvatarDNA(**context["avatar_dna"]) if context.get("avatar_dna") else None
+                scene_numbers = context.get("scene_numbers", [])
+
+                # Extract angle-aware references from avatar DNA
+                step_refs_by_angle = None
+                if avatar_dna and avatar_dna.reference_images_by_angle:
+                    step_refs_by_angle = avatar_dna.reference_images_by_angle
+
+                if scene_numbers:
+                    # Regenerate specific scenes only
+                    scenes_to_regen = [s for s in script.scenes if s.scene_number in scene_numbers]
+                    partial_script = Script(
+                        title=script.title,
+                        scenes=scenes_to_regen,
+                        total_duration=sum(s.duration_seconds for s in scenes_to_regen),
+                        style_notes=script.style_notes,
+                    )
+                else:
+                    partial_script = script
+
+                storyboard = await self._image_service.generate_storyboard(
+                    script=partial_script,
+                    avatar_dna=avatar_dna,
+                    avatar_reference_images=context.get("avatar_reference_images", []),
+                    reference_images_by_angle=step_refs_by_angle,
+                    product_name=context.get("product_name"),
+                    product_images=context.get("product_images", []),
+                    product_dna=context.get("product_dna"),
+                    aspect_ratio=context.get("aspect_ratio", "9:16"),
                 )
-            else:
-                partial_script = script
+                result["storyboard"] = storyboard
+
+            elif step == "video" and script:
+                await self._publish(job_id, "video_generation", 50, "Re-generating video clips...")
+                # Re-run video generation step using existing scene prompts
+                scene_prompts = context.get("scene_prompts", [])
+                video_sem = asyncio.Semaphore(settings.VIDEO_CONCURRENCY)
+
+                async def _regen_scene_video(i: int, prompt: str) -> dict[str, str]:
+                    async with video_sem:
+                        return await self._video_service.generate_video(
+                            scene_prompt=prompt,
+                            duration=int(script.scenes[i].duration_seconds) if i < len(script.scenes) else 5,
+                        )
 
-            storyboard = await self._image_service.generate_storyboard(
-                script=partial_script,
-                avatar_dna=avatar_dna,
-                avatar_reference_images=context.get("avatar_reference_images", []),
-                reference_images_by_angle=step_refs_by_angle,
-                product_name=context.get("product_name"),
-                product_images=context.get("product_images", []),
-                product_dna=context.get("product_dna"),
-                aspect_ratio=context.get("aspect_ratio", "9:16"),
-            )
-            result["storyboard"] = storyboard
+                # Scenes regenerate concurrently; gather keeps scene order
+                video_clips = list(await asyncio.gather(
+                    *(_regen_scene_video(i, prompt) for i, prompt in enumerate(scene_prompts))
+                ))
+                result["video_clips"] = video_clips
 
-        elif step == "video" and script:
-            await self._publish(job_id, "video_generation", 50, "Re-generating video clips...")
-            # Re-run video generation step using existing scene prompts
-            scene_prompts = context.get("scene_prompts", [])
-            video_clips = []
-            for i, prompt in enumerate(scene_prompts):
-                clip = await self._video_service.generate_video(
-                    scene_prompt=prompt,
-                    duration=int(script.scenes[i].duration_seconds) if i < len(script.scenes) else 5,
-                )
-                video_clips.append(clip)
-            result["video_clips"] = video_clips
+            elif step == "audio" and script:
+                tts_sem = asyncio.Semaphore(TTS_CONCURRENCY)
 
-        elif step == "audio" and script:
-            audio_clips = []
-            for scene in script.scenes:
-                if scene.dialogue.strip():
-                    audio = await self._audio_service.generate_tts(text=scene.dialogue)
-                    audio_clips.append(audio)
-            result["audio_clips"] = audio_clips
+                async def _regen_scene_audio(dialogue: str) -> dict[str, str]:
+                    async with tts_sem:
+                        return await self._audio_service.generate_tts(text=dialogue)
 
-        return result
+                # Dialogue lines synthesize concurrently; gather keeps scene order
+                audio_clips = list(await asyncio.gather(
+                    *(_regen_scene_audio(scene.dialogue) for scene in script.scenes if scene.dialogue.strip())
+                ))
+                result["audio_clips"] = audio_clips
+
+            return result
+        finally:
+            await self._finish_publishing(job_id)
 
     async def _wait_for_approval(self, job_id: str, timeout: int = 600) -> bool:
         """Wait for storyboard approval signal via Redis pub/sub."""
@@ -4,22 +4,40 @@ from __future__ import annotations
 
 import base64
 import logging
+import time
 import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
+from redis.exceptions import WatchError
 
 from app.middleware.auth import AuthUser, get_current_user
 
 from app.services.avatar_vision_service import AvatarVisionService
 from app.services.reference_validation_service import ReferenceValidationService
+from app.utils.redis_client import avatar_key, get_redis
+from app.utils.uploads import save_upload
 
 router = APIRouter(prefix="/api/v1/avatars", tags=["avatars"])
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_vision_service() -> AvatarVisionService:
+    """Shared AvatarVisionService, so its Gemini client is built once per process."""
+    return AvatarVisionService()
+
+
+@lru_cache(maxsize=1)
+def get_reference_service() -> ReferenceValidationService:
+    """Shared ReferenceValidationService, so its Gemini client is built once per process."""
+    return ReferenceValidationService()
+
+
 class AvatarDNA(BaseModel):
     """Avatar DNA model."""
     gender: str = ""
@@ -63,12 +81,74 @@ class ExtractDNAResponse(BaseModel):
     dna: AvatarDNA
 
 
-# In-memory avatar storage (replace with database in production)
-_avatars: dict[str, dict] = {}
+# Avatars live in Redis so every worker sees the same set: one JSON blob per
+# avatar under avatar_key() (the video pipeline reads DNA from it too), plus an
+# index sorted by creation time. avatars:version is bumped on every write,
+# letting each worker reuse its built list until something changes.
+_AVATAR_INDEX_KEY = "avatars:index"
+_AVATAR_VERSION_KEY = "avatars:version"
+_avatar_list_cache: tuple[str | None, list[AvatarResponse]] | None = None
+
+
+async def _load_avatar(avatar_id: str) -> dict | None:
+    r = await get_redis()
+    raw = await r.get(avatar_key(avatar_id))
+    return orjson.loads(raw) if raw else None
+
+
+async def _store_avatar(avatar_data: dict) -> None:
+    r = await get_redis()
+    async with r.pipeline(transaction=True) as pipe:
+        pipe.set(avatar_key(avatar_data["id"]), orjson.dumps(avatar_data))
+        # nx keeps an updated avatar at its original position in the list
+        pipe.zadd(_AVATAR_INDEX_KEY, {avatar_data["id"]: time.time()}, nx=True)
+        pipe.incr(_AVATAR_VERSION_KEY)
+        await pipe.execute()
+
+
+async def _update_avatar(avatar_id: str, update: Callable[[dict], None]) -> bool:
+    """Apply ``update`` to a stored avatar atomically; False if it doesn't exist.
+
+    Uses WATCH/MULTI so concurrent updates (e.g. two angle uploads) retry on
+    top of each other instead of overwriting one another.
+    """
+    r = await get_redis()
+    key = avatar_key(avatar_id)
+    async with r.pipeline(transaction=True) as pipe:
+        while True:
+            try:
+                await pipe.watch(key)
+                raw = await pipe.get(key)
+                if not raw:
+                    await pipe.unwatch()
+                    return False
+                avatar = orjson.loads(raw)
+                update(avatar)
+                pipe.multi()
+                pipe.set(key, orjson.dumps(avatar))
+                pipe.incr(_AVATAR_VERSION_KEY)
+                await pipe.execute()
+                return True
+            except WatchError:
+                continue
+
+
+async def _remove_avatar(avatar_id: str) -> bool:
+    r = await get_redis()
+    async with r.pipeline(transaction=True) as pipe:
+        pipe.delete(avatar_key(avatar_id))
+        pipe.zrem(_AVATAR_INDEX_KEY, avatar_id)
+        pipe.incr(_AVATAR_VERSION_KEY)
+        deleted, _, _ = await pipe.execute()
+    return bool(deleted)
 
 
 @router.post("/extract-dna", response_model=ExtractDNAResponse)
-async def extract_dna(request: ExtractDNARequest, current_user: AuthUser = Depends(get_current_user)) -> ExtractDNAResponse:
+async def extract_dna(
+    request: ExtractDNARequest,
+    current_user: AuthUser = Depends(get_current_user),
+    vision_service: AvatarVisionService = Depends(get_vision_service),
+) -> ExtractDNAResponse:
     """Extract avatar DNA from an uploaded image using Gemini Vision.
 
     This endpoint analyzes a person's image and extracts detailed visual
@@ -78,8 +158,6 @@ async def extract_dna(request: ExtractDNARequest, current_user: AuthUser = Depen
     if not request.image_url and not request.image_base64:
         raise HTTPException(status_code=400, detail="Either image_url or image_base64 is required")
 
-    vision_service = AvatarVisionService()
-
     try:
         if request.image_base64:
             # Extract from base64 image
@@ -108,6 +186,7 @@ async def upload_avatar_image(
     file: UploadFile = File(...),
     extract_dna: bool = Form(default=True),
     current_user: AuthUser = Depends(get_current_user),
+    vision_service: AvatarVisionService = Depends(get_vision_service),
 ) -> dict:
     """Upload an avatar reference image and optionally extract DNA.
 
@@ -117,9 +196,6 @@ async def upload_avatar_image(
         raise HTTPException(status_code=400, detail="File must be an image")
 
     try:
-        # Read file content
-        content = await file.read()
-
         # Save to frontend public directory
         backend_dir = Path(__file__).resolve().parents[2]
         frontend_dir = backend_dir.parent / "frontend"
@@ -131,9 +207,8 @@ async def upload_avatar_image(
         filename = f"avatar-{uuid.uuid4().hex[:8]}{ext}"
         filepath = uploads_dir / filename
 
-        # Write file
-        with open(filepath, "wb") as f:
-            f.write(content)
+        # Stream to disk; the bytes are only loaded if DNA extraction needs them
+        await save_upload(file, filepath)
 
         image_url = f"/uploads/avatars/{filename}"
         logger.info(f"Saved avatar image: {image_url}")
@@ -142,7 +217,8 @@ async def upload_avatar_image(
 
         # Optionally extract DNA
         if extract_dna:
-            vision_service = AvatarVisionService()
+            await file.seek(0)
+            content = await file.read()
             dna = await vision_service.extract_dna_from_image(content, file.content_type)
             result["dna"] = dna
 
@@ -154,7 +230,11 @@ async def upload_avatar_image(
 
 
 @router.post("", response_model=AvatarResponse)
-async def create_avatar(request: AvatarCreate, current_user: AuthUser = Depends(get_current_user)) -> AvatarResponse:
+async def create_avatar(
+    request: AvatarCreate,
+    current_user: AuthUser = Depends(get_current_user),
+    vision_service: AvatarVisionService = Depends(get_vision_service),
+) -> AvatarResponse:
     """Create a new platform avatar.
 
     If reference_image_url or reference_image_base64 is provided and no DNA,
@@ -167,8 +247,6 @@ async def create_avatar(request: AvatarCreate, current_user: AuthUser = Depends(
 
     # Extract DNA from image if not provided
     if not dna and (request.reference_image_url or request.reference_image_base64):
-        vision_service = AvatarVisionService()
-
         if request.reference_image_base64:
             extracted_dna = await vision_service.extract_dna_from_image(
                 request.reference_image_base64
@@ -191,7 +269,7 @@ async def create_avatar(request: AvatarCreate, current_user: AuthUser = Depends(
         "reference_images": reference_images,
         "dna": dna.model_dump() if dna else None,
     }
-    _avatars[avatar_id] = avatar_data
+    await _store_avatar(avatar_data)
 
     return AvatarResponse(**avatar_data)
 
@@ -199,25 +277,35 @@ async def create_avatar(request: AvatarCreate, current_user: AuthUser = Depends(
 @router.get("", response_model=list[AvatarResponse])
 async def list_avatars(current_user: AuthUser = Depends(get_current_user)) -> list[AvatarResponse]:
     """List all platform avatars."""
-    return [AvatarResponse(**avatar) for avatar in _avatars.values()]
+    global _avatar_list_cache
+    r = await get_redis()
+    version = await r.get(_AVATAR_VERSION_KEY)
+    if _avatar_list_cache is not None and _avatar_list_cache[0] == version:
+        return _avatar_list_cache[1]
+
+    ids = await r.zrange(_AVATAR_INDEX_KEY, 0, -1)
+    raws = await r.mget([avatar_key(i) for i in ids]) if ids else []
+    avatars = [AvatarResponse(**orjson.loads(raw)) for raw in raws if raw]
+    _avatar_list_cache = (version, avatars)
+    return avatars
 
 
 @router.get("/{avatar_id}", response_model=AvatarResponse)
 async def get_avatar(avatar_id: str, current_user: AuthUser = Depends(get_current_user)) -> AvatarResponse:
     """Get a specific avatar by ID."""
-    if avatar_id not in _avatars:
+    avatar = await _load_avatar(avatar_id)
+    if avatar is None:
         raise HTTPException(status_code=404, detail="Avatar not found")
 
-    return AvatarResponse(**_avatars[avatar_id])
+    return AvatarResponse(**avatar)
 
 
 @router.delete("/{avatar_id}")
 async def delete_avatar(avatar_id: str, current_user: AuthUser = Depends(get_current_user)) -> dict:
     """Delete an avatar."""
-    if avatar_id not in _avatars:
+    if not await _remove_avatar(avatar_id):
         raise HTTPException(status_code=404, detail="Avatar not found")
 
-    del _avatars[avatar_id]
     return {"status": "deleted", "id": avatar_id}
 
 
@@ -227,14 +315,17 @@ class ClassifyAnglesRequest(BaseModel):
 
 
 @router.post("/{avatar_id}/classify-angles")
-async def classify_angles(avatar_id: str, request: ClassifyAnglesRequest, current_user: AuthUser = Depends(get_current_user)) -> dict:
+async def classify_angles(
+    avatar_id: str,
+    request: ClassifyAnglesRequest,
+    current_user: AuthUser = Depends(get_current_user),
+    ref_service: ReferenceValidationService = Depends(get_reference_service),
+) -> dict:
     """Auto-classify uploaded images into angle categories.
 
     Takes a list of image URLs and returns a mapping of angle -> URL,
     plus validation of required angle coverage.
     """
-    ref_service = ReferenceValidationService()
-
     try:
         # Classify each image
         reference_angles = await ref_service.load_and_classify_images(request.image_urls)
@@ -242,10 +333,11 @@ async def classify_angles(avatar_id: str, request: ClassifyAnglesRequest, curren
         # Validate coverage
         validation = await ref_service.validate_character_references(reference_angles)
 
-        # Update avatar in memory store if exists
-        if avatar_id in _avatars:
-            _avatars[avatar_id]["reference_angles"] = reference_angles
-            _avatars[avatar_id]["angle_validation"] = validation
+        # Update stored avatar if exists
+        await _update_avatar(avatar_id, lambda avatar: avatar.update(
+            reference_angles=reference_angles,
+            angle_validation=validation,
+        ))
 
         return {
             "avatar_id": avatar_id,
@@ -267,6 +359,7 @@ async def upload_angle_image(
     file: UploadFile = File(...),
     angle: str = Form(default="auto"),
     current_user: AuthUser = Depends(get_current_user),
+    ref_service: ReferenceValidationService = Depends(get_reference_service),
 ) -> dict:
     """Upload an avatar image with angle classification.
 
@@ -297,22 +390,23 @@ async def upload_angle_image(
         # Classify angle
         detected_angle = angle
         if angle == "auto":
-            ref_service = ReferenceValidationService()
             detected_angle = await ref_service.classify_image_angle(
                 content, file.content_type
             )
 
-        # Update avatar's reference_angles in memory
-        if avatar_id in _avatars:
-            angles = _avatars[avatar_id].get("reference_angles", {})
+        # Update stored avatar's reference_angles
+        def add_angle_image(avatar: dict) -> None:
+            angles = avatar.get("reference_angles", {})
             angles[detected_angle] = image_url
-            _avatars[avatar_id]["reference_angles"] = angles
+            avatar["reference_angles"] = angles
 
             # Add to general reference_images too
-            ref_images = _avatars[avatar_id].get("reference_images", [])
+            ref_images = avatar.get("reference_images", [])
             if image_url not in ref_images:
                 ref_images.append(image_url)
-                _avatars[avatar_id]["reference_images"] = ref_images
+                avatar["reference_images"] = ref_images
+
+        await _update_avatar(avatar_id, add_angle_image)
 
         return {
             "image_url": image_url,
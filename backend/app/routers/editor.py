@@ -11,17 +11,22 @@ Endpoints for the post-production video editor:
 import asyncio
 import logging
 import os
+import time
 import uuid
 from pathlib import Path
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from pydantic import BaseModel
+from pydantic_core import to_json
+from sse_starlette.sse import EventSourceResponse
 
 from app.middleware.auth import AuthUser, get_current_user
 
 from app.services.audio_service import AudioService
 from app.services.ffmpeg_service import FFmpegService
-from app.utils.redis_client import get_redis
+from app.utils.redis_client import get_compile_state, set_compile_state, subscribe_compile_progress
+from app.utils.uploads import save_upload
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,14 @@ router = APIRouter(prefix="/api/v1/editor", tags=["editor"])
 AUDIO_DIR = Path(__file__).resolve().parents[3] / "frontend" / "public" / "uploads" / "audio"
 AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
+# Minimum spacing between compile progress writes; faster updates are coalesced
+COMPILE_PROGRESS_INTERVAL_SEC = 0.1
+
+ALLOWED_MUSIC_TYPES = frozenset({"audio/mpeg", "audio/mp3", "audio/wav", "audio/ogg", "audio/webm"})
+
+# Seconds per byte at 128 kbps, for estimating duration when ffprobe fails
+_KBPS128_INV_SEC_PER_BYTE = 8 / (128 * 1024)
+
 
 # ── Schemas ──────────────────────────────────────────────────────────────────
 
@@ -134,6 +147,13 @@ PRESET_MUSIC: list[dict] = [
     },
 ]
 
+# Response objects built once, indexed by category for get_music_library
+_PRESET_RESPONSES: list[MusicTrackResponse] = [MusicTrackResponse(**t) for t in PRESET_MUSIC]
+_PRESET_BY_CATEGORY: dict[str, list[MusicTrackResponse]] = {}
+for _track in _PRESET_RESPONSES:
+    _PRESET_BY_CATEGORY.setdefault(_track.category, []).append(_track)
+del _track
+
 
 # ── Endpoints ────────────────────────────────────────────────────────────────
 
@@ -170,10 +190,9 @@ async def generate_voiceover(req: VoiceoverRequest, current_user: AuthUser = Dep
 @router.get("/music-library", response_model=list[MusicTrackResponse])
 async def get_music_library(category: str | None = None, current_user: AuthUser = Depends(get_current_user)):
     """Return the preset music library, optionally filtered by category."""
-    tracks = PRESET_MUSIC
     if category:
-        tracks = [t for t in tracks if t["category"] == category]
-    return [MusicTrackResponse(**t) for t in tracks]
+        return _PRESET_BY_CATEGORY.get(category, [])
+    return _PRESET_RESPONSES
 
 
 @router.post("/upload-music", response_model=UploadMusicResponse)
@@ -183,11 +202,10 @@ async def upload_music(file: UploadFile = File(...), current_user: AuthUser = De
         raise HTTPException(status_code=400, detail="No file provided")
 
     # Validate file type
-    allowed_types = {"audio/mpeg", "audio/mp3", "audio/wav", "audio/ogg", "audio/webm"}
-    if file.content_type and file.content_type not in allowed_types:
+    if file.content_type and file.content_type not in ALLOWED_MUSIC_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type: {file.content_type}. Allowed: {', '.join(allowed_types)}",
+            detail=f"Invalid file type: {file.content_type}. Allowed: {', '.join(sorted(ALLOWED_MUSIC_TYPES))}",
         )
 
     # Save file
@@ -197,14 +215,13 @@ async def upload_music(file: UploadFile = File(...), current_user: AuthUser = De
     filepath = AUDIO_DIR / filename
 
     try:
-        content = await file.read()
-        filepath.write_bytes(content)
+        size = await save_upload(file, filepath)
 
         # Get actual duration using ffprobe
         duration = await FFmpegService.get_duration_ffprobe(filepath)
         if duration <= 0:
             # Fallback: rough estimate from file size (~128 kbps)
-            duration = round(len(content) / (128 * 1024 / 8), 1)
+            duration = round(size * _KBPS128_INV_SEC_PER_BYTE, 1)
 
         return UploadMusicResponse(
             id=f"custom-{file_id}",
@@ -246,26 +263,65 @@ async def compile_video(req: CompileRequest, current_user: AuthUser = Depends(ge
     job_id = uuid.uuid4().hex[:8]
 
     # Store initial state in Redis
-    r = await get_redis()
-    await r.hset(f"compile:{job_id}", mapping={
+    await set_compile_state(job_id, {
         "status": "preparing",
-        "percent": "0",
+        "percent": 0,
         "message": "Preparing compilation...",
-        "output_url": "",
+        "output_url": None,
     })
 
     async def run_compile():
+        last_write = 0.0
+        pending: dict[str, Any] | None = None
+        flusher: asyncio.Task | None = None
+
+        async def write_state(state: dict[str, Any]):
+            nonlocal last_write
+            last_write = time.monotonic()
+            await set_compile_state(job_id, state)
+
+        async def flush_later(wait: float):
+            nonlocal pending, flusher
+            try:
+                await asyncio.sleep(wait)
+                state, pending = pending, None
+                if state is not None:
+                    await write_state(state)
+            finally:
+                if flusher is asyncio.current_task():
+                    flusher = None
+
+        async def progress_cb(percent: int, message: str):
+            # Write at most every COMPILE_PROGRESS_INTERVAL_SEC; the latest
+            # update in a window is sent once it closes
+            nonlocal pending, flusher
+            state = {
+                # Only the final write below marks the job complete (with its output_url)
+                "status": "rendering",
+                "percent": percent,
+                "message": message,
+                "output_url": None,
+            }
+            wait = last_write + COMPILE_PROGRESS_INTERVAL_SEC - time.monotonic()
+            if wait <= 0 and flusher is None:
+                await write_state(state)
+                return
+            pending = state
+            if flusher is None:
+                flusher = asyncio.create_task(flush_later(wait))
+
+        async def finish(state: dict[str, Any]):
+            # The final state supersedes any held-back update; wait out an
+            # in-flight one so it can't land after this
+            nonlocal pending
+            pending = None
+            if flusher is not None:
+                await asyncio.gather(flusher, return_exceptions=True)
+            await write_state(state)
+
         try:
             ffmpeg = FFmpegService()
 
-            async def progress_cb(percent: int, message: str):
-                await r.hset(f"compile:{job_id}", mapping={
-                    "status": "rendering" if percent < 100 else "complete",
-                    "percent": str(percent),
-                    "message": message,
-                    "output_url": "",
-                })
-
             result = await ffmpeg.compile_video(
                 clips=req.clips,
                 transitions=req.transitions,
@@ -276,26 +332,26 @@ async def compile_video(req: CompileRequest, current_user: AuthUser = Depends(ge
             )
 
             if result.get("status") == "error":
-                await r.hset(f"compile:{job_id}", mapping={
+                await finish({
                     "status": "error",
-                    "percent": "0",
+                    "percent": 0,
                     "message": result.get("error", "Compilation failed"),
-                    "output_url": "",
+                    "output_url": None,
                 })
             else:
-                await r.hset(f"compile:{job_id}", mapping={
+                await finish({
                     "status": "complete",
-                    "percent": "100",
+                    "percent": 100,
                     "message": "Export complete!",
-                    "output_url": result.get("output_url", ""),
+                    "output_url": result.get("output_url") or None,
                 })
         except Exception as e:
             logger.exception("Compilation job %s failed", job_id)
-            await r.hset(f"compile:{job_id}", mapping={
+            await finish({
                 "status": "error",
-                "percent": "0",
+                "percent": 0,
                 "message": str(e),
-                "output_url": "",
+                "output_url": None,
             })
 
     # Run compilation in background
@@ -307,15 +363,22 @@ async def compile_video(req: CompileRequest, current_user: AuthUser = Depends(ge
 @router.get("/compile/{job_id}/status", response_model=CompileStatusResponse)
 async def get_compile_status(job_id: str, current_user: AuthUser = Depends(get_current_user)):
     """Poll compilation progress from Redis."""
-    r = await get_redis()
-    job = await r.hgetall(f"compile:{job_id}")
+    job = await get_compile_state(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return CompileStatusResponse(
-        status=job.get("status", "unknown"),
-        percent=int(job.get("percent", "0")),
-        message=job.get("message", ""),
-        output_url=job.get("output_url") or None,
-    )
+    return CompileStatusResponse(**job)
+
+
+@router.get("/compile/{job_id}/stream")
+async def stream_compile_progress(job_id: str, current_user: AuthUser = Depends(get_current_user)) -> EventSourceResponse:
+    """SSE stream of compilation progress: the current state, then each update until done."""
+    if await get_compile_state(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_generator() -> Any:
+        async for state in subscribe_compile_progress(job_id):
+            yield {"event": "progress", "data": to_json(state).decode()}
+
+    return EventSourceResponse(event_generator())
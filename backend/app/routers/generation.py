@@ -23,6 +23,7 @@ async def _run_pipeline_async(job_id: str, request: GenerationRequest) -> None:
     """Run the video pipeline in-process (fallback when Celery is unavailable)."""
     from app.pipelines.video_pipeline import VideoPipeline
     from app.utils import redis_client
+    from app.utils.http_client import close_http_client
 
     # Reset Redis client to ensure it's created in this event loop
     redis_client.reset_redis()
@@ -36,6 +37,8 @@ async def _run_pipeline_async(job_id: str, request: GenerationRequest) -> None:
         )
     except Exception:
         logger.exception("Pipeline failed for job %s", job_id)
+    finally:
+        await close_http_client()
 
 
 @router.post("/generate", response_model=GenerationResponse)
@@ -119,6 +122,7 @@ async def regenerate_stage(
     """
     from app.pipelines.video_pipeline import VideoPipeline
     from app.utils import redis_client
+    from app.utils.http_client import close_http_client
 
     async def _run_regen(job_id: str, stage: str, context: dict) -> None:
         redis_client.reset_redis()
@@ -132,6 +136,8 @@ async def regenerate_stage(
             )
         except Exception:
             logger.exception("Stage regeneration failed for job %s step %s", job_id, stage)
+        finally:
+            await close_http_client()
 
     # Build context from request (in production, this would load from DB)
     context: dict = {
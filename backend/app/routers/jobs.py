@@ -1,8 +1,8 @@
-import json
 import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic_core import to_json
 from sse_starlette.sse import EventSourceResponse
 
 from app.middleware.auth import AuthUser, get_current_user
@@ -32,10 +32,10 @@ async def stream_job_progress(job_id: str, current_user: AuthUser = Depends(get_
         # Emit current state first
         state = await get_job_state(job_id)
         if state is not None:
-            yield {"event": "progress", "data": json.dumps(state)}
+            yield {"event": "progress", "data": to_json(state).decode()}
 
         async for update in subscribe_progress(job_id):
-            yield {"event": "progress", "data": json.dumps(update)}
+            yield {"event": "progress", "data": to_json(update).decode()}
 
     return EventSourceResponse(event_generator())
 
@@ -151,9 +151,9 @@ async def expand_brief(request: ExpandBriefRequest, current_user: AuthUser = Dep
 
     try:
         # Parse enum values
-        platform = Platform(request.platform)
-        style = VideoStyle(request.style)
-        tone = Tone(request.tone)
+        platform = Platform.from_value(request.platform)
+        style = VideoStyle.from_value(request.style)
+        tone = Tone.from_value(request.tone)
 
         bible_service = ProductionBibleService(api_key=settings.GEMINI_API_KEY)
         brief = await bible_service.expand_brief(
@@ -200,9 +200,9 @@ async def assemble_bible(request: AssembleBibleRequest, current_user: AuthUser =
 
     try:
         # Parse enum values
-        platform = Platform(request.platform)
-        style = VideoStyle(request.style)
-        tone = Tone(request.tone)
+        platform = Platform.from_value(request.platform)
+        style = VideoStyle.from_value(request.style)
+        tone = Tone.from_value(request.tone)
 
         bible_service = ProductionBibleService(api_key=settings.GEMINI_API_KEY)
         bible = await bible_service.assemble_bible(
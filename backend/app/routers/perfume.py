@@ -8,10 +8,11 @@ import os
 import time
 import uuid
 import zipfile
+from dataclasses import asdict
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from app.middleware.auth import AuthUser, get_current_user
 
@@ -152,7 +153,7 @@ async def fetch_notes(request: FetchPerfumeNotesRequest, current_user: AuthUser
     return {
         "success": True,
         "inspired_by": request.inspired_by,
-        "notes": notes.model_dump(),
+        "notes": asdict(notes),
     }
 
 
@@ -419,7 +420,7 @@ async def batch_job_start(request: dict, current_user: AuthUser = Depends(get_cu
       - api_key: str | None
     """
     from app.pipelines.perfume_pipeline import PerfumePipeline
-    from app.models.schemas import GenderAvatarMapping, GenderAvatarSlot, PerfumePipelineConfig
+    from app.models.schemas import GenderAvatarMapping, PerfumePipelineConfig
 
     products = request.get("products", [])
     if not products:
@@ -435,13 +436,7 @@ async def batch_job_start(request: dict, current_user: AuthUser = Depends(get_cu
 
     # Parse gender avatars
     ga_data = request.get("gender_avatars")
-    gender_avatars = None
-    if ga_data:
-        gender_avatars = GenderAvatarMapping(
-            male=GenderAvatarSlot(**ga_data["male"]) if ga_data.get("male") else GenderAvatarSlot(),
-            female=GenderAvatarSlot(**ga_data["female"]) if ga_data.get("female") else GenderAvatarSlot(),
-            unisex=GenderAvatarSlot(**ga_data["unisex"]) if ga_data.get("unisex") else GenderAvatarSlot(),
-        )
+    gender_avatars = GenderAvatarMapping.from_dict(ga_data) if ga_data else None
 
     # Parse inspiration DNA
     insp_data = request.get("inspiration_dna")
@@ -477,32 +472,22 @@ async def batch_job_start(request: dict, current_user: AuthUser = Depends(get_cu
     return {
         "success": True,
         "job_id": job_id,
-        "total_products": job["total_products"] if job else 0,
+        "total_products": job.total_products if job else 0,
         "selected_indices": product_indices or list(range(len(products))),
     }
 
 
 @router.get("/batch-job/{job_id}/status")
-async def batch_job_status(job_id: str, current_user: AuthUser = Depends(get_current_user)) -> dict:
+async def batch_job_status(job_id: str, current_user: AuthUser = Depends(get_current_user)) -> Response:
     """Poll job progress. Returns current state, progress, and incremental results."""
-    from app.pipelines.perfume_pipeline import get_job
+    from app.pipelines.perfume_pipeline import encode_job_status, get_job
 
     job = get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return {
-        "job_id": job_id,
-        "status": job["status"],
-        "progress": job.get("progress", 0),
-        "message": job.get("message", ""),
-        "total_products": job["total_products"],
-        "current_product": job.get("current_product", 0),
-        "current_product_name": job.get("current_product_name", ""),
-        "completed_count": job.get("completed_count", 0),
-        "results": job.get("results", []),
-        "paused": job.get("paused", False),
-    }
+    # Results grow with the batch; encode them straight to bytes for frequent polls
+    return Response(content=encode_job_status(job), media_type="application/json")
 
 
 @router.post("/batch-job/{job_id}/pause")
@@ -856,16 +841,16 @@ async def generation_history(current_user: AuthUser = Depends(get_current_user))
         if not job:
             continue
 
-        results = job.get("results", [])
+        results = job.results
         successful = [r for r in results if r.get("status") == "success"]
         total_images = sum(r.get("count", 0) for r in successful)
 
         history.append({
-            "job_id": job["job_id"],
-            "status": job["status"],
-            "started_at": job.get("started_at", 0),
-            "total_products": job.get("total_products", 0),
-            "completed_count": job.get("completed_count", 0),
+            "job_id": job.job_id,
+            "status": job.status,
+            "started_at": job.started_at,
+            "total_products": job.total_products,
+            "completed_count": job.completed_count,
             "successful_count": len(successful),
             "total_images": total_images,
             "results": results,
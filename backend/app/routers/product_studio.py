@@ -13,9 +13,11 @@ import time
 import uuid
 import zipfile
 from pathlib import Path
+from typing import Any
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from sse_starlette.sse import EventSourceResponse
 
 from app.middleware.auth import AuthUser, get_current_user
 from app.services.perfume_name_cleaner import clean_perfume_name
@@ -201,36 +203,50 @@ async def white_bg_start(request: dict, current_user: AuthUser = Depends(get_cur
     )
 
     from app.pipelines.product_studio_pipeline import get_job
-    job = get_job(job_id)
+    job = await get_job(job_id)
 
     return {
         "success": True,
         "job_id": job_id,
-        "total_products": job["total_products"] if job else 0,
+        "total_products": job.total_products if job else 0,
     }
 
 
+@router.get("/jobs")
+async def jobs_list(current_user: AuthUser = Depends(get_current_user)) -> Response:
+    """List all white-bg and inspiration jobs with summary info."""
+    from app.pipelines.product_studio_pipeline import encode_job_list
+
+    # Summaries are cached as encoded JSON and only rebuilt when a job changes
+    return Response(content=encode_job_list(), media_type="application/json")
+
+
 @router.get("/job/{job_id}/status")
-async def job_status(job_id: str, current_user: AuthUser = Depends(get_current_user)) -> dict:
+async def job_status(job_id: str, current_user: AuthUser = Depends(get_current_user)) -> Response:
     """Poll job progress (works for both white-bg and inspiration jobs)."""
-    from app.pipelines.product_studio_pipeline import get_job
+    from app.pipelines.product_studio_pipeline import encode_job_status, get_job
 
-    job = get_job(job_id)
+    job = await get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return {
-        "job_id": job_id,
-        "job_type": job.get("job_type", ""),
-        "status": job["status"],
-        "progress": job.get("progress", 0),
-        "message": job.get("message", ""),
-        "total_products": job["total_products"],
-        "current_product_name": job.get("current_product_name", ""),
-        "completed_count": job.get("completed_count", 0),
-        "results": job.get("results", []),
-        "paused": job.get("paused", False),
-    }
+    return Response(content=encode_job_status(job), media_type="application/json")
+
+
+@router.get("/job/{job_id}/events")
+async def job_events(job_id: str, current_user: AuthUser = Depends(get_current_user)) -> EventSourceResponse:
+    """SSE stream of job state: a full status event, then progress/result deltas, then done."""
+    from app.pipelines.product_studio_pipeline import get_job, stream_job_events
+
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_generator() -> Any:
+        async for event, data in stream_job_events(job):
+            yield {"event": event, "data": data.decode()}
+
+    return EventSourceResponse(event_generator())
 
 
 @router.post("/job/{job_id}/pause")
@@ -279,12 +295,12 @@ async def inspiration_start(request: dict, current_user: AuthUser = Depends(get_
     )
 
     from app.pipelines.product_studio_pipeline import get_job
-    job = get_job(job_id)
+    job = await get_job(job_id)
 
     return {
         "success": True,
         "job_id": job_id,
-        "total_products": job["total_products"] if job else 0,
+        "total_products": job.total_products if job else 0,
     }
 
 
@@ -302,7 +318,7 @@ async def download_zip(request: dict, current_user: AuthUser = Depends(get_curre
             if result.get("image_url"):
                 image_urls.append(result["image_url"])
             for img in result.get("images", []):
-                if img.get("image_url") and not img["image_url"].startswith("Error"):
+                if img.get("status") != "error" and img.get("image_url"):
                     image_urls.append(img["image_url"])
 
     if not image_urls:
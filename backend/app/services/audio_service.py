@@ -115,7 +115,7 @@ class AudioService:
                 f"{text}"
             )
 
-            response = self._gemini_client.models.generate_content(
+            response = await self._gemini_client.aio.models.generate_content(
                 model="gemini-2.5-flash-preview-tts",
                 contents=speech_prompt,
                 config=types.GenerateContentConfig(
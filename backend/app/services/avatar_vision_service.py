@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
 
 from google import genai
@@ -41,6 +43,11 @@ IMPORTANT RULES:
 
 Respond with ONLY the JSON object, no additional text."""
 
+# Extracted DNA keyed by sha256 of the image bytes, least recently used first.
+# Re-analyzing identical bytes (upload then create with the same image) hits this.
+_dna_cache: OrderedDict[str, dict[str, str]] = OrderedDict()
+_DNA_CACHE_MAX = 10_000
+
 
 class AvatarVisionService:
     """Service for extracting avatar DNA from images using Gemini Vision."""
@@ -79,6 +86,13 @@ class AvatarVisionService:
                 image_bytes = image_data
                 logger.info(f"📷 Processing raw image ({len(image_bytes)} bytes)")
 
+            cache_key = hashlib.sha256(image_bytes).hexdigest()
+            cached = _dna_cache.get(cache_key)
+            if cached is not None:
+                _dna_cache.move_to_end(cache_key)
+                logger.info("♻️ Reusing cached DNA for identical image")
+                return dict(cached)
+
             # Create image part for Gemini
             image_part = types.Part.from_bytes(
                 data=image_bytes,
@@ -115,6 +129,9 @@ class AvatarVisionService:
                     # Standardize the DNA format and mark as real
                     result = self._standardize_dna(dna)
                     result["_source"] = "gemini_vision_api"
+                    _dna_cache[cache_key] = dict(result)
+                    if len(_dna_cache) > _DNA_CACHE_MAX:
+                        _dna_cache.popitem(last=False)
                     return result
                 except json.JSONDecodeError:
                     logger.error(f"❌ Failed to parse DNA JSON: {response.text[:200]}")
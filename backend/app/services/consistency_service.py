@@ -14,6 +14,7 @@ returns structured similarity scores.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import statistics
@@ -93,6 +94,35 @@ You MUST respond with ONLY a JSON object in this exact format:
   "notes": "<brief explanation of key similarities and differences>"
 }}"""
 
+_BATCH_CONSISTENCY_PROMPT = """You are a character consistency scoring system for AI-generated video production.
+
+Compare EACH of the {count} TARGET IMAGES against the REFERENCE IMAGE(S) and evaluate, independently for each target, how consistently the same character is depicted.
+
+Score these attributes from 0.0 to 1.0 (1.0 = perfect match): face_structure, eyes, nose, lips, skin_tone, hair, body_type, distinguishing_features, overall_identity (would someone recognize this as the SAME person?).
+
+{character_dna_section}
+
+SCORING GUIDELINES:
+- 1.0: Identical / indistinguishable from reference
+- 0.8: Same person, minor style differences (excellent)
+- 0.7: Likely same person, some feature drift (acceptable)
+- 0.6: Possibly same person, noticeable differences (marginal)
+- Below 0.5: Different person
+
+You MUST respond with ONLY a JSON array of exactly {count} objects, one per target in order [TARGET IMAGE 1] to [TARGET IMAGE {count}], each in this exact format:
+{{
+  "face_structure": <float 0.0-1.0>,
+  "eyes": <float 0.0-1.0>,
+  "nose": <float 0.0-1.0>,
+  "lips": <float 0.0-1.0>,
+  "skin_tone": <float 0.0-1.0>,
+  "hair": <float 0.0-1.0>,
+  "body_type": <float 0.0-1.0>,
+  "distinguishing_features": <float 0.0-1.0>,
+  "overall_identity": <float 0.0-1.0>,
+  "notes": "<brief explanation of key similarities and differences>"
+}}"""
+
 _PROMPT_ADHERENCE_PROMPT = """You are a prompt adherence evaluator for AI-generated video frames.
 
 Given the GENERATED IMAGE and the ORIGINAL PROMPT below, score how well the image matches the prompt requirements.
@@ -238,24 +268,13 @@ class ConsistencyService:
             )
             content_parts.append(types.Part.from_text(text="[TARGET IMAGE TO EVALUATE]"))
 
-            # Build the character DNA section for the prompt
-            dna_section = ""
-            if character_dna:
-                dna_lines = ["KNOWN CHARACTER DNA (use as additional reference):"]
-                for key in ("face", "skin", "eyes", "hair", "body", "wardrobe",
-                            "ethnicity", "age_range", "gender", "distinguishing_features"):
-                    value = character_dna.get(key)
-                    if value:
-                        dna_lines.append(f"  - {key}: {value}")
-                dna_section = "\n".join(dna_lines)
-
             prompt_text = _CONSISTENCY_ANALYSIS_PROMPT.format(
-                character_dna_section=dna_section,
+                character_dna_section=self._character_dna_section(character_dna),
             )
             content_parts.append(types.Part.from_text(text=prompt_text))
 
             # Call Gemini Vision
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model=VISION_MODEL,
                 contents=[types.Content(role="user", parts=content_parts)],
                 config=types.GenerateContentConfig(
@@ -269,29 +288,113 @@ class ConsistencyService:
                 logger.error("Failed to parse consistency scores from Gemini response")
                 return self._mock_consistency_result(reason="parse_error")
 
-            overall = float(scores.get("overall_identity", 0.0))
-            rating = _score_to_rating(overall)
-
-            return {
-                "score": round(overall, 4),
-                "rating": rating,
-                "attribute_scores": {
-                    k: round(float(v), 4)
-                    for k, v in scores.items()
-                    if k not in ("notes",) and isinstance(v, (int, float))
-                },
-                "details": {
-                    "model": VISION_MODEL,
-                    "num_references": len(reference_images),
-                    "character_dna_provided": character_dna is not None,
-                },
-                "notes": scores.get("notes", ""),
-            }
+            return self._consistency_result(scores, len(reference_images), character_dna is not None)
 
         except Exception as exc:
             logger.exception("Character consistency scoring failed: %s", exc)
             return self._mock_consistency_result(reason=f"error: {exc}")
 
+    async def score_character_consistency_batch(
+        self,
+        images: list[bytes],
+        reference_images: list[bytes],
+        character_dna: dict | None = None,
+    ) -> list[dict]:
+        """Score several generated images against the same references in one call.
+
+        The references and DNA are sent once for the whole batch. Falls back to
+        per-image scoring if the batched response can't be matched to the inputs.
+
+        Returns:
+            One result dict per image, in input order, shaped like
+            ``score_character_consistency``.
+        """
+        if len(images) <= 1 or not self._client or not reference_images:
+            return await self._score_individually(images, reference_images, character_dna)
+
+        try:
+            content_parts: list[Any] = []
+            for idx, ref_bytes in enumerate(reference_images):
+                content_parts.append(types.Part.from_bytes(data=ref_bytes, mime_type="image/png"))
+                content_parts.append(types.Part.from_text(text=f"[REFERENCE IMAGE {idx + 1}]"))
+            for idx, image_data in enumerate(images):
+                content_parts.append(types.Part.from_bytes(data=image_data, mime_type="image/png"))
+                content_parts.append(types.Part.from_text(text=f"[TARGET IMAGE {idx + 1}]"))
+            content_parts.append(types.Part.from_text(text=_BATCH_CONSISTENCY_PROMPT.format(
+                count=len(images),
+                character_dna_section=self._character_dna_section(character_dna),
+            )))
+
+            response = await self._client.aio.models.generate_content(
+                model=VISION_MODEL,
+                contents=[types.Content(role="user", parts=content_parts)],
+                config=types.GenerateContentConfig(
+                    temperature=0.1,
+                    response_mime_type="application/json",
+                ),
+            )
+
+            batch_scores = self._parse_json_response(response.text)
+            if (
+                isinstance(batch_scores, list)
+                and len(batch_scores) == len(images)
+                and all(isinstance(scores, dict) for scores in batch_scores)
+            ):
+                return [
+                    self._consistency_result(scores, len(reference_images), character_dna is not None)
+                    for scores in batch_scores
+                ]
+            logger.warning("Batched consistency response didn't match %d images, scoring individually", len(images))
+        except Exception as exc:
+            logger.warning("Batched consistency scoring failed, scoring individually: %s", exc)
+
+        return await self._score_individually(images, reference_images, character_dna)
+
+    async def _score_individually(
+        self,
+        images: list[bytes],
+        reference_images: list[bytes],
+        character_dna: dict | None,
+    ) -> list[dict]:
+        """Score each image with its own vision call, all in flight at once."""
+        return list(await asyncio.gather(*(
+            self.score_character_consistency(image, reference_images, character_dna)
+            for image in images
+        )))
+
+    @staticmethod
+    def _character_dna_section(character_dna: dict | None) -> str:
+        """Build the character DNA section of a consistency prompt."""
+        if not character_dna:
+            return ""
+        dna_lines = ["KNOWN CHARACTER DNA (use as additional reference):"]
+        for key in ("face", "skin", "eyes", "hair", "body", "wardrobe",
+                    "ethnicity", "age_range", "gender", "distinguishing_features"):
+            value = character_dna.get(key)
+            if value:
+                dna_lines.append(f"  - {key}: {value}")
+        return "\n".join(dna_lines)
+
+    @staticmethod
+    def _consistency_result(scores: dict, num_references: int, character_dna_provided: bool) -> dict:
+        """Shape parsed attribute scores into a consistency result dict."""
+        overall = float(scores.get("overall_identity", 0.0))
+        return {
+            "score": round(overall, 4),
+            "rating": _score_to_rating(overall),
+            "attribute_scores": {
+                k: round(float(v), 4)
+                for k, v in scores.items()
+                if k not in ("notes",) and isinstance(v, (int, float))
+            },
+            "details": {
+                "model": VISION_MODEL,
+                "num_references": num_references,
+                "character_dna_provided": character_dna_provided,
+            },
+            "notes": scores.get("notes", ""),
+        }
+
     # ------------------------------------------------------------------
     # Layer 3: Storyboard validation
     # ------------------------------------------------------------------
@@ -676,7 +779,7 @@ class ConsistencyService:
                 types.Part.from_text(text=_CONTINUITY_PROMPT),
             ]
 
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model=VISION_MODEL,
                 contents=[types.Content(role="user", parts=content_parts)],
                 config=types.GenerateContentConfig(
@@ -719,7 +822,7 @@ class ConsistencyService:
                 types.Part.from_text(text=formatted_prompt),
             ]
 
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model=VISION_MODEL,
                 contents=[types.Content(role="user", parts=content_parts)],
                 config=types.GenerateContentConfig(
@@ -757,7 +860,7 @@ class ConsistencyService:
                 types.Part.from_text(text=_TECHNICAL_QUALITY_PROMPT),
             ]
 
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model=VISION_MODEL,
                 contents=[types.Content(role="user", parts=content_parts)],
                 config=types.GenerateContentConfig(
@@ -785,7 +888,7 @@ class ConsistencyService:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_json_response(text: str | None) -> dict | None:
+    def _parse_json_response(text: str | None) -> dict | list | None:
         """Safely parse a JSON response from Gemini.
 
         Handles cases where the model wraps JSON in markdown code fences
@@ -383,7 +383,7 @@ OUTPUT REQUIREMENTS:
                     ),
                 )
 
-                response = self._client.models.generate_content(
+                response = await self._client.aio.models.generate_content(
                     model=model_name,
                     contents=[types.Content(role="user", parts=content_parts)],
                     config=config,
@@ -419,7 +419,7 @@ OUTPUT REQUIREMENTS:
         logger.info(f"🎨 Using Imagen text-only for scene {scene_number} with aspect ratio {aspect_ratio}")
 
         try:
-            response = self._client.models.generate_images(
+            response = await self._client.aio.models.generate_images(
                 model=IMAGEN_MODEL,
                 prompt=prompt,
                 config=types.GenerateImagesConfig(
@@ -750,7 +750,7 @@ OUTPUT REQUIREMENTS:
 
         # Add product details with physical reality constraints
         if product_name:
-            visibility = scene.product_visibility.value if hasattr(scene.product_visibility, 'value') else str(scene.product_visibility)
+            visibility = scene.product_visibility
 
             parts.extend([
                 "########################################",
@@ -12,7 +12,6 @@ from google.genai import types
 from app.config import settings
 from app.models.schemas import (
     GenderAvatarMapping,
-    GenderAvatarSlot,
     InspirationDNA,
     PerfumeAvatarDNA,
     PerfumeInfo,
@@ -402,15 +401,7 @@ class PerfumeImageService:
         if not gender_avatars:
             return None, []
 
-        g = product_gender.lower()
-        slot: GenderAvatarSlot | None = None
-
-        if g == "male":
-            slot = gender_avatars.male
-        elif g == "female":
-            slot = gender_avatars.female
-        else:
-            slot = gender_avatars.unisex
+        slot = gender_avatars[product_gender.lower()]
 
         # Fallback to unisex if the specific gender slot is empty
         if slot and not slot.images and not slot.dna:
@@ -605,7 +596,7 @@ CRITICAL RULES:
 
         try:
             content_parts = image_parts + [types.Part.from_text(text=prompt)]
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=[types.Content(role="user", parts=content_parts)],
                 config=types.GenerateContentConfig(temperature=0.1, max_output_tokens=3000),
@@ -674,7 +665,7 @@ RULES:
 5. Eye color should be specific: 'deep brown with amber flecks' not just 'brown'"""
 
         try:
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=[types.Content(role="user", parts=[image_part, types.Part.from_text(text=prompt)])],
                 config=types.GenerateContentConfig(temperature=0.1, response_mime_type="application/json"),
@@ -731,7 +722,7 @@ Return ONLY a valid JSON object (no markdown):
 If you don't know the exact notes, provide your best educated guess based on the fragrance family."""
 
         try:
-            response = self._client.models.generate_content(
+            response = await self._client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=prompt,
                 config=types.GenerateContentConfig(temperature=0.2, max_output_tokens=500),
@@ -1079,7 +1070,7 @@ Generate the image now — same person, same product, zero text overlays."""
                     ),
                 )
 
-                response = self._client.models.generate_content(
+                response = await self._client.aio.models.generate_content(
                     model=model_name,
                     contents=[types.Content(role="user", parts=content_parts)],
                     config=config,
@@ -1105,7 +1096,7 @@ Generate the image now — same person, same product, zero text overlays."""
 
     async def _generate_text_only(self, style: str, prompt: str, aspect_ratio: str = "1:1") -> str:
         try:
-            response = self._client.models.generate_images(
+            response = await self._client.aio.models.generate_images(
                 model="imagen-4.0-fast-generate-001",
                 prompt=prompt,
                 config=types.GenerateImagesConfig(number_of_images=1, aspect_ratio=aspect_ratio),
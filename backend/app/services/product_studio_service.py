@@ -5,6 +5,7 @@ Uses Gemini image generation models to:
 2. Generate inspiration-based styled product shots (5 angles)
 """
 
+import asyncio
 import logging
 import uuid
 from pathlib import Path
@@ -13,6 +14,7 @@ from google import genai
 from google.genai import types
 
 from app.config import settings
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +62,11 @@ class ProductStudioService:
 
     def __init__(self, api_key: str | None = None) -> None:
         self._api_key = api_key or settings.GEMINI_API_KEY
-        self._client = genai.Client(api_key=self._api_key)
+        # Share one pooled connection across every job's concurrent requests
+        self._client = genai.Client(
+            api_key=self._api_key,
+            http_options=types.HttpOptions(httpx_async_client=get_http_client()),
+        )
 
     async def generate_white_bg(
         self,
@@ -77,7 +83,7 @@ class ProductStudioService:
         reference_parts: list[types.Part] = []
 
         if bottle_image_path:
-            img_bytes = self._load_local_image(bottle_image_path)
+            img_bytes = await asyncio.to_thread(self._load_local_image, bottle_image_path)
             if img_bytes:
                 reference_parts.append(
                     types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg")
@@ -97,12 +103,12 @@ class ProductStudioService:
                         person_generation="ALLOW_ALL",
                     ),
                 )
-                response = self._client.models.generate_content(
+                response = await self._client.aio.models.generate_content(
                     model=model_name,
                     contents=[types.Content(role="user", parts=content_parts)],
                     config=config,
                 )
-                image_url = self._extract_and_save_image(response, f"whitebg-{uuid.uuid4().hex[:8]}")
+                image_url = await self._extract_and_save_image(response, f"whitebg-{uuid.uuid4().hex[:8]}")
                 if image_url:
                     logger.info("White-bg: %s generated for %s", model_name, product_name)
                     return image_url
@@ -125,27 +131,57 @@ class ProductStudioService:
     ) -> dict:
         """Generate a single styled angle for a product.
 
-        Returns dict with {style, label, image_url}.
+        Returns dict with {style, label, status, image_url}; status is "error"
+        with an empty image_url when every model and the fallback failed.
         """
-        reference_parts: list[types.Part] = []
+        reference_parts = await asyncio.to_thread(self._styled_reference_parts, white_bg_image_path, inspiration_images)
+        return await self._generate_styled(
+            product_name, brand_name, reference_parts, angle, aspect_ratio,
+            has_white_bg=bool(white_bg_image_path), has_inspiration=bool(inspiration_images),
+        )
 
-        # Add the white-bg image as the primary reference
-        if white_bg_image_path:
-            img_bytes = self._load_local_image(white_bg_image_path)
-            if img_bytes:
-                reference_parts.append(
-                    types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg")
-                )
+    async def generate_styled_batch(
+        self,
+        product_name: str,
+        brand_name: str,
+        white_bg_image_path: str | None,
+        inspiration_images: list[str],
+        angles: list[dict],
+        aspect_ratio: str = "1:1",
+    ) -> list[dict | BaseException]:
+        """Generate several styled angles for one product concurrently.
 
-        # Add up to 3 inspiration images as style references
-        for insp_path in inspiration_images[:3]:
-            img_bytes = self._load_local_image(insp_path)
-            if img_bytes:
-                reference_parts.append(
-                    types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg")
+        Reference images are loaded once and shared by every angle. Results
+        are in ``angles`` order; a failed angle yields its exception, and if
+        the references can't be loaded every angle yields that error.
+        """
+        try:
+            reference_parts = await asyncio.to_thread(self._styled_reference_parts, white_bg_image_path, inspiration_images)
+        except Exception as e:
+            logger.warning("Styled references failed to load for %s: %s", product_name, e)
+            return [e] * len(angles)
+        return await asyncio.gather(
+            *(
+                self._generate_styled(
+                    product_name, brand_name, reference_parts, angle, aspect_ratio,
+                    has_white_bg=bool(white_bg_image_path), has_inspiration=bool(inspiration_images),
                 )
+                for angle in angles
+            ),
+            return_exceptions=True,
+        )
 
-        prompt = self._build_styled_prompt(product_name, brand_name, angle, has_white_bg=bool(white_bg_image_path), has_inspiration=bool(inspiration_images))
+    async def _generate_styled(
+        self,
+        product_name: str,
+        brand_name: str,
+        reference_parts: list[types.Part],
+        angle: dict,
+        aspect_ratio: str,
+        has_white_bg: bool,
+        has_inspiration: bool,
+    ) -> dict:
+        prompt = self._build_styled_prompt(product_name, brand_name, angle, has_white_bg=has_white_bg, has_inspiration=has_inspiration)
 
         content_parts = reference_parts + [types.Part.from_text(text=prompt)]
 
@@ -159,14 +195,14 @@ class ProductStudioService:
                         person_generation="ALLOW_ALL",
                     ),
                 )
-                response = self._client.models.generate_content(
+                response = await self._client.aio.models.generate_content(
                     model=model_name,
                     contents=[types.Content(role="user", parts=content_parts)],
                     config=config,
                 )
-                image_url = self._extract_and_save_image(response, f"styled-{angle['key']}-{uuid.uuid4().hex[:8]}")
+                image_url = await self._extract_and_save_image(response, f"styled-{angle['key']}-{uuid.uuid4().hex[:8]}")
                 if image_url:
-                    return {"style": angle["key"], "label": angle["label"], "image_url": image_url}
+                    return {"style": angle["key"], "label": angle["label"], "status": "success", "image_url": image_url}
                 logger.warning("Styled %s: %s returned no image", angle["key"], model_name)
             except Exception as e:
                 logger.warning("Styled %s: %s failed: %s", angle["key"], model_name, e)
@@ -174,10 +210,37 @@ class ProductStudioService:
 
         # Fallback
         fallback_url = await self._imagen_fallback(prompt, aspect_ratio, f"styled-{angle['key']}")
-        return {"style": angle["key"], "label": angle["label"], "image_url": fallback_url}
+        return {
+            "style": angle["key"],
+            "label": angle["label"],
+            "status": "success" if fallback_url else "error",
+            "image_url": fallback_url,
+        }
 
     # ─── Private Helpers ──────────────────────────────────────────
 
+    def _styled_reference_parts(self, white_bg_image_path: str | None, inspiration_images: list[str]) -> list[types.Part]:
+        """Load the white-bg product shot and up to 3 inspiration images as parts."""
+        reference_parts: list[types.Part] = []
+
+        # Add the white-bg image as the primary reference
+        if white_bg_image_path:
+            img_bytes = self._load_local_image(white_bg_image_path)
+            if img_bytes:
+                reference_parts.append(
+                    types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg")
+                )
+
+        # Add up to 3 inspiration images as style references
+        for insp_path in inspiration_images[:3]:
+            img_bytes = self._load_local_image(insp_path)
+            if img_bytes:
+                reference_parts.append(
+                    types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg")
+                )
+
+        return reference_parts
+
     def _load_local_image(self, url_path: str) -> bytes | None:
         """Load image bytes from a local uploads path."""
         if url_path.startswith("/uploads/"):
@@ -192,8 +255,8 @@ class ProductStudioService:
         logger.warning("Image not found: %s", file_path)
         return None
 
-    def _extract_and_save_image(self, response: types.GenerateContentResponse, prefix: str) -> str:
-        """Extract image from Gemini response and save to disk."""
+    async def _extract_and_save_image(self, response: types.GenerateContentResponse, prefix: str) -> str:
+        """Extract image from Gemini response and save to disk off the event loop."""
         if not response.candidates:
             return ""
         candidate = response.candidates[0]
@@ -203,7 +266,7 @@ class ProductStudioService:
             if hasattr(part, "inline_data") and part.inline_data:
                 image_bytes = part.inline_data.data
                 if image_bytes:
-                    return self._save_image(image_bytes, prefix)
+                    return await asyncio.to_thread(self._save_image, image_bytes, prefix)
         return ""
 
     def _save_image(self, image_bytes: bytes, prefix: str) -> str:
@@ -220,7 +283,7 @@ class ProductStudioService:
     async def _imagen_fallback(self, prompt: str, aspect_ratio: str, prefix: str) -> str:
         """Fallback to Imagen text-to-image."""
         try:
-            response = self._client.models.generate_images(
+            response = await self._client.aio.models.generate_images(
                 model="imagen-4.0-fast-generate-001",
                 prompt=prompt,
                 config=types.GenerateImagesConfig(number_of_images=1, aspect_ratio=aspect_ratio),
@@ -228,7 +291,7 @@ class ProductStudioService:
             if response.generated_images:
                 image = response.generated_images[0]
                 if hasattr(image, "image") and image.image and hasattr(image.image, "image_bytes") and image.image.image_bytes:
-                    return self._save_image(image.image.image_bytes, f"{prefix}-{uuid.uuid4().hex[:8]}")
+                    return await asyncio.to_thread(self._save_image, image.image.image_bytes, f"{prefix}-{uuid.uuid4().hex[:8]}")
         except Exception as e:
             logger.exception("Imagen fallback failed: %s", e)
         return ""
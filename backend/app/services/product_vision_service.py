@@ -168,13 +168,13 @@ class ProductVisionService:
                     packaging=data.get("colors", {}).get("packaging"),
                 ),
                 shape=data.get("shape", "unknown"),
-                materials=data.get("materials", []),
+                materials=data.get("materials", ()),
                 texture=data.get("texture"),
                 branding_text=data.get("branding_text", []),
                 logo_description=data.get("logo_description"),
                 size_category=data.get("size_category", "medium"),
                 proportions=data.get("proportions"),
-                distinctive_features=data.get("distinctive_features", []),
+                distinctive_features=data.get("distinctive_features", ()),
                 visual_description=data.get("visual_description", ""),
                 hero_angles=data.get("hero_angles", ["front", "45-degree"]),
                 prohibited_variations=data.get("prohibited_variations", []),
@@ -22,7 +22,7 @@ from app.models.production_bible import (
     CameraBody,
     CameraMovement,
     LightingBible,
-    RealismRules,
+    REALISM_RULES_DEFAULT,
     Platform,
     VideoStyle,
     Tone,
@@ -338,7 +338,7 @@ class ProductionBibleService:
                 user_input=user_prompt,
                 hook_strategy=data.get("hook_strategy", ""),
                 pain_point=data.get("pain_point", ""),
-                key_selling_points=data.get("key_selling_points", []),
+                key_selling_points=data.get("key_selling_points", ()),
                 emotional_journey=data.get("emotional_journey", ""),
                 cta_approach=data.get("cta_approach", ""),
                 unique_angle=data.get("unique_angle"),
@@ -354,7 +354,7 @@ class ProductionBibleService:
                 user_input=user_prompt,
                 hook_strategy="Open with product hero shot",
                 pain_point="Generic product need",
-                key_selling_points=["Quality", "Value", "Results"],
+                key_selling_points=("Quality", "Value", "Results"),
                 emotional_journey="Curiosity → Interest → Desire → Action",
                 cta_approach="Direct call to action",
             )
@@ -431,19 +431,17 @@ class ProductionBibleService:
                 )
 
         # Step 4: Set up lighting (based on tone)
-        lighting_bible = LightingBible()
+        lighting_overrides: dict = {}
         if tone == Tone.LUXURIOUS:
-            lighting_bible.mood = "warm_luxurious"
-            lighting_bible.color_temp_kelvin = 4500
+            lighting_overrides = {"mood": "warm_luxurious", "color_temp_kelvin": 4500}
         elif tone == Tone.CALM:
-            lighting_bible.mood = "soft_peaceful"
-            lighting_bible.key_intensity = "soft"
+            lighting_overrides = {"mood": "soft_peaceful", "key_intensity": "soft"}
         elif tone == Tone.EXCITED:
-            lighting_bible.mood = "bright_energetic"
-            lighting_bible.color_temp_kelvin = 5600
+            lighting_overrides = {"mood": "bright_energetic", "color_temp_kelvin": 5600}
+        lighting_bible = LightingBible(**lighting_overrides)
 
-        # Step 5: Realism rules (always strict)
-        realism_rules = RealismRules()
+        # Step 5: Realism rules (always strict, shared singleton)
+        realism_rules = REALISM_RULES_DEFAULT
 
         # Step 6: Assemble the bible
         bible = ProductionBible(
@@ -456,9 +454,6 @@ class ProductionBibleService:
             realism_rules=realism_rules,
         )
 
-        # Step 7: Generate the master prompt
-        bible.assemble_master_prompt()
-
         logger.info("Production Bible assembled successfully")
         return bible
 
@@ -1,6 +1,8 @@
 """Video generation service using Veo 3.1 with reference image support."""
 
+import asyncio
 import logging
+import math
 import time
 import uuid
 from pathlib import Path
@@ -22,6 +24,11 @@ VEO_MODELS = {
     "veo-2.0": "veo-2.0-generate-001",
 }
 
+# Veo extension limits: 8 s base clip, ~7 s per extension, at most 20 extensions
+BASE_CLIP_SECONDS = 8
+EXTENSION_SECONDS = 7
+MAX_EXTENSIONS = 20
+
 
 class VideoService:
     """Generates video clips using Veo 3.1 with reference image support."""
@@ -188,7 +195,7 @@ class VideoService:
             config_kwargs["person_generation"] = "allow_all"
 
         try:
-            operation = self._client.models.generate_videos(
+            operation = await self._client.aio.models.generate_videos(
                 model=model_name,
                 prompt=prompt,
                 config=types.GenerateVideosConfig(**config_kwargs),
@@ -214,8 +221,8 @@ class VideoService:
                     }
 
                 logger.info(f"   Processing... ({int(elapsed)}s elapsed)")
-                time.sleep(poll_interval)
-                operation = self._client.operations.get(operation)
+                await asyncio.sleep(poll_interval)
+                operation = await self._client.aio.operations.get(operation)
 
             # Check result
             if operation.result and operation.result.generated_videos:
@@ -405,7 +412,7 @@ class VideoService:
         )
 
         try:
-            operation = self._client.models.generate_videos(
+            operation = await self._client.aio.models.generate_videos(
                 model="veo-3.1-generate-preview",
                 prompt=prompt,
                 video=video_uri,
@@ -437,8 +444,8 @@ class VideoService:
                     }
 
                 logger.info("  Extension processing... (%ds elapsed)", int(elapsed))
-                time.sleep(poll_interval)
-                operation = self._client.operations.get(operation)
+                await asyncio.sleep(poll_interval)
+                operation = await self._client.aio.operations.get(operation)
 
             # Extract result
             if operation.result and operation.result.generated_videos:
@@ -480,6 +487,55 @@ class VideoService:
                 "error": str(e),
             }
 
+    async def extend_video_to_duration(
+        self,
+        video_uri: str,
+        prompt: str,
+        target_seconds: float,
+        scene_number: int = 1,
+    ) -> dict:
+        """Extend a Veo-generated video until it covers ``target_seconds``.
+
+        Veo has no target-duration option, so this chains ``extend_video``
+        calls, each continuing from the previous output, and stops at the
+        first failed extension.
+
+        Returns:
+            Dict with video_url, original_uri, status, scene_number and
+            total_extensions. Status is "failed" only if no extension succeeded.
+        """
+        num_ext = min(math.ceil((target_seconds - BASE_CLIP_SECONDS) / EXTENSION_SECONDS), MAX_EXTENSIONS)
+        result: dict = {
+            "scene_number": scene_number,
+            "video_url": "",
+            "original_uri": video_uri,
+            "status": "failed",
+            "total_extensions": 0,
+        }
+
+        for ext_num in range(1, num_ext + 1):
+            extended = await self.extend_video(
+                video_uri=result["original_uri"],
+                prompt=prompt,
+                scene_number=scene_number,
+                extension_number=ext_num,
+            )
+            if extended.get("status") != "completed":
+                logger.warning("Extension %d failed for scene %d, stopping", ext_num, scene_number)
+                break
+            result.update(
+                video_url=extended.get("video_url", ""),
+                original_uri=extended.get("original_uri", result["original_uri"]),
+                status="completed",
+                total_extensions=ext_num,
+            )
+            logger.info(
+                "Scene %d extended to ~%ds",
+                scene_number, BASE_CLIP_SECONDS + ext_num * EXTENSION_SECONDS,
+            )
+
+        return result
+
     @staticmethod
     def _mock_video(scene_number: int = 1, clip_number: int = 1) -> dict:
         return {
@@ -6,6 +6,7 @@ from app.tasks.celery_app import celery_app
 from app.models.schemas import GenerationRequest
 from app.pipelines.video_pipeline import VideoPipeline
 from app.config import settings
+from app.utils.http_client import close_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -38,4 +39,5 @@ def run_video_pipeline(self: Any, job_id: str, request_data: dict[str, Any]) ->
         logger.exception("Celery task failed for job %s", job_id)
         raise self.retry(exc=exc, countdown=10)
     finally:
+        loop.run_until_complete(close_http_client())
         loop.close()
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# One client per event loop: pipelines also run in their own loops (background
+# threads, Celery tasks), and an httpx client can't be shared across loops
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client for the running loop, creating it if needed.
+
+    Uses HTTP/2 when the h2 package is installed so concurrent requests to
+    one host share a single connection.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None:
+        client = _http_clients[loop] = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=httpx.Timeout(300.0, connect=10.0),
+        )
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's HTTP client and its connection pool."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,57 @@
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class JobArchive:
+    """Embedded sqlite store for finished in-memory jobs, keyed by job id.
+
+    Records are orjson-encoded dicts. The connection is opened lazily and
+    shared across threads, so writes can be pushed to asyncio.to_thread.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+        return self._conn
+
+    def put(self, job_id: str, record: dict[str, Any]) -> None:
+        data = orjson.dumps(record)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO jobs (job_id, data) VALUES (?, ?)", (job_id, data))
+            conn.commit()
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._connect().execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def recent(self, limit: int) -> list[dict[str, Any]]:
+        """Return up to ``limit`` records, most recently archived first."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT data FROM jobs ORDER BY rowid DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [orjson.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
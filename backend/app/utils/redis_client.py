@@ -1,11 +1,12 @@
 import asyncio
-import json
 import logging
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import redis.asyncio as aioredis
 import httpx
+import orjson
+from pydantic_core import to_json
 
 from app.config import settings
 
@@ -43,20 +44,27 @@ def _channel_name(job_id: str) -> str:
     return f"job:{job_id}:progress"
 
 
+def avatar_key(avatar_id: str) -> str:
+    """Redis key holding a user-created avatar's JSON record."""
+    return f"avatar:{avatar_id}"
+
+
 async def publish_progress(job_id: str, data: dict[str, Any]) -> None:
     """Publish a progress event for a job via Redis pub/sub and update frontend database."""
     r = await get_redis()
     channel = _channel_name(job_id)
-    payload = json.dumps(data)
-    await r.publish(channel, payload)
-    # Also persist latest state in a hash for poll-based access
-    await r.hset(f"job:{job_id}", mapping={
-        "status": data.get("status", "unknown"),
-        "current_step": data.get("current_step", ""),
-        "progress": str(data.get("progress", 0)),
-        "message": data.get("message", ""),
-        "data": json.dumps(data.get("data") or {}),
-    })
+    payload = to_json(data)
+    # Publish and persist the latest state (for poll-based access) in one round-trip
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.publish(channel, payload)
+        pipe.hset(f"job:{job_id}", mapping={
+            "status": data.get("status", "unknown"),
+            "current_step": data.get("current_step", ""),
+            "progress": str(data.get("progress", 0)),
+            "message": data.get("message", ""),
+            "data": to_json(data.get("data") or {}),
+        })
+        await pipe.execute()
 
     # Update frontend PostgreSQL database via webhook
     frontend_url = settings.FRONTEND_URL or "http://localhost:3000"
@@ -64,13 +72,14 @@ async def publish_progress(job_id: str, data: dict[str, Any]) -> None:
         async with httpx.AsyncClient(timeout=5.0) as client:
             await client.patch(
                 f"{frontend_url}/api/jobs/{job_id}/progress",
-                json={
+                content=to_json({
                     "status": data.get("status"),
                     "currentStep": data.get("current_step"),
                     "progress": data.get("progress"),
                     "message": data.get("message"),
                     "data": data.get("data"),
-                },
+                }),
+                headers={"content-type": "application/json"},
             )
         logger.debug(f"Updated frontend database for job {job_id}")
     except Exception as e:
@@ -89,10 +98,29 @@ async def get_job_state(job_id: str) -> dict[str, Any] | None:
         "current_step": raw.get("current_step", ""),
         "progress": int(raw.get("progress", 0)),
         "message": raw.get("message", ""),
-        "data": json.loads(raw.get("data", "{}")),
+        "data": orjson.loads(raw.get("data", "{}")),
     }
 
 
+async def _iter_channel(
+    pubsub: aioredis.client.PubSub,
+    done_statuses: tuple[str, ...],
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Yield decoded messages from a subscribed pubsub until a terminal status."""
+    while True:
+        message = await pubsub.get_message(
+            ignore_subscribe_messages=True,
+            timeout=1.0,
+        )
+        if message is not None and message["type"] == "message":
+            data = orjson.loads(message["data"])
+            yield data
+            if data.get("status") in done_statuses:
+                break
+        else:
+            await asyncio.sleep(0.1)
+
+
 async def subscribe_progress(job_id: str) -> AsyncGenerator[dict[str, Any], None]:
     """Async generator that yields progress events for a job via pub/sub."""
     r = await get_redis()
@@ -100,18 +128,68 @@ async def subscribe_progress(job_id: str) -> AsyncGenerator[dict[str, Any], None
     channel = _channel_name(job_id)
     await pubsub.subscribe(channel)
     try:
-        while True:
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=1.0,
-            )
-            if message is not None and message["type"] == "message":
-                data = json.loads(message["data"])
-                yield data
-                if data.get("status") in ("completed", "failed", "cancelled"):
-                    break
-            else:
-                await asyncio.sleep(0.1)
+        async for data in _iter_channel(pubsub, ("completed", "failed", "cancelled")):
+            yield data
+    finally:
+        await pubsub.unsubscribe(channel)
+        await pubsub.aclose()
+
+
+# ── Editor compile jobs ──────────────────────────────────────────────────────
+
+_COMPILE_DONE_STATUSES = ("complete", "error")
+COMPILE_STATE_TTL_SEC = 24 * 3600
+
+
+def _compile_key(job_id: str) -> str:
+    # Not "compile:{id}": that name held a hash before state became a JSON string
+    return f"compile_state:{job_id}"
+
+
+def _compile_channel_name(job_id: str) -> str:
+    return f"compile-progress:{job_id}"
+
+
+async def set_compile_state(job_id: str, state: dict[str, Any]) -> None:
+    """Store a compile job's state as one JSON blob and push it to stream subscribers.
+
+    The same payload is written and published in a single round-trip; the
+    stored state expires COMPILE_STATE_TTL_SEC after its last update.
+    """
+    r = await get_redis()
+    payload = orjson.dumps(state)
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.set(_compile_key(job_id), payload, ex=COMPILE_STATE_TTL_SEC)
+        pipe.publish(_compile_channel_name(job_id), payload)
+        await pipe.execute()
+
+
+async def get_compile_state(job_id: str) -> dict[str, Any] | None:
+    """Retrieve the latest persisted compile job state from Redis."""
+    r = await get_redis()
+    raw = await r.get(_compile_key(job_id))
+    return orjson.loads(raw) if raw else None
+
+
+async def subscribe_compile_progress(job_id: str) -> AsyncGenerator[dict[str, Any], None]:
+    """Async generator yielding a compile job's current state, then each update.
+
+    Subscribes before reading the stored state so an update landing in
+    between isn't missed; stops after the job completes or fails.
+    """
+    r = await get_redis()
+    pubsub = r.pubsub()
+    channel = _compile_channel_name(job_id)
+    await pubsub.subscribe(channel)
+    try:
+        state = await get_compile_state(job_id)
+        if state is None:
+            return
+        yield state
+        if state.get("status") in _COMPILE_DONE_STATUSES:
+            return
+        async for data in _iter_channel(pubsub, _COMPILE_DONE_STATUSES):
+            yield data
     finally:
         await pubsub.unsubscribe(channel)
         await pubsub.aclose()
@@ -0,0 +1,22 @@
+import asyncio
+import shutil
+from pathlib import Path
+
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+async def save_upload(file: UploadFile, dest: Path) -> int:
+    """Stream an uploaded file to ``dest`` in chunks and return its size in bytes.
+
+    Copies from the request's spooled file in a worker thread, so the body is
+    never held in memory as one blob.
+    """
+    def _copy() -> int:
+        file.file.seek(0)
+        with open(dest, "wb") as out:
+            shutil.copyfileobj(file.file, out, UPLOAD_CHUNK_SIZE)
+            return out.tell()
+
+    return await asyncio.to_thread(_copy)
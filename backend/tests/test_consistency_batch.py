@@ -0,0 +1,55 @@
+"""Tests for batched character consistency scoring."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.pipelines import video_pipeline
+from app.pipelines.video_pipeline import VideoPipeline
+from app.services.consistency_service import ConsistencyService
+
+
+class _FlakyBatchModels:
+    """Fake async Gemini models: the batched call fails, per-image calls are slow."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_content(self, **kwargs) -> SimpleNamespace:
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("batch rejected")
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return SimpleNamespace(text='{"face_similarity": 0.9}')
+
+
+@pytest.mark.asyncio
+async def test_batch_fallback_scores_images_concurrently() -> None:
+    """A failed batch call falls back to per-image scoring without serializing."""
+    models = _FlakyBatchModels()
+    service = ConsistencyService(api_key="test")
+    service._client = SimpleNamespace(aio=SimpleNamespace(models=models))
+
+    results = await service.score_character_consistency_batch([b"a", b"b", b"c"], [b"ref"])
+
+    assert len(results) == 3
+    assert models.calls == 4
+    assert models.peak == 3
+
+
+def test_score_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The pipeline's score cache stays within SCORE_CACHE_SIZE, keeping recent hits."""
+    monkeypatch.setattr(video_pipeline, "SCORE_CACHE_SIZE", 2)
+    pipeline = VideoPipeline()
+
+    pipeline._cache_score("a", {"score": 1})
+    pipeline._cache_score("b", {"score": 2})
+    assert pipeline._cached_score("a") == {"score": 1}
+    pipeline._cache_score("c", {"score": 3})
+
+    assert list(pipeline._score_cache) == ["a", "c"]
@@ -0,0 +1,34 @@
+"""Tests for the sqlite job archive."""
+from pathlib import Path
+
+from app.utils.job_archive import JobArchive
+
+
+def test_put_and_get_round_trip(tmp_path: Path) -> None:
+    """An archived record reads back unchanged."""
+    archive = JobArchive(str(tmp_path / "jobs.sqlite3"))
+    record = {"job_id": "abc", "status": "completed", "results": [{"status": "success"}, None]}
+
+    archive.put("abc", record)
+
+    assert archive.get("abc") == record
+    archive.close()
+
+
+def test_get_missing_job_returns_none(tmp_path: Path) -> None:
+    """Unknown job ids are a miss, not an error."""
+    archive = JobArchive(str(tmp_path / "nested" / "jobs.sqlite3"))
+
+    assert archive.get("missing") is None
+    archive.close()
+
+
+def test_recent_returns_newest_first(tmp_path: Path) -> None:
+    """recent() lists the latest archived records first, re-archives included."""
+    archive = JobArchive(str(tmp_path / "jobs.sqlite3"))
+    for job_id in ("a", "b", "c"):
+        archive.put(job_id, {"job_id": job_id})
+    archive.put("a", {"job_id": "a"})
+
+    assert [r["job_id"] for r in archive.recent(2)] == ["a", "c"]
+    archive.close()
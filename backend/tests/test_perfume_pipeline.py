@@ -0,0 +1,79 @@
+"""Tests for the perfume batch generation pipeline."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.schemas import PerfumePipelineConfig
+from app.pipelines.perfume_pipeline import PerfumePipeline, get_job
+from app.services.perfume_image_service import PerfumeImageService
+
+
+class _SlowImagenModels:
+    """Fake async Gemini models that record how many calls are in flight."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_images(self, **kwargs) -> SimpleNamespace:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        return SimpleNamespace(generated_images=[])
+
+
+async def _wait_until_done(job_id: str) -> None:
+    for _ in range(500):
+        if get_job(job_id).status not in ("running", "paused"):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+@pytest.mark.asyncio
+async def test_batch_products_generate_concurrently() -> None:
+    """Products in a batch overlap up to max_concurrency instead of running one by one."""
+    models = _SlowImagenModels()
+    pipeline = PerfumePipeline(api_key="test")
+    pipeline._service = PerfumeImageService(api_key="test")
+    pipeline._service._client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    products = [{"perfume_name": f"Scent {i}", "gender": "unisex"} for i in range(3)]
+
+    job_id = await pipeline.start_batch(
+        products=products,
+        reference_images=[],
+        config=PerfumePipelineConfig(images_per_product=4, max_concurrency=3),
+    )
+    await _wait_until_done(job_id)
+
+    job = get_job(job_id)
+    assert job.status == "completed"
+    assert len(job.results) == 3
+    assert models.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_malformed_product_is_recorded_as_error() -> None:
+    """A product that fails validation errors on its own; the job still completes."""
+    pipeline = PerfumePipeline(api_key="test")
+    pipeline._service = PerfumeImageService(api_key="test")
+    pipeline._service._client = SimpleNamespace(aio=SimpleNamespace(models=_SlowImagenModels()))
+    products = [
+        {"perfume_name": "Good", "gender": "unisex"},
+        {"perfume_name": "Bad gender", "gender": ["male"]},
+        {"perfume_name": "Bad notes", "notes": "citrus"},
+    ]
+
+    job_id = await pipeline.start_batch(
+        products=products,
+        reference_images=[],
+        config=PerfumePipelineConfig(images_per_product=4),
+    )
+    await _wait_until_done(job_id)
+
+    job = get_job(job_id)
+    assert job.status == "completed"
+    statuses = {r["perfume_name"]: r["status"] for r in job.results}
+    assert statuses == {"Good": "success", "Bad gender": "error", "Bad notes": "error"}
@@ -0,0 +1,78 @@
+"""Tests for the Production Bible model."""
+import pytest
+
+from app.models.product_dna import ProductColors, ProductDNA
+from app.models.production_bible import (
+    REALISM_RULES_DEFAULT,
+    CreativeBrief,
+    Platform,
+    ProductionBible,
+    StyleConfig,
+)
+from app.models.schemas import AvatarDNA
+
+
+@pytest.fixture
+def bible() -> ProductionBible:
+    """Build a bible with an avatar and a non-English style config."""
+    product_dna = ProductDNA(
+        product_type="perfume",
+        product_name="Noir",
+        colors=ProductColors(primary="black", secondary="gold"),
+        shape="bottle",
+        materials=["glass", "metal"],
+        visual_description="A black glass bottle with a gold cap",
+        distinctive_features=["faceted cap"],
+    )
+    return ProductionBible(
+        product_dna=product_dna,
+        avatar_dna=AvatarDNA(gender="female", face="oval", prohibited_drift="no drift"),
+        style_config=StyleConfig(platform=Platform.TIKTOK, language="hi"),
+        creative_brief=CreativeBrief(
+            user_input="Show off the new perfume",
+            hook_strategy="Spray in slow motion",
+            pain_point="Scents that fade",
+            key_selling_points=["Long lasting", "Affordable"],
+            emotional_journey="Curious to confident",
+            cta_approach="Link in bio",
+        ),
+    )
+
+
+class TestProductionBible:
+    """Tests for ProductionBible."""
+
+    def test_master_prompt_sections(self, bible: ProductionBible) -> None:
+        """Test that the master prompt renders every section in order."""
+        prompt = bible.master_prompt
+
+        assert prompt.startswith("=" * 60 + "\nPRODUCTION BIBLE - IMMUTABLE REFERENCE\n")
+        assert prompt.endswith("\n" + "=" * 60)
+        assert "Materials: glass, metal\n" in prompt
+        assert "- Gender: female (LOCKED)\n" in prompt
+        assert "- Ethnicity: as shown in reference (LOCKED)\n" in prompt
+        assert "Platform: tiktok\n" in prompt
+        assert "ALL dialogue MUST be written in Hindi (Devanagari script).\n" in prompt
+        assert prompt.index("## STYLE GUIDE") < prompt.index("## CAMERA LANGUAGE") < prompt.index("## REALISM")
+
+    def test_bible_is_frozen(self, bible: ProductionBible) -> None:
+        """Test that the bible cannot be mutated after assembly."""
+        with pytest.raises(Exception):
+            bible.realism_rules = None
+
+    def test_master_prompt_not_serialized(self, bible: ProductionBible) -> None:
+        """Test that the derived prompt stays out of dumps but is accepted on input."""
+        data = bible.model_dump()
+        assert "master_prompt" not in data
+
+        data["master_prompt"] = "stale"
+        assert ProductionBible.model_validate(data).master_prompt == bible.master_prompt
+
+    def test_cache_bytes_round_trip(self, bible: ProductionBible) -> None:
+        """Test that cached bytes rebuild an equivalent bible without validation."""
+        restored = ProductionBible.from_cache_bytes(bible.to_cache_bytes())
+
+        assert restored == bible
+        assert restored.style_config.platform is Platform.TIKTOK
+        assert restored.realism_rules is REALISM_RULES_DEFAULT
+        assert restored.master_prompt == bible.master_prompt
@@ -0,0 +1,26 @@
+"""Tests for the video pipeline's throttled progress publishing."""
+import pytest
+
+from app.pipelines import video_pipeline
+from app.pipelines.video_pipeline import VideoPipeline
+
+
+@pytest.mark.asyncio
+async def test_finishing_a_job_flushes_and_drops_throttle_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The held-back update is still sent, and no per-job entries outlive the job."""
+    sent: list[str] = []
+
+    async def fake_publish(job_id: str, payload: dict) -> None:
+        sent.append(payload["message"])
+
+    monkeypatch.setattr(video_pipeline, "publish_progress", fake_publish)
+    pipeline = VideoPipeline()
+
+    await pipeline._publish_throttled("job-1", "video_generation", 10, "first")
+    await pipeline._publish_throttled("job-1", "video_generation", 20, "second")
+    await pipeline._finish_publishing("job-1")
+
+    assert sent == ["first", "second"]
+    assert pipeline._last_publish == {}
+    assert pipeline._pending_publish == {}
+    assert pipeline._publish_flushers == {}
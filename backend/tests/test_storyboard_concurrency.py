@@ -0,0 +1,54 @@
+"""Tests that concurrent storyboard regenerations overlap instead of serializing."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.schemas import Script, ScriptScene
+from app.pipelines.video_pipeline import CONSISTENCY_CONCURRENCY
+from app.services.image_service import ImageService
+
+
+class _SlowImageModels:
+    """Fake async Gemini models that record how many calls are in flight."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_images(self, **kwargs) -> SimpleNamespace:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return SimpleNamespace(generated_images=[])
+
+
+def _single_scene_script(scene_number: int) -> Script:
+    scene = ScriptScene(
+        scene_number=scene_number,
+        location="bedroom",
+        description="Holds up the bottle",
+        dialogue="Look at this",
+        word_count=3,
+        duration_seconds=8,
+    )
+    return Script(title="Test", scenes=[scene], total_duration=8)
+
+
+@pytest.mark.asyncio
+async def test_scene_regenerations_overlap() -> None:
+    """Per-scene regens gathered under the pipeline's semaphore run concurrently."""
+    models = _SlowImageModels()
+    service = ImageService(api_key="test")
+    service._client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    sem = asyncio.Semaphore(CONSISTENCY_CONCURRENCY)
+
+    async def regen(scene_number: int) -> list[dict[str, str]]:
+        async with sem:
+            return await service.generate_storyboard(script=_single_scene_script(scene_number))
+
+    results = await asyncio.gather(*(regen(n) for n in range(1, CONSISTENCY_CONCURRENCY + 1)))
+
+    assert [r[0]["scene_number"] for r in results] == ["1", "2", "3", "4"]
+    assert models.peak == CONSISTENCY_CONCURRENCY